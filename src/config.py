@@ -136,6 +136,13 @@ def _int_env(name: str, default: int, *, minimum: int = 0) -> int:
 # plays. Redis 8 stores the same payload in ~424 bytes; measure on your major.
 HISTORY_OUTBOX_MAX: int = _int_env("HISTORY_OUTBOX_MAX", 0)
 
+# Gapless playback: how many 20 ms Opus packets the prefetched next song reads
+# ahead of its vc.play() (50 = 1 s). The buffer hides ffmpeg's startup, and a song
+# that is buffered by the time the current one ends starts straight from the
+# after-callback wake-up, with the ended song's Redis bookkeeping moved behind it.
+# 0 turns both off and restores the strictly sequential hand-over.
+GAPLESS_PRIME_FRAMES: int = _int_env("GAPLESS_PRIME_FRAMES", 50)
+
 # asyncpg's prepared-statement cache size, per connection; the default matches
 # asyncpg's own. Set 0 behind PgBouncer in transaction-pooling mode: prepared
 # statements are per-connection state and each transaction gets a different
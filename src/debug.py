@@ -39,7 +39,12 @@ from src.config import (
 )
 from src.dashboard import run_live_dashboard
 from src.ping import bot_version, collect_versions
-from src.redis_client import GuildRedisStore, outbox_depth, read_guild_configs
+from src.redis_client import (
+    GuildRedisStore,
+    local_cache_stats,
+    outbox_depth,
+    read_guild_configs,
+)
 from src.util import (
     FOOTER_LIMIT,
     cancel_task,
@@ -839,6 +844,17 @@ def pool_state() -> "PoolState":
     return ytdlp_pool.state
 
 
+def failure_counts() -> list[tuple[str, int]]:
+    # Per call for the same reason: a test patches the counts src.youtube owns.
+    from src.youtube import extraction_failures
+
+    return extraction_failures()
+
+
+def _fmt_secs(value: Optional[float]) -> str:
+    return "–" if value is None else f"{value:.1f}s"
+
+
 def runtime_lines(
     *,
     cpu: Optional[float] = None,
@@ -877,8 +893,55 @@ def runtime_lines(
     lines.append(f"loop         {count} loop tasks{lag}")
     state = pool_state()
     spawned = "spawned" if state.spawned else "not spawned"
-    healed = f" · {state.generation} generations" if state.generation > 1 else ""
-    lines.append(f"yt-dlp pool  {state.max_workers} workers · {spawned}{healed}")
+    # Recycled executors are planned, so only the remainder of the rebuilds are heals.
+    heals = state.generation - state.recycled - 1
+    healed = f" · healed {heals}×" if heals > 0 else ""
+    busy = (
+        f" · {state.running} running · {state.queued} queued"
+        if state.running or state.queued
+        else ""
+    )
+    workers = (
+        f"{state.capacity}/{state.max_workers}"
+        if state.min_workers < state.max_workers
+        else f"{state.max_workers}"
+    )
+    recycled = f" · {state.recycled} recycled" if state.recycled else ""
+    if state.service:
+        # The workers, their lanes and their stats are the service's; this process
+        # knows only what it has sent there.
+        running = f" · {state.running} running" if state.running else ""
+        lines.append(f"yt-dlp pool  service {state.service}{running}")
+    else:
+        lines.append(
+            f"yt-dlp pool  {workers} workers · {spawned}{healed}{recycled}{busy}"
+        )
+    stats = state.stats
+    if stats.jobs:
+        # Wait against run is the row's point: a slow wait with a normal run is a
+        # pool too small, a slow run is YouTube (or the network) being slow.
+        lines.append(
+            f"pool jobs    {stats.completed} ok · {stats.failed} failed · "
+            f"{stats.aborted} aborted · wait p50 {_fmt_secs(stats.wait_p50)} "
+            f"p95 {_fmt_secs(stats.wait_p95)} · run p50 {_fmt_secs(stats.run_p50)} "
+            f"p95 {_fmt_secs(stats.run_p95)}"
+        )
+    failures = failure_counts()
+    if failures:
+        shown = " · ".join(f"{kind} {count}" for kind, count in failures[:3])
+        more = " · …" if len(failures) > 3 else ""
+        lines.append(f"pool errors  {shown}{more}")
+    if state.guilds:
+        # Busiest first, so the guild crowding the others out is the one shown.
+        shown = " · ".join(
+            f"{load.guild_id if load.guild_id is not None else 'other'} "
+            f"{load.running}+{load.queued}"
+            for load in state.guilds[:3]
+        )
+        more = " · …" if len(state.guilds) > 3 else ""
+        lines.append(
+            f"pool guilds  ≤{state.guild_share} each · running+queued {shown}{more}"
+        )
     return lines
 
 
@@ -1154,6 +1217,15 @@ def redis_lines(
     lines.append(
         f"cache        hit rate {rate} · evicted {info.get('evicted_keys', '?')}"
     )
+    # This process's own tier in front of Redis (redis_client._LocalCache): its
+    # hits never reach keyspace_hits above, so it gets its own row.
+    local = [
+        f"{stats.prefix} {stats.hit_ratio * 100:.0f}% of {stats.hits + stats.misses}"
+        for stats in local_cache_stats()
+        if stats.hit_ratio is not None
+    ]
+    if local:
+        lines.append(f"local        {' · '.join(local)}")
     return lines
 
 
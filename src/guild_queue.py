@@ -35,13 +35,15 @@ See docs/ARCHITECTURE.md#queue-invariant.
 # atomic LPOP+HSET dispatches, so a -clear landing in that tick pops an entry the clear
 # already deleted: memory and Redis drift by one until the next rebuild, and a crash
 # inside the drift restores the queue one song out of alignment. Accepted. Cheapest fix:
-# hold the mutex across the store dispatch, costing one ~1ms round-trip.
+# hold the mutex across the store dispatch, costing one ~1ms round-trip — which the
+# gapless hand-over already does (try_commit_dequeue's `then`), since its start
+# transaction would otherwise trail the commit by a song end's worth of awaits.
 
 import asyncio
 import random
 import re
 from collections import deque
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from itertools import islice
 from enum import Enum, StrEnum, auto
@@ -491,6 +493,11 @@ class GuildQueue:
     def peek_next(self) -> Optional[QueueItem]:
         return self._items[0] if self._items else None
 
+    def upcoming(self, n: int) -> list[QueueItem]:
+        """The next `n` pending items in play order. Claimed items are not among
+        them: whoever claimed one is already resolving it."""
+        return list(islice(self._items, self._cursor, self._cursor + n))
+
     def has_resume_tail(self, webpage_url: str) -> bool:
         """True when the queue already carries the resume tail an interjection
         left behind for `webpage_url`. That entry and the live song are the SAME
@@ -576,7 +583,9 @@ class GuildQueue:
                 return
             await self.redis_pop_for(item, persisted=persisted)
 
-    async def try_commit_dequeue(self, generation: int) -> bool:
+    async def try_commit_dequeue(
+        self, generation: int, *, then: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> bool:
         """Settle the claim for a song about to play, under the bulk-mutation lock
         so the check cannot race a clear()/shuffle(). False means the queue was
         cleared during the resolve and the caller discards the song; its FFmpeg
@@ -588,11 +597,20 @@ class GuildQueue:
         committing settles that instead — playing, and re-recording, the cleared
         one. And _resolve_source() replaces a YTSource with the QueueObject it
         resolved to, so head and item are legitimately different objects for one
-        slot."""
+        slot.
+
+        `then` runs after a successful commit, still under the lock: a caller whose
+        mirror write (the start transaction's LPOP) must land before any bulk
+        mutation can rebuild the mirror from memory. It must settle the mirror
+        itself, raise or not."""
         async with self._mutex:
             if generation != self._generation:
                 return False
-            return self.try_release()
+            if not self.try_release():
+                return False
+            if then is not None:
+                await then()
+            return True
 
     async def redis_pop_for(
         self, item: Optional[QueueItem], *, persisted: Optional[bool] = None
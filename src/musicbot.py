@@ -61,6 +61,7 @@ from src.spotify import (
     SpotifyRequestError,
 )
 from src.youtube import YTDL, ExtractionError, QueueObject
+from src.ytdlp_pool import ExtractPriority
 from contextvars import Token
 
 from opentelemetry import context as otel_context
@@ -70,6 +71,7 @@ from opentelemetry.trace import Span, StatusCode
 
 from src.ping import run_health_dashboard, send_latency_line
 from src.recovery import VoiceWatchdog, restore_guild
+from src.stream_refresher import StreamRefresher
 from src.telemetry import get_tracer
 from src.util import (
     EMBED_FIELD_LIMIT,
@@ -416,6 +418,17 @@ class MusicBot(commands.Cog):
         # MusicPlayer read this attribute directly. Named debug_settings, not debug:
         # MusicBot.debug is the -debug command and an attribute would shadow it.
         self.debug_settings = debug_mode.DebugSettings()
+        # Keeps the next songs' stream URLs cached across every guild; started by
+        # cog_load. None without Redis, where there is no cache to keep.
+        self.stream_refresher: Optional[StreamRefresher] = (
+            StreamRefresher(self.redis, self._upcoming_songs)
+            if self.redis is not None
+            else None
+        )
+
+    def _upcoming_songs(self, n: int) -> list[QueueObject]:
+        """The next `n` pending QueueObjects of every guild's queue."""
+        return [qo for mp in list(self.mps.values()) for qo in mp.upcoming_songs(n)]
 
     async def cog_load(self) -> None:
         """Kick off Spotify credential validation without blocking startup.
@@ -426,6 +439,8 @@ class MusicBot(commands.Cog):
         # reason. The hydration re-syncs it once the stored choices land.
         self.debug_settings.sync_sampler()
         spawn_background(self._hydrate_debug(), self._restore_tasks)
+        if self.stream_refresher is not None:
+            self.stream_refresher.start()
         if self.spotify is None:
             return
         spawn_background(self._validate_spotify_credentials(), self._restore_tasks)
@@ -456,6 +471,8 @@ class MusicBot(commands.Cog):
             ("runtime sampler", self.debug_settings.aclose),
             ("prometheus session", debug_mode.close_prometheus_session),
         ]
+        if self.stream_refresher is not None:
+            steps.append(("stream refresher", self.stream_refresher.stop))
         if spotify is not None:
             steps.append(("spotify session", spotify.aclose))
         for name, step in steps:
@@ -900,6 +917,9 @@ class MusicBot(commands.Cog):
                 enqueue(tracks, prefetch=False),
                 ctx.message.add_reaction("👍"),
             )
+            # Resolved already, so the songs about to play can have their stream
+            # URLs minted now — one batched job rather than N prefetches.
+            mp.warm_streams(tracks)
 
     @_tracer.start_as_current_span("bot.enqueue_single")
     async def _enqueue_single(
@@ -1203,6 +1223,8 @@ class MusicBot(commands.Cog):
                 query_source=query_source_of(source),
                 analytics=analytics,
                 user_input=origin,
+                # The interjection waits on this, unlike -play's queued expansion.
+                priority=ExtractPriority.INTERACTIVE,
             )
             # Indexed here too: -playnow on a link copied mid-playlist should
             # interject the track the user was looking at, not the playlist's
@@ -1312,7 +1334,9 @@ class MusicBot(commands.Cog):
         # seconds of yt-dlp dead air between the interrupt and the new song. Awaited,
         # not spawned — the current song plays through the wait. No-op without Redis;
         # also back-fills duration/thumbnail for the embeds below.
-        await YTDL.prefetch_stream(qobj, redis=self.redis)
+        await YTDL.prefetch_stream(
+            qobj, redis=self.redis, priority=ExtractPriority.INTERACTIVE
+        )
 
         if require_paused and not vc.is_paused():
             # Resumed during the resolve — the reason to interject is gone, so
@@ -2192,9 +2216,10 @@ class MusicBot(commands.Cog):
         usage="<0-100>",
         help=(
             "Sets playback volume as a percentage between 0 and 100.\n\n"
-            "The new level takes effect on the **next** song, not the one "
-            "currently playing. It is saved per server, so it still applies "
-            "after a restart."
+            "The new level usually applies to the song that is playing right "
+            "away; a song the bot has to re-encode keeps its level until the "
+            "next one, and the reply says so. It is saved per server, so it "
+            "still applies after a restart."
         ),
         extras={"category": "Playback", "examples": ["-volume 50", "-vol 100"]},
     )
@@ -2221,6 +2246,7 @@ class MusicBot(commands.Cog):
                 return
             mp = self.get_mp(ctx)
             mp.volume = volume_pct / 100
+            live = await mp.apply_volume()
             persisted = False
             if mp.store is not None:
                 persisted = await mp.store.set_volume(mp.volume)
@@ -2233,10 +2259,12 @@ class MusicBot(commands.Cog):
                 else "⚠️ It could not be saved (Redis is unavailable), so it "
                 "applies until the bot restarts."
             )
+            # Not live for a transcoded song, or on a host without libopus: ffmpeg
+            # carries its level (see MusicPlayer.apply_volume).
+            timing = "" if live else " (takes effect on next song)"
             await ctx.send(
                 embed=notice_embed(
-                    f"Set volume to {volume_pct}% (takes effect on next song). "
-                    + durability,
+                    f"Set volume to {volume_pct}%{timing}. " + durability,
                     discord.Color.blue(),
                 )
             )
@@ -2493,8 +2521,29 @@ class MusicBot(commands.Cog):
         # bot.guilds is empty until READY, so cog_load's pass covers an extension
         # reload and this one covers a cold start. Both are needed.
         spawn_background(self._hydrate_debug(), self._restore_tasks)
-        for guild in self.bot.guilds:
+        restores = [
             spawn_background(restore_guild(self, guild), self._restore_tasks)
+            for guild in self.bot.guilds
+        ]
+        # Right after a restart every restored queue's first songs miss the stream
+        # cache at once; warm them while the first songs are still playing.
+        if restores and self.stream_refresher is not None:
+            spawn_background(
+                self.stream_refresher.warm_up(self._restores_settled(restores)),
+                self._restore_tasks,
+            )
+
+    async def _restores_settled(self, restores: list[asyncio.Task[Any]]) -> None:
+        """Until every restore_guild in `restores` has returned and each player it
+        built has read its queue back. asyncio.wait, not gather: the warm-up cancels
+        this when it stops waiting, and that must not cancel the restores."""
+        await asyncio.wait(restores)
+        await asyncio.gather(
+            *(
+                mp.wait_for_restore(timeout=RESTORE_WAIT_SECS)
+                for mp in list(self.mps.values())
+            )
+        )
 
     @commands.Cog.listener()
     async def on_voice_state_update(
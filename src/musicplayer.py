@@ -53,7 +53,15 @@ from src.util import (
     truncate_embed_title,
     get_logger,
 )
-from src.youtube import YTDL, NpHostRef, QueueObject, invalidate_stream_cache
+from src.youtube import (
+    YTDL,
+    ExtractionError,
+    NpHostRef,
+    QueueObject,
+    invalidate_stream_cache,
+    stream_cache_key,
+)
+from src.ytdlp_pool import ExtractPriority
 
 if TYPE_CHECKING:
     # A runtime import would close the cycle (musicbot imports MusicPlayer); the
@@ -174,6 +182,12 @@ _SONG_COMPLETE_MARGIN_SECS = 5
 # that connects but is never given a song disconnect on the same schedule.
 _PLAYBACK_GATE_TIMEOUT = 300
 
+# ── Playlist warm-up ────────────────────────────
+# Songs from the head of the queue whose stream URLs a queued playlist warms in one
+# batched extraction (warm_streams). Few, because a stream URL is cached for at most
+# 30 minutes: deeper songs would be minted only to expire before they play.
+_WARM_HEAD_SONGS = 5
+
 
 @dataclass(frozen=True)
 class InterjectOutcome:
@@ -202,10 +216,30 @@ class StreamFailure:
     """Why a song's stream failed to resolve, captured at the failure point so the
     skip notice can name the cause and the trace carrying the full exception."""
 
-    detail: str  # "<ExceptionType>: <message>"
+    detail: str  # ExtractionError.user_message, else "<ExceptionType>: <message>"
     trace_id: str  # 32-hex OTel trace id, or "unavailable" when no span is active
 
 
+@dataclass(frozen=True)
+class _Playback:
+    """A song handed to vc.play(), and what its `after` callback reports back."""
+
+    song: YTDL
+    # Written from the player thread, read after play_next.wait();
+    # call_soon_threadsafe orders the write before the wait returns.
+    error: list[Optional[Exception]]
+    started_at: float  # time.time() right after vc.play(), before any await
+
+    @property
+    def play_start_epoch(self) -> float:
+        """started_at backdated by the FFmpeg -ss offset, so recovery math (now -
+        play_start_epoch - pauses) yields true audio position, not time-since-
+        vc.play(). Without it, ?t= songs and double-crash recoveries resume
+        start_offset seconds early. Also what identifies this play's state in Redis
+        (see clear_song_end_state)."""
+        return self.started_at - self.song.start_offset
+
+
 def _reached_end(song: YTDL) -> bool:
     """Did this song play through to its end — the only case where the bar finalizes
     to 100%? Answered by position, not cause, so it covers -skip, interjection and a
@@ -856,11 +890,13 @@ class MusicPlayer:
         _skip_history_for marker with no await between, and the loop reads that
         marker after its prefetch await, so exactly one of the two writes.
 
-        The _ended_song fallback covers that await: current_song is nulled before it
-        and history written after, so current_song alone is blind for as long as a
-        cold extraction takes. None when there is nothing to record.
+        _ended_song covers that await: current_song is nulled before it and history
+        written after, so current_song alone is blind for as long as a cold
+        extraction takes. It wins over current_song, which a gapless hand-over sets
+        to the NEXT song while the ended one's row is still unwritten. None when
+        there is nothing to record.
         """
-        song = self.current_song or self._ended_song
+        song = self._ended_song or self.current_song
         if song is None:
             return None
         if self._skip_history_for is song:
@@ -962,7 +998,7 @@ class MusicPlayer:
                             try:
                                 stream_data = await cache_get(
                                     self.store.redis,
-                                    f"ytdl:stream:{guild_state.current_song_url}",
+                                    stream_cache_key(guild_state.current_song_url),
                                 )
                                 if stream_data is not None:
                                     raw_duration = stream_data.get("duration")
@@ -1130,6 +1166,31 @@ class MusicPlayer:
                         YTDL.prefetch_stream(item, redis=self.store.redis)
                     )
 
+    def warm_streams(self, items: Sequence[QueueItem]) -> None:
+        """Warm the stream cache for those of `items` within _WARM_HEAD_SONGS of the
+        queue head, as one background batch (YTDL.prefetch_streams). For a playlist
+        just queued with prefetch=False: one worker job instead of the per-item
+        prefetches queue_put() declines for it, and only for songs that will play
+        before their URLs expire. YTSources are skipped, as in queue_put()."""
+        if self.store is None:
+            return
+        wanted = {id(item) for item in items if isinstance(item, QueueObject)}
+        head = [
+            item
+            for item in self.queue.display_items()[:_WARM_HEAD_SONGS]
+            if id(item) in wanted and isinstance(item, QueueObject)
+        ]
+        if head:
+            self._spawn_background(YTDL.prefetch_streams(head, redis=self.store.redis))
+
+    def upcoming_songs(self, n: int) -> list[QueueObject]:
+        """The QueueObjects among the next `n` pending queue entries — the songs
+        whose stream URLs StreamRefresher keeps fresh. YTSources have no URL to
+        refresh until they are resolved."""
+        return [
+            item for item in self.queue.upcoming(n) if isinstance(item, QueueObject)
+        ]
+
     async def queue_get(self) -> QueueItem:
         return await self.queue.get()
 
@@ -1138,8 +1199,8 @@ class MusicPlayer:
         before any bulk queue mutation, so the item the prefetch dequeued via
         get_nowait() is returned to the front (requeue_front, in its CancelledError
         handler) before the drain — the mutation then handles it with everything else
-        instead of stranding it. A prefetch blocked inside run_in_executor cannot be
-        interrupted, so this await can sit until the worker exits (socket_timeout)."""
+        instead of stranding it. Prompt even mid-extraction: cancelling the prefetch
+        aborts its yt-dlp job inside the worker (YtdlpPool.run), it is not awaited."""
         await cancel_task(self._prefetch_task)
 
     async def _flush_played(self, items: Sequence[QueueItem]) -> None:
@@ -1653,6 +1714,33 @@ class MusicPlayer:
         except Exception as e:
             log.warning(f"Failed to update bot activity: {e}", exc_info=True)
 
+    async def apply_volume(self) -> bool:
+        """Push self.volume to what is already streaming. True when the playing song
+        changed with it.
+
+        A live-volume song (a stream copy, with YTDL.read's gain stage) takes it on
+        its next packet, and a prefetched one is given it at vc.play(), by _play.
+        Any other song has its volume baked into ffmpeg's own encode (see
+        yt_stream): the playing one keeps its level, and a prefetched one — or one
+        still being built, which may have read the old level — goes back to the
+        queue to be rebuilt, exactly as an interjection sends it back."""
+        task = self._prefetch_task
+        prefetched = (
+            task.result()
+            if task is not None
+            and task.done()
+            and not task.cancelled()
+            and task.exception() is None
+            else None
+        )
+        if task is not None and (prefetched is None or not prefetched.live_volume):
+            await self._neutralize_prefetch()
+        song = self.current_song
+        if song is None or not song.live_volume:
+            return False
+        song.volume = self.volume
+        return True
+
     async def pause(self, vc: discord.VoiceClient) -> None:
         """Pause playback and sync all pause-tracking state in one place: the Redis
         crash-recovery epoch accounting and the progress-bar/Activity refresh. One
@@ -1946,27 +2034,42 @@ class MusicPlayer:
                 query_source=source.query_source,
                 analytics=source.analytics,
                 user_input=source.user_input,
+                # Resolved at dequeue (or one song ahead of it), not at a command.
+                priority=ExtractPriority.PLAYBACK,
             )
         return source
 
-    async def _stream_source(
-        self, source: QueueObject, *, allow_reextract: bool = True
-    ) -> Optional[YTDL]:
+    def _voice_bitrate(self) -> Optional[int]:
+        """The connected voice channel's bitrate (bps), what yt_stream fits the
+        audio rung and encoder to. None before the bot has joined: the first song of
+        a -play can resolve while the connect is still in flight, and gets the best
+        rung, as every song did before."""
+        channel = getattr(self._guild.voice_client, "channel", None)
+        if isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
+            return channel.bitrate
+        return None
+
+    async def _stream_source(self, source: QueueObject) -> Optional[YTDL]:
         self._last_stream_error = None
         try:
             return await YTDL.yt_stream(
                 source,
                 self._channel,
                 volume=self.volume,
+                channel_bitrate=self._voice_bitrate(),
                 redis=self.store.redis if self.store is not None else None,
-                allow_reextract=allow_reextract,
             )
         except Exception as e:
             ctx = trace.get_current_span().get_span_context()
             trace_id = format(ctx.trace_id, "032x") if ctx.is_valid else "unavailable"
-            self._last_stream_error = StreamFailure(
-                detail=f"{type(e).__name__}: {e}", trace_id=trace_id
+            # An extraction failure names its own reason safely (user_message),
+            # a remembered one included; anything else is shown as it was raised.
+            detail = (
+                e.user_message
+                if isinstance(e, ExtractionError)
+                else f"{type(e).__name__}: {e}"
             )
+            self._last_stream_error = StreamFailure(detail=detail, trace_id=trace_id)
             log.error(
                 f"Error processing song: {type(e).__name__}: {e} [trace_id={trace_id}]",
                 exc_info=True,
@@ -2257,10 +2360,9 @@ class MusicPlayer:
         trace.get_current_span().set_attribute("discord.guild_id", str(self._guild.id))
         try:
             source = await self._resolve_source(source)
-            # No re-extraction here: _cancel_prefetch() awaits this task, and an
-            # executor job cannot be interrupted, so every bulk mutation would wait
-            # on it. The play-time resolve decides instead.
-            song = await self._stream_source(source, allow_reextract=False)
+            # Free to re-extract: _cancel_prefetch() aborts the extraction in its
+            # worker rather than waiting it out, so no bulk mutation queues behind it.
+            song = await self._stream_source(source)
         except asyncio.CancelledError:
             self.queue.requeue_front(source)
             raise
@@ -2274,8 +2376,147 @@ class MusicPlayer:
             # path does, or the display/Redis heads sit one entry ahead forever.
             await self._retire_failed_dequeue(source, context="prefetch failure")
             return None
+        if config.GAPLESS_PRIME_FRAMES > 0:
+            # Buffer the first packets while the current song still plays, so the
+            # hand-over in loop() never waits on ffmpeg's startup (see YTDL.prime).
+            try:
+                primed = await asyncio.to_thread(
+                    song.prime, config.GAPLESS_PRIME_FRAMES
+                )
+            except asyncio.CancelledError:
+                # The worker finishes on its own: cleanup() kills ffmpeg, so its
+                # next read is end of stream.
+                song.cleanup()
+                self.queue.requeue_front(source)
+                raise
+            except Exception as e:
+                # Still playable, just not gapless: the player thread's first
+                # read() meets whatever broke here and reports it through `after`.
+                log.warning(f"Prefetch priming failed: {type(e).__name__}: {e}")
+                primed = 0
+            trace.get_current_span().set_attribute("prefetch.primed_frames", primed)
         return song
 
+    def _play(self, vc: discord.VoiceClient, song: YTDL) -> _Playback:
+        """Start `song` on the voice client. Synchronous end to end, so nothing can
+        interleave between vc.play() and the pause or timestamp that follow it."""
+        error: list[Optional[Exception]] = [None]
+
+        def _after_play(
+            exc: Optional[Exception], _title: str = song.title or ""
+        ) -> None:
+            # discord.py hands ffmpeg's failure here and nowhere else — a `lambda _:`
+            # would drop it, making a stream that never opened indistinguishable
+            # from a song that ended. A deliberate vc.stop() arrives as exc=None.
+            if exc is not None:
+                error[0] = exc
+                log.error(f"playback error for {_title}: {exc}")
+            self.bot.loop.call_soon_threadsafe(self.play_next.set)
+
+        if song.live_volume:
+            # Built by a prefetch, possibly before the latest -volume.
+            song.volume = self.volume
+        self._stopped_deliberately = False
+        vc.play(song, after=_after_play)
+        if song.start_paused:
+            # Park the player thread SYNCHRONOUSLY, before any await, so a song
+            # returning paused leaks a frame or two rather than a Redis round-trip
+            # of audio. Idempotent with the full pause() loop() runs after the start
+            # transaction, so its pause_start_epoch survives that transaction's HDEL.
+            vc.pause()
+        started_at = time.time()  # capture immediately before any awaits
+        # Stamped once and inherited by every later fragment (a resume tail arrives
+        # carrying it). Before loop()'s state write, or the parked entry persists
+        # 0.0 and a crash recovers no start.
+        song.played_at = song.played_at or started_at
+        return _Playback(song=song, error=error, started_at=started_at)
+
+    def _can_hand_off(
+        self, ended: YTDL, next_song: YTDL, *, stream_failed: bool
+    ) -> bool:
+        """Whether loop() may start `next_song` the moment `ended` ends — before the
+        ended song's history row and state clear, which then run under live audio.
+
+        Only for a clean hand-over: `next_song` primed (its first packets already
+        buffered, so the player thread's first read() does not wait on ffmpeg), and
+        an ended song that produced audio — a dead or silent one has notices and
+        cache evictions to run first, and they read _stopped_deliberately, which
+        vc.play() resets."""
+        if config.GAPLESS_PRIME_FRAMES <= 0:
+            return False
+        if stream_failed or not ended.produced_audio or not next_song.primed:
+            return False
+        vc = self._guild.voice_client
+        return isinstance(vc, discord.VoiceClient) and vc.is_connected()
+
+    async def _hand_off(self, next_song: YTDL) -> Optional[_Playback]:
+        """Commit the prefetched song's claim, start it and write its start
+        transaction. Takes ownership of `next_song`: None means a clear() voided it,
+        and it is already cleaned up.
+
+        All three under the queue mutex (try_commit_dequeue's `then`): the commit
+        settles the claim in memory, and a -shuffle, -remove or -clear landing
+        before the LPOP would rebuild the mirror with the song still at its head.
+        current_song is set there too, so -now, -skip and -volume see the song
+        that is playing. The ended song's row and state clear then run under its
+        audio; its clear is keyed on its own play_start_epoch, so it cannot wipe
+        this one's state."""
+        # Same test as the top of the loop: a clear() during the prefetch settled
+        # its claim. The commit's own refusal covers one that lands while it waits
+        # for the mutex.
+        if self.queue.consume_cleared_flag():
+            next_song.cleanup()
+            return None
+        playback: Optional[_Playback] = None
+
+        async def start() -> None:
+            nonlocal playback
+            try:
+                # Read after the mutex await, as loop() reads it after its commit.
+                vc = self._guild.voice_client
+                assert isinstance(vc, discord.VoiceClient)
+                self.play_next.clear()
+                playback = self._play(vc, next_song)
+            except Exception:
+                # Committed but never started: retire its mirror entry, as
+                # finish_failed_dequeue would, before the mutex lets a rebuild in.
+                await self.queue.redis_pop_for(None, persisted=next_song.persisted)
+                raise
+            self.current_song = next_song
+            if self.store is not None:
+                await self._write_start_state(playback, pop=next_song.persisted)
+
+        try:
+            committed = await self.queue.try_commit_dequeue(
+                self.queue.generation, then=start
+            )
+        except Exception:
+            if playback is None:
+                next_song.cleanup()
+            raise
+        if not committed:
+            next_song.cleanup()
+            return None
+        return playback
+
+    async def _write_start_state(self, playback: _Playback, *, pop: bool) -> None:
+        """Mirror a just-started song to Redis. pop=True → one MULTI/EXEC atomically
+        LPOPs the queue and writes every state field plus the display snapshot,
+        closing the at-most-once window. A crash-recovered "current song" was never
+        on the Redis list, so only state is written — an LPOP would drop a queued
+        one."""
+        assert self.store is not None
+        current = SongQueueEntry.from_song(playback.song)
+        now_playing = NowPlayingData.from_song(playback.song)
+        if pop:
+            await self.store.pop_queue_and_start_song(
+                current, playback.play_start_epoch, now_playing=now_playing
+            )
+        else:
+            await self.store.set_current_song_state(
+                current, playback.play_start_epoch, now_playing=now_playing
+            )
+
     # ── Main playback loop ────────────────────────────────────────────────────
 
     async def loop(self) -> None:
@@ -2309,9 +2550,17 @@ class MusicPlayer:
                 asyncio.create_task(self.stop())
                 return
         prefetched_song: Optional[YTDL] = None
+        # A song the previous iteration already started — the gapless hand-over at
+        # its song end. Committed, playing and mirrored; this iteration picks it up
+        # after the start transaction.
+        started: Optional[_Playback] = None
 
         while not self.bot.is_closed():
-            self.play_next.clear()
+            if started is None:
+                # Not for a handed-off song: _hand_off() cleared it before
+                # vc.play(), and a clear here would eat an `after` that has
+                # already fired.
+                self.play_next.clear()
             # True while this iteration holds a claim the commit has not settled,
             # so the outer handler can settle it when a failure lands in that
             # window. Cleared at the commit, not at song end — the release it
@@ -2330,8 +2579,9 @@ class MusicPlayer:
             ) as span:
                 try:
                     queue_was_cleared = self.queue.consume_cleared_flag()
-                    prefetch_used = prefetched_song is not None
+                    prefetch_used = prefetched_song is not None or started is not None
                     span.set_attribute("prefetch.used", prefetch_used)
+                    span.set_attribute("playback.gapless", started is not None)
                     if prefetched_song is not None and queue_was_cleared:
                         # Cleared while _prefetch_next_song ran: clear() reset the
                         # cursor, so the prefetch's claim is already settled — only
@@ -2343,7 +2593,12 @@ class MusicPlayer:
                     # try_commit_dequeue() below: a clear() in between voids this
                     # dequeue even if a put() has since refilled the display.
                     commit_generation = self.queue.generation
-                    if prefetched_song is not None:
+                    handed_off = started is not None
+                    if started is not None:
+                        self.current_song = started.song
+                        should_pop_queue = started.song.persisted
+                        source = None
+                    elif prefetched_song is not None:
                         self.current_song = prefetched_song
                         prefetched_song = None
                         claim_outstanding = True  # the prefetch's get_nowait() is ours
@@ -2418,7 +2673,10 @@ class MusicPlayer:
 
                     span.set_attribute("song.title", self.current_song.title or "")
 
-                    if not await self.queue.try_commit_dequeue(commit_generation):
+                    # A handed-off song committed its claim before it started.
+                    if started is None and not await self.queue.try_commit_dequeue(
+                        commit_generation
+                    ):
                         # Cleared while this song resolved (e.g. inside yt_stream).
                         # Discard without playing: the clear() that refused this
                         # commit reset the cursor, so the claim is settled, and
@@ -2442,63 +2700,18 @@ class MusicPlayer:
                     vc = self._guild.voice_client
                     assert isinstance(vc, discord.VoiceClient)
                     assert self.current_song is not None
+                    if started is None:
+                        started = self._play(vc, self.current_song)
+                    playback, started = started, None
                     # Local binding: pyright's narrowing doesn't survive the awaits
                     # below, and it keeps every write in this iteration on the same
                     # song even if current_song is reassigned.
-                    song = self.current_song
-
-                    # Written from the player thread, read after play_next.wait();
-                    # call_soon_threadsafe orders the write before the wait returns.
-                    play_error: list[Optional[Exception]] = [None]
-
-                    def _after_play(
-                        error: Optional[Exception], _title: str = song.title or ""
-                    ) -> None:
-                        # discord.py hands ffmpeg's failure here and nowhere else —
-                        # a `lambda _:` would drop it, making a stream that never
-                        # opened indistinguishable from a song that ended. A
-                        # deliberate vc.stop() arrives as error=None.
-                        if error is not None:
-                            play_error[0] = error
-                            log.error(f"playback error for {_title}: {error}")
-                        self.bot.loop.call_soon_threadsafe(self.play_next.set)
-
-                    self._stopped_deliberately = False
-                    vc.play(song, after=_after_play)
-                    if song.start_paused:
-                        # Park the player thread SYNCHRONOUSLY, before any await, so
-                        # a song returning paused leaks a frame or two rather than a
-                        # Redis round-trip of audio. Idempotent with the full pause()
-                        # below, which runs after the start transaction so its
-                        # pause_start_epoch survives that transaction's HDEL.
-                        vc.pause()
-                    play_start = time.time()  # capture immediately before any awaits
-                    # Stamped once and inherited by every later fragment (a resume
-                    # tail arrives carrying it). Before the state write below, or
-                    # the parked entry persists 0.0 and a crash recovers no start.
-                    song.played_at = song.played_at or play_start
-
-                    # Mirror the now-playing song to Redis. should_pop_queue=True →
-                    # one MULTI/EXEC atomically LPOPs the queue and writes every state
-                    # field plus the display snapshot, closing the at-most-once
-                    # window. A crash-recovered "current song" was never on the Redis
-                    # list, so only state is written — an LPOP would drop a queued one.
-                    if self.store is not None:
-                        # Backdated by the FFmpeg -ss offset so recovery math (now -
-                        # play_start_epoch - pauses) yields true audio position, not
-                        # time-since-vc.play(). Without it, ?t= songs and
-                        # double-crash recoveries resume start_offset seconds early.
-                        backdated_start = play_start - song.start_offset
-                        current = SongQueueEntry.from_song(song)
-                        now_playing = NowPlayingData.from_song(song)
-                        if should_pop_queue:
-                            await self.store.pop_queue_and_start_song(
-                                current, backdated_start, now_playing=now_playing
-                            )
-                        else:
-                            await self.store.set_current_song_state(
-                                current, backdated_start, now_playing=now_playing
-                            )
+                    song = playback.song
+                    play_error = playback.error
+
+                    # A handed-off song wrote its own, under the commit's mutex.
+                    if self.store is not None and not handed_off:
+                        await self._write_start_state(playback, pop=should_pop_queue)
 
                     if song.start_paused:
                         # Returns parked where -playnow interrupted it (the player
@@ -2617,13 +2830,30 @@ class MusicPlayer:
                         except asyncio.CancelledError:
                             prefetched_song = None
 
+                    # Gapless: start the next song now, and let everything below —
+                    # the history row, the state clear, this song's notices — run
+                    # under its audio rather than in the silence between the two.
+                    if prefetched_song is not None and self._can_hand_off(
+                        song, prefetched_song, stream_failed=stream_failed
+                    ):
+                        next_song, prefetched_song = prefetched_song, None
+                        started = await self._hand_off(next_song)
+                        span.set_attribute("playback.handed_off", started is not None)
+
                     # interject() stopped this song with a resume entry pending —
                     # history records it when the tail ends. Identity match, and the
                     # marker clears either way: a marker left for a song that ended
                     # during interject()'s awaits must not eat this song's entry.
+                    # The one exception is a marker for the handed-off song, which
+                    # is current from the hand-off on and can be interjected in
+                    # these awaits: that marker and its tail are its own iteration's.
                     # stream_failed → never heard, so never recorded.
                     skip_history = self._skip_history_for is song
-                    self._skip_history_for = None
+                    handed_marker = (
+                        started is not None and self._skip_history_for is started.song
+                    )
+                    if not handed_marker:
+                        self._skip_history_for = None
                     # Same identity, same clear-either-way rule: hand the tail the
                     # card this fragment is leaving frozen. Late-bound because THIS
                     # is where the host settles — an id taken at interjection time
@@ -2637,8 +2867,10 @@ class MusicPlayer:
                     # matching -remove or an in-flight-head put_front persist the
                     # live ids — which is why _dispose_previous_np_card guards them
                     # as hostile input.
-                    pending_tail = self._pending_resume_tail
-                    self._pending_resume_tail = None
+                    pending_tail = None
+                    if not handed_marker:
+                        pending_tail = self._pending_resume_tail
+                        self._pending_resume_tail = None
                     if skip_history and pending_tail is not None:
                         pending_tail.np_host_ref = (
                             NpHostRef(finished_host, finished_own, finished_dedicated)
@@ -2684,9 +2916,15 @@ class MusicPlayer:
                     self._ended_song = None
 
                     if self.store is not None:
-                        await self.store.clear_song_end_state()
+                        # Keyed on this play, so it is a no-op once a hand-over
+                        # has written the next song's state.
+                        await self.store.clear_song_end_state(
+                            play_start_epoch=playback.play_start_epoch
+                        )
 
-                    await self.update_activity(None)
+                    if started is None:
+                        # A handed-off song's own update_activity() replaces it.
+                        await self.update_activity(None)
 
                     # Deliberately last: current_song is already cleared, so the
                     # notice goes out alone rather than re-hosting an NP block for a
@@ -2739,14 +2977,22 @@ class MusicPlayer:
                     # the next song starts clean.
                     self._release_np_host()
                     prefetched_song = None
-                    self._skip_history_for = None
-                    # A tail left holding this slot would receive a LATER fragment's
-                    # card ids and delete the wrong message.
-                    self._pending_resume_tail = None
+                    # `started` is deliberately kept: that song is already playing,
+                    # and the next iteration takes it over after its start
+                    # transaction, which _hand_off() has already written. So is
+                    # everything that describes it — until that iteration runs,
+                    # -now, -skip and -volume must still find it, and a -playnow
+                    # that interrupted it keeps its marker and tail.
+                    if started is None or self._skip_history_for is not started.song:
+                        self._skip_history_for = None
+                        # A tail left holding this slot would receive a LATER
+                        # fragment's card ids and delete the wrong message.
+                        self._pending_resume_tail = None
                     self._ended_song = None
-                    self.current_song = None
+                    self.current_song = started.song if started is not None else None
                     self.play_message = None
-                    if self.store is not None:
+                    # Not over a handed-off song's state: that is its own.
+                    if self.store is not None and started is None:
                         await self.store.clear_song_end_state()
                     try:
                         # Inside the try: this is the loop's own except block, so a
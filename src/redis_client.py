@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import math
 import os
 import secrets
+import time
+import zlib
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from functools import wraps
@@ -19,7 +23,14 @@ from redis.exceptions import WatchError
 from redis.asyncio.retry import Retry
 from redis.typing import EncodableT, FieldT
 
+try:
+    # Python 3.14+, and only when built with libzstd: see _CACHE_COMPRESSION.
+    from compression import zstd as _zstd
+except ImportError:
+    _zstd = None
+
 from src import config
+from src.telemetry import get_meter
 from src.guild_state import (
     ConfigField,
     GuildConfig,
@@ -39,6 +50,11 @@ from src.guild_state import (
 from src.util import get_logger
 
 log = get_logger(__name__)
+_meter = get_meter(__name__)
+_LOCAL_LOOKUPS = _meter.create_counter(
+    "cache.local.lookups",
+    description="In-process cache tier lookups, by key prefix and hit/miss.",
+)
 
 GUILD_QUEUE_KEY = "guild:{guild_id}:queue"
 GUILD_STATE_KEY = "guild:{guild_id}:state"
@@ -173,16 +189,221 @@ async def close_redis_pool(pool: aioredis.ConnectionPool) -> None:
         log.warning(f"Failed to close Redis connection pool: {e}")
 
 
+# ── Compressed payloads ───────────────────────────────────────────────────────
+
+# Key prefixes whose values the generic helpers compress. A stream entry is ~1.4 KB
+# of JSON, most of it the signed googlevideo URL, and thousands live at once; the
+# leaderboard and Spotify values are few and small, so nothing else opts in.
+_COMPRESSED_PREFIXES: Final = ("ytdl:source:", "ytdl:stream:")
+# "zstd" (the default), "zlib", or "off". zstd is compression.zstd (Python 3.14+),
+# which a Python built without libzstd lacks: zlib is used instead, never nothing.
+_CACHE_COMPRESSION = os.environ.get("CACHE_COMPRESSION", "zstd").lower()
+# Payloads shorter than this are stored as plain JSON: a frame and a codec header
+# cost more than they save on a few hundred bytes.
+_COMPRESS_MIN_BYTES = int(os.environ.get("CACHE_COMPRESS_MIN_BYTES", "512"))
+
+# A compressed value is framed: _FRAME_MAGIC, the frame version, the codec's tag,
+# then the compressed JSON. 0xFF starts no JSON document, so an unframed value —
+# every entry written before framing existed, and every one under the threshold —
+# is still told apart and read as plain orjson. That is the whole migration: old
+# entries are read as they are and age out under their own TTLs (30 minutes at
+# most for a stream URL), and nothing is rewritten in place. Rolled back, a build
+# from before framing fails to decode a framed value, which cache_get already turns
+# into a miss.
+_FRAME_MAGIC: Final = 0xFF
+_FRAME_VERSION: Final = 1
+_CODEC_ZSTD: Final = ord("z")
+_CODEC_ZLIB: Final = ord("d")
+
+_DECOMPRESSORS: dict[int, Callable[[bytes], bytes]] = {_CODEC_ZLIB: zlib.decompress}
+if _zstd is not None:
+    _DECOMPRESSORS[_CODEC_ZSTD] = _zstd.decompress
+
+
+def _pick_compressor() -> Optional[tuple[int, Callable[[bytes], bytes]]]:
+    if _CACHE_COMPRESSION == "off":
+        return None
+    if _CACHE_COMPRESSION == "zstd" and _zstd is not None:
+        return _CODEC_ZSTD, _zstd.compress
+    return _CODEC_ZLIB, zlib.compress
+
+
+_compressor = _pick_compressor()
+
+
+def _encode(key: str, value: Any) -> bytes:
+    """orjson-encode a value, framed and compressed when its key opts in and the
+    payload is worth it — and kept plain when compression would not shrink it."""
+    raw = orjson.dumps(value)
+    if (
+        _compressor is None
+        or len(raw) < _COMPRESS_MIN_BYTES
+        or not key.startswith(_COMPRESSED_PREFIXES)
+    ):
+        return raw
+    codec, compress = _compressor
+    framed = bytes((_FRAME_MAGIC, _FRAME_VERSION, codec)) + compress(raw)
+    return framed if len(framed) < len(raw) else raw
+
+
+def _decode(raw: bytes) -> Any:
+    """The value _encode wrote, or plain orjson for an unframed one. A frame this
+    process cannot read — a newer version, or a zstd entry on a Python without zstd
+    — is None, a miss, and the caller re-extracts and overwrites it."""
+    if not raw or raw[0] != _FRAME_MAGIC:
+        return orjson.loads(raw)
+    decompress = _DECOMPRESSORS.get(raw[2]) if len(raw) > 2 else None
+    if decompress is None or raw[1] != _FRAME_VERSION:
+        log.debug(f"unreadable cache frame {raw[:3]!r}")
+        return None
+    return orjson.loads(decompress(raw[3:]))
+
+
+# ── In-process cache tier ─────────────────────────────────────────────────────
+
+# Key prefixes the generic helpers also keep in process memory. The ytdl caches are
+# read over and over for the same keys — prefetch, the play-time resolve, requeues —
+# and each read is otherwise a round trip plus an orjson decode. Nothing else opts
+# in: the leaderboard and Spotify caches are read rarely enough not to matter.
+_LOCAL_CACHE_PREFIXES: Final = (
+    "ytdl:source:",
+    "ytdl:alias:",
+    "ytdl:stream:",
+    "ytdl:unplayable:",
+)
+# Entries held, least recently used evicted first; 0 turns the tier off.
+_LOCAL_CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", "2048"))
+# Ceiling on how long an entry is served from memory. Within a process every
+# cache_set/cache_del goes through the tier too, so this bounds only what another
+# process's write or delete can leave stale here. A stale stream URL is what the
+# pre-playback probe exists to catch (src/youtube.py), and its DEAD verdict deletes
+# the entry here as well.
+_LOCAL_CACHE_MAX_TTL_SECS = float(os.environ.get("CACHE_LOCAL_MAX_TTL_SECS", "60"))
+
+_MISSING: Final = object()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LocalCacheStats:
+    """One key prefix's lookups in the in-process tier since start."""
+
+    prefix: str
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class _LocalCache:
+    """A bounded LRU of decoded values, each kept no longer than its Redis TTL had
+    left (capped at _LOCAL_CACHE_MAX_TTL_SECS) — an entry never outlives the one it
+    mirrors, so the TTLs the callers chose (a 2-minute UNCONFIRMED stream URL) still
+    hold. Values are shared between readers and must be treated as read-only, like
+    a coalesced extraction's result. Loop-thread only."""
+
+    def __init__(self, max_entries: int, max_ttl: float) -> None:
+        self._max_entries = max_entries
+        self._max_ttl = max_ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @staticmethod
+    def prefix_of(key: str) -> Optional[str]:
+        return next((p for p in _LOCAL_CACHE_PREFIXES if key.startswith(p)), None)
+
+    def covers(self, key: str) -> bool:
+        return self._max_entries > 0 and self.prefix_of(key) is not None
+
+    def get(self, key: str) -> Any:
+        """The value, or _MISSING. Counted against the key's prefix."""
+        prefix = self.prefix_of(key) or ""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+        hit = entry is not None
+        counts = self._hits if hit else self._misses
+        counts[prefix] = counts.get(prefix, 0) + 1
+        _LOCAL_LOOKUPS.add(1, {"prefix": prefix, "hit": hit})
+        if entry is None:
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        ttl = min(ttl, self._max_ttl)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits.clear()
+        self._misses.clear()
+
+    def stats(self) -> list[LocalCacheStats]:
+        return [
+            LocalCacheStats(
+                prefix=prefix.rstrip(":"),
+                hits=self._hits.get(prefix, 0),
+                misses=self._misses.get(prefix, 0),
+            )
+            for prefix in _LOCAL_CACHE_PREFIXES
+        ]
+
+
+_local_cache = _LocalCache(_LOCAL_CACHE_MAX_ENTRIES, _LOCAL_CACHE_MAX_TTL_SECS)
+
+
+def local_cache_stats() -> list[LocalCacheStats]:
+    """Hits and misses per cached key prefix, for -debug."""
+    return _local_cache.stats()
+
+
+async def _get_with_ttl(redis: aioredis.Redis, key: str) -> tuple[Any, float]:
+    """GET and PTTL on one round trip: the value and the seconds it has left."""
+    pipe = redis.pipeline(transaction=False)
+    pipe.get(key)
+    pipe.pttl(key)
+    raw, pttl = await pipe.execute()
+    if raw is None:
+        return None, 0.0
+    # PTTL is -1 for a key with no expiry; the tier's own ceiling still applies.
+    return _decode(raw), (pttl / 1000 if pttl >= 0 else _LOCAL_CACHE_MAX_TTL_SECS)
+
+
 # ── Generic cache helpers ─────────────────────────────────────────────────────
 
 
 async def cache_get(redis: Optional[aioredis.Redis], key: str) -> Any:
-    """Get and orjson-decode a cached value. Returns None on miss, error, or when redis is None."""
+    """Get and decode a cached value (_decode). Returns None on miss, error, or when redis is None.
+    Served from the in-process tier when the key is one it covers and holds."""
     if redis is None:
         return None
+    covered = _local_cache.covers(key)
+    if covered:
+        value = _local_cache.get(key)
+        if value is not _MISSING:
+            return value
     try:
+        if covered:
+            value, ttl = await _get_with_ttl(redis, key)
+            if value is not None:
+                _local_cache.put(key, value, ttl)
+            return value
         val = await redis.get(key)
-        return orjson.loads(val) if val is not None else None
+        return _decode(val) if val is not None else None
     except Exception as e:
         log.warning(f"cache_get failed [{key}]: {e}")
         return None
@@ -191,13 +412,99 @@ async def cache_get(redis: Optional[aioredis.Redis], key: str) -> Any:
 async def cache_set(
     redis: Optional[aioredis.Redis], key: str, value: Any, ttl: int
 ) -> None:
-    """orjson-encode and set a value with TTL. No-ops when redis is None; silently ignores errors."""
+    """Encode (_encode) and set a value with TTL. No-ops when redis is None; silently ignores errors."""
     if redis is None:
         return
     try:
-        await redis.set(key, orjson.dumps(value), ex=ttl)
+        await redis.set(key, _encode(key, value), ex=ttl)
     except Exception as e:
+        # Not mirrored either: the tier never holds what Redis does not.
+        _local_cache.discard(key)
         log.warning(f"cache_set failed [{key}]: {e}")
+        return
+    if _local_cache.covers(key):
+        _local_cache.put(key, value, ttl)
+
+
+async def cache_get_many(
+    redis: Optional[aioredis.Redis], keys: Sequence[str]
+) -> list[Any]:
+    """cache_get for several keys in one MGET, a value or None per key, in order.
+    All None when redis is None; on an MGET error only the keys the in-process tier
+    could not answer are — a miss is what every caller already recovers from, and
+    a hit already in hand is not one."""
+    if redis is None or not keys:
+        return [None] * len(keys)
+    results: list[Any] = [None] * len(keys)
+    remote: list[int] = []
+    for i, key in enumerate(keys):
+        value = _local_cache.get(key) if _local_cache.covers(key) else _MISSING
+        if value is _MISSING:
+            remote.append(i)
+        else:
+            results[i] = value
+    if not remote:
+        return results
+    try:
+        # MGET carries no TTLs, so the misses are not mirrored; their next cache_get
+        # is what brings them into the tier.
+        values = await redis.mget([keys[i] for i in remote])
+        for i, raw in zip(remote, values):
+            results[i] = _decode(raw) if raw is not None else None
+    except Exception as e:
+        log.warning(f"cache_get_many failed [{len(remote)} keys]: {e}")
+        for i in remote:
+            results[i] = None
+    return results
+
+
+async def cache_set_many(
+    redis: Optional[aioredis.Redis], entries: Sequence[tuple[str, Any, int]]
+) -> None:
+    """cache_set for several (key, value, ttl) entries, on one pipeline round trip.
+    Same contract as cache_set: no-ops when redis is None, errors are ignored."""
+    if redis is None or not entries:
+        return
+    try:
+        # transaction=False: independent entries with nothing to make atomic, as in
+        # read_guild_configs.
+        pipe = redis.pipeline(transaction=False)
+        for key, value, ttl in entries:
+            pipe.set(key, _encode(key, value), ex=ttl)
+        await pipe.execute()
+    except Exception as e:
+        for key, _, _ in entries:
+            _local_cache.discard(key)
+        log.warning(f"cache_set_many failed [{len(entries)} keys]: {e}")
+        return
+    for key, value, ttl in entries:
+        if _local_cache.covers(key):
+            _local_cache.put(key, value, ttl)
+
+
+async def cache_ttls(
+    redis: Optional[aioredis.Redis], keys: Sequence[str]
+) -> Optional[list[float]]:
+    """Seconds each key has left, on one pipeline round trip: 0.0 for an absent key,
+    inf for one with no expiry. None when redis is None or the read failed — unlike
+    a miss, "unknown" is not something a caller can act on."""
+    if redis is None:
+        return None
+    if not keys:
+        return []
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.pttl(key)
+        replies = await pipe.execute()
+    except Exception as e:
+        log.warning(f"cache_ttls failed [{len(keys)} keys]: {e}")
+        return None
+    # PTTL: -2 absent, -1 no expiry.
+    return [
+        0.0 if pttl == -2 else math.inf if pttl == -1 else pttl / 1000
+        for pttl in replies
+    ]
 
 
 async def cache_del(redis: Optional[aioredis.Redis], key: str) -> bool:
@@ -207,6 +514,9 @@ async def cache_del(redis: Optional[aioredis.Redis], key: str) -> bool:
     rather than announce a deletion that did not occur. False on a no-op or an error."""
     if redis is None:
         return False
+    # First, and unconditionally: whatever Redis says, this process must stop
+    # serving the entry.
+    _local_cache.discard(key)
     try:
         return bool(await redis.delete(key))
     except Exception as e:
@@ -1113,19 +1423,54 @@ class GuildRedisStore:
         await self._exec_with_state_ttl(pipe)
 
     @_guild_op(default=None)
-    async def clear_song_end_state(self) -> None:
+    async def clear_song_end_state(
+        self, *, play_start_epoch: Optional[float] = None
+    ) -> None:
         """Clear all transient song state in one round-trip: HDEL every
         current_song_*/position field and DELETE the now_playing hash. Matches
         clear_connection()'s idiom, so *absent* — not empty-string — is the one
-        representation of "no song"."""
-        pipe = self.redis.pipeline()
-        pipe.hdel(
-            self.state_key(),
-            *_TRANSIENT_SONG_FIELDS,
-            *_PLAYBACK_POSITION_FIELDS,
-        )
-        pipe.delete(self.now_playing_key())
-        await pipe.execute()
+        representation of "no song".
+
+        `play_start_epoch` makes it a compare-and-clear for one song: the state is
+        left alone unless it still holds the epoch that song's start transaction
+        wrote (a float stamped at vc.play(), so two plays of one URL still differ).
+        A gapless hand-over writes the next song's state before the ended song's
+        bookkeeping runs, and a blind clear there would wipe it. WATCH/MULTI, as in
+        release_recovery_lock; a WatchError is a write to the hash in between, so
+        the compare is simply run again."""
+        if play_start_epoch is None:
+            pipe = self.redis.pipeline()
+            pipe.hdel(
+                self.state_key(),
+                *_TRANSIENT_SONG_FIELDS,
+                *_PLAYBACK_POSITION_FIELDS,
+            )
+            pipe.delete(self.now_playing_key())
+            await pipe.execute()
+            return
+        expected = str(play_start_epoch).encode()
+        async with self.redis.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(self.state_key())
+                    current = await pipe.hget(
+                        self.state_key(), StateField.PLAY_START_EPOCH
+                    )
+                    if current != expected:
+                        # Another song's state, or none: not this song's to clear.
+                        await pipe.unwatch()
+                        return
+                    pipe.multi()
+                    pipe.hdel(
+                        self.state_key(),
+                        *_TRANSIENT_SONG_FIELDS,
+                        *_PLAYBACK_POSITION_FIELDS,
+                    )
+                    pipe.delete(self.now_playing_key())
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
 
     # State operations
 
@@ -136,8 +136,10 @@ class YTSource:
     `ytsearch`, with an optional `ts` start offset. `list_id` is the playlist ID, set
     when type == YTType.PLAYLIST; `index` is that playlist's 1-based start position,
     set only on the playlist branch because it means nothing without a list.
-    `video_id` is the `v=` of a playlist link, kept only so the enqueue path can
-    tell whether `ts` belongs to the track it is about to queue first."""
+    `video_id` is the video the link names (`v=`, or a youtu.be / shorts path): on a
+    playlist link the enqueue path reads it to tell whether `ts` belongs to the
+    track it is about to queue first, and on a track it is the cache identity
+    (canonical_id)."""
 
     url: Optional[str] = None
     ytsearch: Optional[str] = None
@@ -238,6 +240,24 @@ def _playlist_index(raw: str) -> Optional[int]:
     return value if value >= 1 else None
 
 
+# Hosts that are YouTube whatever the subdomain says: the same video ID plays the
+# same video on each, so they share a branch, a query_source and a cache identity.
+_YOUTUBE_HOSTS: Final = frozenset(
+    {"youtube.com", "m.youtube.com", "music.youtube.com", "youtu.be"}
+)
+
+
+def _youtube_path_id(domain: str, path: str) -> Optional[str]:
+    """The video ID carried in a YouTube link's path: youtu.be/<id> and
+    youtube.com/shorts/<id>. None for every other path (watch, playlist, channel)."""
+    segments = [s for s in path.split("/") if s]
+    if domain == "youtu.be":
+        return segments[0] if segments else None
+    if len(segments) >= 2 and segments[0] == "shorts":
+        return segments[1]
+    return None
+
+
 def _last(args: dict[str, list[str]], key: str) -> Optional[str]:
     """Last value of a repeated query key. Matches a left-to-right scan in which
     each assignment overwrites the one before."""
@@ -267,7 +287,7 @@ def parse_url(url: str) -> Union[SpotifySource, YTSource, SoundcloudSource]:
     # query — which is exactly the shape users paste.
     args = parse_qs(urlsplit(url).query)
 
-    if domain in ("youtube.com", "youtu.be"):
+    if domain in _YOUTUBE_HOSTS:
         ts: Optional[int] = None
         list_id: Optional[str] = None
         # `t` and `ts` are the same parameter under two names; `ts` wins if a URL
@@ -292,7 +312,7 @@ def parse_url(url: str) -> Union[SpotifySource, YTSource, SoundcloudSource]:
         index: Optional[int] = (
             _playlist_index(raw_index) if raw_index is not None else None
         )
-        video_id = _last(args, "v")
+        video_id = _last(args, "v") or _youtube_path_id(domain, domain_match.group(4))
         if list_id is not None:
             return YTSource(
                 url,
@@ -309,6 +329,7 @@ def parse_url(url: str) -> Union[SpotifySource, YTSource, SoundcloudSource]:
             url,
             ts=ts,
             process=False,
+            video_id=video_id,
             bad_timestamp=bad_timestamp,
             query_source=QUERY_SOURCE_YOUTUBE,
         )
@@ -340,6 +361,28 @@ def parse_url(url: str) -> Union[SpotifySource, YTSource, SoundcloudSource]:
         raise ValueError(f"Not a recognised URL: {url!r}")
 
 
+def canonical_id(text: str) -> Optional[str]:
+    """The extractor+ID a link names — `youtube:<id>` for every spelling of a
+    YouTube video (watch?v= with any extra params, youtu.be, shorts, the m. and
+    music. hosts) — or None for a search, a playlist link, another site, or a link
+    that names no video. What src.youtube keys its caches on, so the spellings of
+    one video share one entry."""
+    try:
+        source = parse_url(text.strip())
+    # ValueError is "not a URL" — a search. The Spotify branch raises a bare
+    # Exception (or IndexError) for a malformed path; none of these name a video.
+    except Exception:
+        return None
+    if (
+        not isinstance(source, YTSource)
+        or source.stype is not URLSource.YOUTUBE
+        or source.type is YTType.PLAYLIST
+        or not source.video_id
+    ):
+        return None
+    return f"youtube:{source.video_id}"
+
+
 def unquote_argument(text: str) -> str:
     """Drop one matched pair of surrounding quotes.
 
@@ -0,0 +1,196 @@
+"""Keeps the stream URLs of the songs about to play fresh in the cache.
+
+A cached stream URL lives at most _STREAM_URL_MAX_TTL (30 minutes), and a queue
+longer than that outlives the entries its songs were prefetched into: by the time
+such a song comes up, its entry is gone and _resolve_playable_stream pays a fresh
+extraction while the channel waits. StreamRefresher looks at the next few songs of
+every guild's queue on a fixed tick and re-extracts those whose entries are about
+to run out — or already have — before anybody is waiting on them.
+
+Spending is bounded process-wide, not per guild: at most STREAM_REFRESH_BUDGET
+songs per tick, the ones closest to expiring first, submitted one batch at a time
+(YTDL.prefetch_streams) at PREFETCH priority. A thousand guilds with long queues
+cost the pool the same as one.
+
+A restart is the exception that budget cannot serve: every restored queue comes
+back at once, its entries expired or close to it, and a tick's handful would take
+an hour to get through them. warm_up() is a one-off pass for that moment — the
+head of every restored queue, read in one MGET, its misses extracted straight away.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+from opentelemetry import trace
+
+from src.redis_client import cache_get_many, cache_ttls
+from src.telemetry import get_tracer
+from src.util import cancel_task, get_logger
+from src.youtube import YTDL, QueueObject, guild_of, stream_cache_key
+from src.ytdlp_pool import ExtractPriority
+
+log = get_logger(__name__)
+_tracer = get_tracer(__name__)
+
+# Pending songs per guild kept fresh: the next few are the ones a transition is
+# about to reach, and anything deeper would be refreshed again before it plays.
+_REFRESH_AHEAD = int(os.environ.get("STREAM_REFRESH_AHEAD", "3"))
+# An entry with less than this left is refreshed. Must exceed the tick, or an entry
+# can expire between two looks at it.
+_REFRESH_LEAD_SECS = float(os.environ.get("STREAM_REFRESH_LEAD_SECS", "300"))
+# Songs re-extracted per tick across every guild; 0 turns the refresher off.
+_REFRESH_BUDGET = int(os.environ.get("STREAM_REFRESH_BUDGET", "4"))
+_REFRESH_TICK_SECS = float(os.environ.get("STREAM_REFRESH_TICK_SECS", "60"))
+# A song refreshed this recently that still has no fresh entry is one the cache
+# declines (no usable expiry — SoundCloud) or one that will not extract. Retried
+# every tick, it would take the budget from every song that can be helped.
+_RETRY_AFTER_SECS = 600.0
+
+# Pending songs per restored queue the startup warm-up checks; 0 turns it off.
+# Deeper than _REFRESH_AHEAD: nothing has been prefetched since the restart, and
+# the ticks only keep up with entries once they exist.
+_WARMUP_AHEAD = int(os.environ.get("STREAM_WARMUP_AHEAD", "5"))
+# How long the warm-up waits for the restores before warming whatever is back. A
+# restore stuck on a voice connect must not hold up every other guild's songs.
+_WARMUP_WAIT_SECS = float(os.environ.get("STREAM_WARMUP_WAIT_SECS", "30"))
+# Guild batches the warm-up has in the pool at once. The pool schedules them below
+# every user-facing job anyway; this bounds the probes they fire on landing.
+_WARMUP_CONCURRENCY = 4
+
+
+class StreamRefresher:
+    """The refresh loop. `upcoming` returns the songs it may refresh — the next
+    `n` pending QueueObjects of every guild (MusicBot._upcoming_songs) — so this
+    class never reaches into the players itself."""
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        upcoming: Callable[[int], Iterable[QueueObject]],
+    ) -> None:
+        self._redis = redis
+        self._upcoming = upcoming
+        self._task: Optional[asyncio.Task[None]] = None
+        # webpage_url → monotonic time of its last refresh. Loop-thread only.
+        self._refreshed_at: dict[str, float] = {}
+
+    def start(self) -> None:
+        if _REFRESH_BUDGET <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run(), name="stream-refresher")
+
+    async def stop(self) -> None:
+        """Cancel the loop. A refresh in flight is cancelled with it, which aborts
+        its extraction in the worker (YtdlpPool.run)."""
+        task, self._task = self._task, None
+        await cancel_task(task)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(_REFRESH_TICK_SECS)
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                # Nothing here is worth the loop: the next tick looks again, and a
+                # song it misses is only a fresh extraction at play time.
+                log.warning(f"stream refresh tick failed: {type(e).__name__}: {e}")
+
+    @_tracer.start_as_current_span("stream_refresher.refresh")
+    async def refresh_once(self) -> int:
+        """One tick: find the upcoming songs whose entries are due and refresh
+        them, most urgent first, within the budget. Returns how many were sent."""
+        span = trace.get_current_span()
+        songs: dict[str, QueueObject] = {}
+        for qo in self._upcoming(_REFRESH_AHEAD):
+            songs.setdefault(qo.webpage_url, qo)
+        now = time.monotonic()
+        self._refreshed_at = {
+            url: at
+            for url, at in self._refreshed_at.items()
+            if now - at < _RETRY_AFTER_SECS
+        }
+        candidates = [qo for url, qo in songs.items() if url not in self._refreshed_at]
+        span.set_attribute("refresh.upcoming", len(songs))
+        if not candidates:
+            return 0
+        ttls = await cache_ttls(
+            self._redis, [stream_cache_key(qo.webpage_url) for qo in candidates]
+        )
+        if ttls is None:
+            return 0  # Redis is unreachable; so is every entry a refresh would write
+        due = sorted(
+            (
+                (ttl, qo)
+                for ttl, qo in zip(ttls, candidates)
+                if ttl < _REFRESH_LEAD_SECS
+            ),
+            key=lambda pair: pair[0],
+        )[:_REFRESH_BUDGET]
+        span.set_attribute("refresh.due", len(due))
+        # One batch per guild, so each is scheduled under its own guild's share.
+        by_guild: dict[Optional[int], list[QueueObject]] = {}
+        for _, qo in due:
+            by_guild.setdefault(guild_of(qo.requester), []).append(qo)
+            self._refreshed_at[qo.webpage_url] = now
+        for batch in by_guild.values():
+            # In turn, not gathered: the refresher holds at most one pool job.
+            await YTDL.prefetch_streams(
+                batch,
+                self._redis,
+                priority=ExtractPriority.PREFETCH,
+                refresh=True,
+            )
+        return len(due)
+
+    @_tracer.start_as_current_span("stream_refresher.warm_up")
+    async def warm_up(self, restored: Coroutine[Any, Any, object]) -> int:
+        """The startup pass (module docstring). Waits for `restored` — the guilds'
+        restores coming back, queues included — or _WARMUP_WAIT_SECS, then reads the
+        stream entries of the next _WARMUP_AHEAD songs of every queue in one MGET
+        and extracts the misses at PREFETCH priority, a batch per guild. Returns how
+        many songs were sent for extraction."""
+        span = trace.get_current_span()
+        if _WARMUP_AHEAD <= 0:
+            restored.close()
+            return 0
+        try:
+            await asyncio.wait_for(restored, _WARMUP_WAIT_SECS)
+        except TimeoutError:
+            # Warm what is back; a guild restored later is the ticks' to catch.
+            span.set_attribute("warmup.timed_out", True)
+        songs: dict[str, QueueObject] = {}
+        for qo in self._upcoming(_WARMUP_AHEAD):
+            songs.setdefault(qo.webpage_url, qo)
+        span.set_attribute("warmup.upcoming", len(songs))
+        if not songs:
+            return 0
+        cached = await cache_get_many(
+            self._redis, [stream_cache_key(url) for url in songs]
+        )
+        misses = [qo for qo, entry in zip(songs.values(), cached) if entry is None]
+        span.set_attribute("warmup.misses", len(misses))
+        now = time.monotonic()
+        by_guild: dict[Optional[int], list[QueueObject]] = {}
+        for qo in misses:
+            by_guild.setdefault(guild_of(qo.requester), []).append(qo)
+            # The first tick would otherwise send a song this pass could not warm
+            # straight back to the pool.
+            self._refreshed_at[qo.webpage_url] = now
+        slots = asyncio.Semaphore(_WARMUP_CONCURRENCY)
+
+        async def warm(batch: list[QueueObject]) -> None:
+            async with slots:
+                # refresh=True: these are known misses, the MGET above was the read.
+                await YTDL.prefetch_streams(
+                    batch,
+                    self._redis,
+                    priority=ExtractPriority.PREFETCH,
+                    refresh=True,
+                )
+
+        await asyncio.gather(*(warm(batch) for batch in by_guild.values()))
+        return len(misses)
@@ -9,12 +9,13 @@ if TYPE_CHECKING:
 
 import structlog
 from structlog.typing import EventDict, WrappedLogger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.context import Context
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME
 from opentelemetry.sdk.trace.sampling import (
     ALWAYS_ON,
     Decision,
+    ParentBased,
     Sampler,
     SamplingResult,
 )
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     # exporter stack loads only when telemetry is enabled; these type-only imports let
     # the globals below keep their real types.
     from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk.metrics import MeterProvider
     from opentelemetry.sdk.trace import TracerProvider
 
 _SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "discord-music-bot")
@@ -37,6 +39,7 @@ _OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317
 
 _tracer_provider: Optional["TracerProvider"] = None
 _log_provider: Optional["LoggerProvider"] = None
+_meter_provider: Optional["MeterProvider"] = None
 # Separate from _tracer_provider: with OTEL_SDK_DISABLED=true no provider is ever
 # built, so that global cannot serve as the double-call guard on the disabled path.
 _setup_done = False
@@ -53,9 +56,13 @@ _DISCORD_INTERNAL_URL_PATTERNS = (
 
 
 class _DiscordGatewayFilter(Sampler):
-    """Drop discord.py-internal aiohttp spans that have no user-visible parent."""
+    """Drop discord.py-internal aiohttp spans that have no user-visible parent.
 
-    def __init__(self, inner: Sampler = ALWAYS_ON) -> None:
+    The inner default is parent-based, so a span under a remote parent follows the
+    parent's sampled flag — the yt-dlp service's spans under a bot's — while every
+    root is still sampled."""
+
+    def __init__(self, inner: Sampler = ParentBased(ALWAYS_ON)) -> None:
         self._inner = inner
 
     def should_sample(
@@ -93,6 +100,7 @@ def setup_telemetry() -> None:
         return
     _setup_traces()
     _setup_logs()
+    _setup_metrics()
     _setup_auto_instrumentation()
 
 
@@ -104,12 +112,22 @@ def shutdown_telemetry() -> None:
     if _log_provider is not None:
         _log_provider.force_flush()
         _log_provider.shutdown()
+    if _meter_provider is not None:
+        _meter_provider.force_flush()
+        _meter_provider.shutdown()
 
 
 def get_tracer(name: str) -> trace.Tracer:
     return trace.get_tracer(name)
 
 
+def get_meter(name: str) -> metrics.Meter:
+    """A meter whose instruments may be created at import: until _setup_metrics()
+    installs the SDK provider they are the API's proxies, no-ops that start
+    recording once it does — and stay no-ops under OTEL_SDK_DISABLED=true."""
+    return metrics.get_meter(name)
+
+
 def configure_worker_logging(log_queue: Optional["Queue"] = None) -> None:
     """Configure structured logging inside a yt-dlp pool worker (called via
     ytdlp_pool._worker_init, which wraps this so a failure can't break the pool). With a
@@ -237,6 +255,28 @@ def _setup_logs() -> None:
     logging.root.addHandler(handler)
 
 
+def _setup_metrics() -> None:
+    global _meter_provider
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+        OTLPMetricExporter,
+    )
+
+    resource = Resource.create(
+        {
+            SERVICE_NAME: _SERVICE_NAME,
+            ResourceAttributes.DEPLOYMENT_ENVIRONMENT: config.ENVIRONMENT,
+        }
+    )
+    exporter = OTLPMetricExporter(endpoint=_OTLP_ENDPOINT, insecure=True)
+    provider = MeterProvider(
+        resource=resource, metric_readers=[PeriodicExportingMetricReader(exporter)]
+    )
+    metrics.set_meter_provider(provider)
+    _meter_provider = provider
+
+
 def _setup_auto_instrumentation() -> None:
     from opentelemetry.instrumentation.redis import RedisInstrumentor
     from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
@@ -1,8 +1,9 @@
 import asyncio
 import contextlib
+import math
 import re
 from typing import Any, Final, Optional
-from collections.abc import AsyncGenerator, Coroutine
+from collections.abc import AsyncGenerator, Collection, Coroutine
 
 import discord
 import structlog
@@ -144,6 +145,15 @@ def fmt_duration(secs: int) -> str:
     return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
 
 
+def percentile(samples: Collection[float], q: float) -> Optional[float]:
+    """The q-quantile of `samples` by nearest rank: an observed value, never an
+    interpolation between two. None for no samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
 def pluralize(count: int, singular: str, plural: Optional[str] = None) -> str:
     """The noun form matching `count`: pluralize(1, "song") → "song",
     pluralize(3, "song") → "songs". `plural` overrides the default `+ "s"`."""
@@ -1,11 +1,18 @@
+import asyncio
 import copy
 import os
+import pickle
+import queue
 import re
+import threading
 import time
+from collections import Counter, deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import cache, partial
 from typing import Any, Optional, TypedDict, Union, cast
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlparse, urlsplit
 
 import aiohttp
 import discord
@@ -17,18 +24,45 @@ from opentelemetry import trace
 from opentelemetry.trace import StatusCode
 
 from src.guild_state import ANALYTICS_ZERO, Analytics
-from src.redis_client import cache_del, cache_get, cache_set
-from src.telemetry import get_tracer
-from src.util import fmt_duration, get_logger
-from src.ytdlp_pool import YtdlpPool
+from src.redis_client import (
+    cache_del,
+    cache_get,
+    cache_get_many,
+    cache_set,
+    cache_set_many,
+)
+from src.sources import canonical_id
+from src.telemetry import get_meter, get_tracer
+from src.util import fmt_duration, get_logger, percentile
+from src.ytdlp_pool import ExtractPriority, YtdlpPool
+from src.ytdlp_service import RemoteYtdlpPool, make_pool
 
 log = get_logger(__name__)
 _tracer = get_tracer(__name__)
+_meter = get_meter(__name__)
+_EXTRACT_FAILURES = _meter.create_counter(
+    "ytdlp.extract.failures",
+    description="Failed extraction jobs by ExtractionError.kind and opts profile.",
+)
+_HEDGES = _meter.create_counter(
+    "ytdlp.extract.hedges",
+    description="Second attempts at a stalled playback-critical extraction, by winner.",
+)
+_READAHEAD_UNDERRUNS = _meter.create_counter(
+    "ytdl.readahead.underruns",
+    description="Voice-player reads that found the read-ahead buffer empty.",
+)
+_READAHEAD_STALL = _meter.create_histogram(
+    "ytdl.readahead.stall",
+    unit="s",
+    description="How long an underrun held the voice player waiting on ffmpeg.",
+)
 
 # The process's one extraction pool. A module-level *binding*, not mutable state:
 # production never reassigns it and the lifecycle lives on the object
 # (src/ytdlp_pool.py). Tests patch this name to swap in a thread-pool-backed instance.
-ytdlp_pool = YtdlpPool()
+# In-process unless YTDLP_SERVICE_ADDRESS names a shared service (src/ytdlp_service.py).
+ytdlp_pool: Union[YtdlpPool, RemoteYtdlpPool] = make_pool()
 
 
 class ExtractionError(Exception):
@@ -47,6 +81,7 @@ class ExtractionError(Exception):
         video_id: str = "",
         cause_type: str = "",
         unsupported: bool = False,
+        remembered: bool = False,
     ) -> None:
         super().__init__(message)
         self.message = message
@@ -58,6 +93,9 @@ class ExtractionError(Exception):
         # where the original structure still exists; yt_source reads it to surface
         # "not a site I can play" instead of the generic extractor error.
         self.unsupported = unsupported
+        # Served from the negative cache (_known_unplayable), not from a fresh
+        # extraction: the same reason, remembered from an earlier attempt.
+        self.remembered = remembered
 
     @property
     def user_message(self) -> str:
@@ -73,7 +111,21 @@ class ExtractionError(Exception):
         message = self.message
         if message.startswith(prefix):
             message = message[len(prefix) :]
-        return message or "Couldn't load this track."
+        message = message or "Couldn't load this track."
+        if self.remembered:
+            return f"{message} (known unplayable — not retried for a while)"
+        return message
+
+    @property
+    def kind(self) -> str:
+        """A low-cardinality class for metrics and -debug. The two yt-dlp already
+        names come first; otherwise the cause (a TransportError, an HTTPError) says
+        more than the DownloadError every extract_info failure is wrapped in."""
+        if self.unsupported:
+            return "unsupported"
+        if self.expected:
+            return "unavailable"
+        return self.cause_type or self.original_type or "unknown"
 
 
 def _classify_ytdlp_error(e: BaseException) -> ExtractionError:
@@ -113,18 +165,13 @@ class YTDLVideoMetadata(TypedDict, total=False):
 
     title: str
     uploader: str
-    uploader_url: str
-    upload_date: str
     thumbnail: str
-    description: str
     # float, not int: yt-dlp's SoundCloud extractor emits `float_or_none(scale=1000)`
     # (fixtures show 942.762) and this bot accepts SoundcloudSource. Every read below
     # wraps this in int() — that is the conversion, not a redundancy.
     duration: float
-    tags: list[str]
     view_count: int
     like_count: int
-    dislike_count: int
     abr: float
     asr: int
     acodec: str
@@ -134,6 +181,11 @@ class YTDLVideoMetadata(TypedDict, total=False):
     format_id: str
     protocol: str
     vcodec: str
+    # The lighter Opus rung from the same extraction (_lite_rung), served instead
+    # of `url` to a low-bitrate voice channel — see _audio_rung.
+    lite_url: str
+    lite_abr: float
+    lite_format_id: str
 
 
 class YTDLVideoInfo(YTDLVideoMetadata, _YTDLVideoInfoRequired, total=False):
@@ -166,52 +218,84 @@ class YTDLExtractResult(YTDLEntry, total=False):
     entries: list[Optional[YTDLEntry]]
 
 
-# Collections no caller reads once process=True has hoisted the *served* format's
-# fields to the top level: the whole `formats` ladder plus thumbnails/captions/etc.,
-# commonly 100 KB-1 MB pickled worker->parent per extraction, so it is dropped in the
-# worker. `_STREAM_CACHE_FIELDS` is the exhaustive list of what callers do consume.
-_UNUSED_INFO_COLLECTIONS = frozenset(
-    {
-        "formats",
-        "requested_formats",
-        "requested_downloads",
-        "thumbnails",
-        "automatic_captions",
-        "subtitles",
-        "heatmap",
-        "chapters",
-    }
-)
+# What a flat playlist entry's `url` is when it carries no information: yt_playlist
+# rebuilds exactly this from the `id` when `url` is absent.
+_WATCH_URL = "https://www.youtube.com/watch?v="
 
 
-# Bound once at import to the real staticmethod rather than looked up per call, so
-# slimming survives tests patching `youtube_dl.YoutubeDL` wholesale (which would
-# otherwise stub out sanitize_info).
-_sanitize_info = youtube_dl.YoutubeDL.sanitize_info
+def _project_info(info: dict[str, Any]) -> dict[str, Any]:
+    """One info-dict (or entry) reduced to _RESULT_FIELDS. Every field there is a
+    scalar, so a value of any other type — or None — is dropped as absent, which is
+    what guarantees the result pickles (and JSON-encodes for the caches)."""
+    projected = {
+        key: value
+        for key in _RESULT_FIELDS
+        if isinstance(value := info.get(key), (str, int, float))
+    }
+    if projected.get("url") == _WATCH_URL + str(projected.get("id")):
+        del projected["url"]
+    projected.update(_lite_rung(info))
+    return projected
+
+
+def _lite_rung(info: dict[str, Any]) -> dict[str, Any]:
+    """The lite_* fields for `info`: its best audio-only Opus format at or under
+    _LITE_RUNG_MAX_ABR, picked from the ladder the extraction already holds — a
+    low-bitrate channel is served it without a second extraction, and the stream
+    cache stays one entry per video. Empty when there is none, or when it is the
+    format yt-dlp chose anyway (a video whose top Opus rung is already light)."""
+    formats = info.get("formats")
+    if not isinstance(formats, Sequence):
+        return {}
+    best: Optional[dict[str, Any]] = None
+    for fmt in formats:
+        if not isinstance(fmt, dict):
+            continue
+        abr = fmt.get("abr")
+        if (
+            fmt.get("acodec") == "opus"
+            and fmt.get("vcodec") == "none"
+            and fmt.get("protocol") == "https"
+            and isinstance(fmt.get("url"), str)
+            and isinstance(abr, (int, float))
+            and abr <= _LITE_RUNG_MAX_ABR
+            and (best is None or abr > best["abr"])
+        ):
+            best = fmt
+    if best is None or best.get("format_id") == info.get("format_id"):
+        return {}
+    return {
+        "lite_url": best["url"],
+        "lite_abr": best["abr"],
+        "lite_format_id": str(best.get("format_id", "")),
+    }
 
 
 def _slim_info(info: Any) -> Optional[YTDLExtractResult]:
-    """Make a yt-dlp result cheap and safe to ship back from the worker: sanitize_info()
-    reduces the live objects a process=True info-dict carries (LazyList format ladders,
-    a _YDLLogger, callables) to JSON primitives, without which every extraction fails on
-    an opaque pickling error. The large collections it keeps but no caller reads are
-    dropped here too, top level and per `entries` element.
+    """Make a yt-dlp result cheap and safe to ship back from the worker. A projection,
+    not a trim: only _RESULT_FIELDS survive, top level and per `entries` element, so
+    what crosses the boundary is exactly what some caller reads — a process=True dict
+    carries live objects (LazyList format ladders, a _YDLLogger, callables) and
+    commonly 100 KB-1 MB beside them, and a long flat playlist repeats a thumbnail
+    ladder, channel fields and a redundant watch URL per entry, multi-megabyte
+    pickles decoded on the parent's side. Cheaper in the worker too: nothing walks
+    the format ladder (sanitize_info() used to, to make it picklable).
     """
-    info = _sanitize_info(info)
     if not isinstance(info, dict):
-        # extract_info and sanitize_info only ever return a dict or None.
+        # extract_info only ever returns a dict or None.
         return None
-    for key in _UNUSED_INFO_COLLECTIONS:
-        info.pop(key, None)
+    projected = _project_info(info)
     entries = info.get("entries")
-    if isinstance(entries, list):
-        for entry in entries:
-            if isinstance(entry, dict):
-                for key in _UNUSED_INFO_COLLECTIONS:
-                    entry.pop(key, None)
+    if entries is not None:
+        # Null entries (deleted/private videos) keep their place: yt_playlist logs
+        # them by index.
+        projected["entries"] = [
+            _project_info(entry) if isinstance(entry, dict) else None
+            for entry in entries
+        ]
     # cast, not a bare annotation: the checker cannot verify yt-dlp's untyped dict
     # conforms, and `grep cast(` is how those assertions are audited.
-    return cast(YTDLExtractResult, info)
+    return cast(YTDLExtractResult, projected)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -230,34 +314,366 @@ class ExtractRequest:
     process: bool = True
 
 
+@dataclass(slots=True)
+class _WorkerYdl:
+    """One worker's reusable YoutubeDL for one opts profile, plus what a reset needs.
+    `cls` is the class it was built from, so a test patching `youtube_dl.YoutubeDL`
+    never receives an instance built from the real class (or a previous patch)."""
+
+    cls: Any
+    ydl: Any
+    params: dict[str, Any]
+
+
+# Worker-process state: an idle YoutubeDL per opts profile. Constructing one re-runs
+# extractor registration, plugin discovery (the bgutil PO-token provider) and JS
+# runtime setup — pure CPU on a GIL-bound worker, paid before every extraction. Check-out
+# / check-in rather than shared: the thread-pool seam runs several extractions in one
+# process at once, and a YoutubeDL is not safe to drive from two threads.
+_idle_ydls: dict[bytes, _WorkerYdl] = {}
+
+# The counters and per-run collections YoutubeDL advances during extract_info, restored
+# to their __init__ values between uses. Names checked against yt-dlp's __init__ on
+# every bump, like the client strategy below — a rename leaves the reset a no-op for
+# that field, never an error.
+_YDL_RUN_STATE: tuple[tuple[str, Any], ...] = (
+    ("_download_retcode", 0),
+    ("_num_downloads", 0),
+    ("_num_videos", 0),
+    ("_playlist_level", 0),
+)
+_YDL_RUN_COLLECTIONS = ("_playlist_urls", "_printed_messages")
+
+
+def _opts_fingerprint(opts: Any) -> Optional[bytes]:
+    """The cache key for an opts profile. By value, not identity: in a real worker
+    every request arrives freshly unpickled, so the same profile is a new dict each
+    call. None for opts that will not pickle — those are simply not reused."""
+    try:
+        return pickle.dumps(opts, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def _snapshot_params(params: dict[str, Any]) -> dict[str, Any]:
+    # One level deep: __init__ leaves sets, lists and dicts (compat_opts, _warnings,
+    # http_headers) in params, and an extractor appending to one would otherwise carry
+    # that into the next extraction.
+    return {
+        k: copy.copy(v) if isinstance(v, (dict, list, set)) else v
+        for k, v in params.items()
+    }
+
+
+def _checkout_ydl(opts: Any) -> tuple[Optional[bytes], _WorkerYdl]:
+    """A YoutubeDL for `opts`, reset to its just-constructed state: reused when this
+    worker has an idle one for the profile, built otherwise."""
+    key = _opts_fingerprint(opts)
+    cached = _idle_ydls.pop(key, None) if key is not None else None
+    if cached is not None and cached.cls is youtube_dl.YoutubeDL:
+        ydl = cached.ydl
+        ydl.params.clear()
+        ydl.params.update(_snapshot_params(cached.params))
+        for name, value in _YDL_RUN_STATE:
+            if hasattr(ydl, name):
+                setattr(ydl, name, value)
+        for name in _YDL_RUN_COLLECTIONS:
+            collection = getattr(ydl, name, None)
+            if isinstance(collection, set):
+                collection.clear()
+        # Cookies a fresh instance would never have seen. Load-bearing for the same
+        # reason as the probe session's DummyCookieJar: `-play <any url>` reaches the
+        # generic extractor, and a cookie that site sets must not ride along into the
+        # next guild's YouTube extraction.
+        ydl.cookiejar.clear()
+        return key, cached
+    if cached is not None:
+        _discard_ydl(cached)
+    # YoutubeDL.__init__ keeps the params dict by reference and writes into it
+    # (js_runtimes, http_headers, …); the copy keeps the opts profile immutable
+    # across repeated extractions within a worker.
+    ydl = youtube_dl.YoutubeDL(copy.copy(opts))
+    return key, _WorkerYdl(
+        cls=youtube_dl.YoutubeDL, ydl=ydl, params=_snapshot_params(ydl.params)
+    )
+
+
+def _checkin_ydl(key: Optional[bytes], entry: _WorkerYdl) -> None:
+    """Return an instance for reuse. A second instance for the same profile (two
+    concurrent extractions under the thread seam) is closed rather than kept."""
+    if key is not None and _idle_ydls.setdefault(key, entry) is entry:
+        return
+    _discard_ydl(entry)
+
+
+def _discard_ydl(entry: _WorkerYdl) -> None:
+    try:
+        entry.ydl.close()
+    except Exception as e:
+        log.debug(f"closing a discarded YoutubeDL raised: {e}")
+
+
 def _ytdlp_extract(req: ExtractRequest) -> Optional[YTDLExtractResult]:
     """Extraction worker run in the process pool. Top-level so it's picklable and
     named in tracebacks. Takes the whole request as one argument so no call in the
     chain depends on the order of two interchangeable bools."""
     url, opts = req.url, req.opts
     download, process = req.download, req.process
-    # YoutubeDL.__init__ keeps the params dict by reference and writes into it
-    # (js_runtimes, http_headers, …); the copy keeps the opts profile immutable
-    # across repeated extractions within a worker.
+    key, entry = _checkout_ydl(opts)
     try:
-        result = youtube_dl.YoutubeDL(copy.copy(opts)).extract_info(
-            url, download=download, process=process
-        )
+        result = entry.ydl.extract_info(url, download=download, process=process)
     except YoutubeDLError as e:
+        # yt-dlp's own failure (a private video, a geo-block) leaves the instance as
+        # reusable as a success does; dead playlist entries must not force rebuilds.
+        _checkin_ydl(key, entry)
         # `from e`, not `from None`: the stdlib stringifies the whole chain into the
         # parent's __cause__ (_RemoteTraceback), preserving the original traceback.
         raise _classify_ytdlp_error(e) from e
+    except BaseException:
+        # Anything else says nothing about what state the instance was left in.
+        _discard_ydl(entry)
+        raise
+    _checkin_ydl(key, entry)
     # Slimmed in the worker, not the parent, to keep the unpicklable/oversized
     # payload from ever entering the pool's result queue.
     return _slim_info(result)
 
 
-async def _run_extract(req: ExtractRequest) -> Optional[YTDLExtractResult]:
-    """Await a yt-dlp extraction on the shared process pool — the single call site for
-    _ytdlp_extract, so every extraction path keeps the pool binding in one place. Both
-    module-level names it reads (`ytdlp_pool`, `_ytdlp_extract`) are resolved per call,
-    not captured; that is what keeps the seams the test suite patches working."""
-    return await ytdlp_pool.run(_ytdlp_extract, req)
+def _ytdlp_extract_batch(
+    reqs: tuple[ExtractRequest, ...],
+) -> list[Union[Optional[YTDLExtractResult], ExtractionError]]:
+    """Several extractions as one pool job, run back to back in one worker: one
+    submission and one result instead of N, and every request after the first checks
+    out the instance the one before it checked in, with its extractors' player JS
+    and PO tokens already fetched. A yt-dlp failure (a private video in a playlist)
+    lands in its own slot rather than failing its neighbours; anything else fails
+    the job, as it would a single extraction."""
+    outcomes: list[Union[Optional[YTDLExtractResult], ExtractionError]] = []
+    for req in reqs:
+        try:
+            outcomes.append(_ytdlp_extract(req))
+        except ExtractionError as e:
+            outcomes.append(e)
+    return outcomes
+
+
+@dataclass(slots=True)
+class _Flight:
+    """One in-flight extraction and who is waiting on it. `priority` is what the job
+    was submitted at (see _run_extract); `waiters` counts the callers still awaiting
+    it, so the last one to be cancelled can abort the job itself."""
+
+    task: asyncio.Task[Optional[YTDLExtractResult]]
+    priority: ExtractPriority
+    waiters: int = 0
+
+
+# Extractions currently in the pool, keyed by _flight_key. An identical request that
+# arrives while one is running awaits that job instead of submitting its own — several
+# guilds playing the same trending video miss the caches together, and each duplicate
+# otherwise holds a worker for the full 3-5s. In-process only: across processes the
+# ytdl:source/ytdl:stream write that ends the first extraction already serves the rest.
+_inflight: dict[tuple[str, int, bool, bool], _Flight] = {}
+
+# Hedging (_hedged_run). An extraction not back by the YTDLP_HEDGE_PERCENTILE of
+# recent ones gets a second attempt on another worker; 0 turns hedging off. The
+# deadline never drops below YTDLP_HEDGE_MIN_SECS, which is also the deadline until
+# _HEDGE_MIN_SAMPLES extractions have been timed: hedging a healthy 3 s extraction
+# doubles the pool's load for nothing.
+_HEDGE_PERCENTILE = float(os.environ.get("YTDLP_HEDGE_PERCENTILE", "0.95"))
+_HEDGE_MIN_SECS = float(os.environ.get("YTDLP_HEDGE_MIN_SECS", "4"))
+_HEDGE_MIN_SAMPLES = 20
+# Time to a result for recent hedge-eligible extractions, queue wait included — the
+# wait a user hears. Loop-thread only.
+_extract_times: deque[float] = deque(maxlen=256)
+
+
+def _flight_key(req: ExtractRequest) -> tuple[str, int, bool, bool]:
+    """What makes two requests the same extraction. The opts profile by identity, not
+    value: every call site passes one of the module-level dicts, and a dict is not
+    hashable. The request holds its opts for the life of the flight, so the id cannot
+    be recycled while the entry exists."""
+    return (req.url, id(req.opts), req.download, req.process)
+
+
+# Failed jobs by kind since start, for -debug (extraction_failures). One count per
+# job, not per waiter: _land_flight runs once per flight. Loop-thread only.
+_failure_counts: Counter[str] = Counter()
+
+
+def extraction_failures() -> list[tuple[str, int]]:
+    """Failed extraction jobs by kind, most frequent first."""
+    return _failure_counts.most_common()
+
+
+def _profile_of(req: ExtractRequest) -> str:
+    """The opts profile's name, for metric attributes. By identity, like
+    _flight_key — every call site passes one of the module-level dicts."""
+    if req.opts is _YTDL_STREAM_OPTS:
+        return "stream"
+    if req.opts is _YTDL_STREAM_SEARCH_OPTS:
+        return "search"
+    if req.opts is _YTDL_PLAYLIST_OPTS:
+        return "playlist"
+    return "other"
+
+
+def _land_flight(
+    key: tuple[str, int, bool, bool],
+    profile: str,
+    flight: asyncio.Task[Optional[YTDLExtractResult]],
+) -> None:
+    # Identity-checked: a flight from a previous event loop (tests run one per test)
+    # may have been superseded under the same key, as may one a more urgent request
+    # declined to join.
+    entry = _inflight.get(key)
+    if entry is not None and entry.task is flight:
+        del _inflight[key]
+    # Retrieved here so a flight whose every waiter was cancelled does not log
+    # "exception was never retrieved" — each waiter that is still there re-raises it.
+    if flight.cancelled():
+        return
+    error = flight.exception()
+    if error is not None:
+        _count_failure(error, profile)
+
+
+def _count_failure(error: BaseException, profile: str) -> None:
+    kind = error.kind if isinstance(error, ExtractionError) else type(error).__name__
+    _failure_counts[kind] += 1
+    _EXTRACT_FAILURES.add(1, {"kind": kind, "profile": profile})
+
+
+def _hedge_delay() -> Optional[float]:
+    """How long the first attempt runs alone; None when hedging is off."""
+    if _HEDGE_PERCENTILE <= 0:
+        return None
+    if len(_extract_times) < _HEDGE_MIN_SAMPLES:
+        return _HEDGE_MIN_SECS
+    return max(_HEDGE_MIN_SECS, percentile(_extract_times, _HEDGE_PERCENTILE) or 0.0)
+
+
+async def _hedged_run(
+    req: ExtractRequest,
+    *,
+    priority: ExtractPriority,
+    guild_id: Optional[int],
+    label: str,
+) -> Optional[YTDLExtractResult]:
+    """One flight's pool work. Most extractions finish in 2–4 s, but one that meets
+    yt-dlp's retries (socket_timeout 30, retries 10) or a slow PO-token mint stalls
+    for 20–30 s, and when a user or the playback loop is waiting that is the tail
+    they hear. So playback-critical work (INTERACTIVE, PLAYBACK) that is not back by
+    _hedge_delay() gets a second attempt, queued like any job at the same priority,
+    and whichever finishes first is the outcome — an error included, since an
+    expected one would only repeat. The other is cancelled, which aborts it in its
+    worker (YtdlpPool.run). Background work is never hedged: nobody is waiting."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    critical = priority <= ExtractPriority.PLAYBACK
+
+    def attempt() -> asyncio.Task[Optional[YTDLExtractResult]]:
+        return loop.create_task(
+            ytdlp_pool.run(
+                _ytdlp_extract,
+                req,
+                priority=priority,
+                guild_id=guild_id,
+                label=label,
+            )
+        )
+
+    attempts = [attempt()]
+    try:
+        delay = _hedge_delay() if critical else None
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+        if not done:
+            log.info(
+                f"yt-dlp extraction of {req.url} not back after {delay:.1f}s — hedging"
+            )
+            trace.get_current_span().set_attribute("ytdl.hedged", True)
+            attempts.append(attempt())
+            done, _ = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+        winner = attempts[0] if attempts[0] in done else attempts[1]
+        if len(attempts) > 1:
+            won = "primary" if winner is attempts[0] else "hedge"
+            _HEDGES.add(1, {"winner": won, "profile": label})
+        result = winner.result()
+        if critical:
+            _extract_times.append(loop.time() - started)
+        return result
+    finally:
+        for task in attempts:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # a loser's failure is not news
+
+
+def guild_of(requester: Union[discord.User, discord.Member, None]) -> Optional[int]:
+    """The guild an extraction is scheduled under (YtdlpPool's per-guild flows). The
+    requester is the one guild-scoped thing every entry point already holds; a plain
+    User (no guild) lands in the pool's shared unattributed flow."""
+    guild = getattr(requester, "guild", None)
+    return guild.id if guild is not None else None
+
+
+async def _run_extract(
+    req: ExtractRequest,
+    *,
+    priority: ExtractPriority = ExtractPriority.INTERACTIVE,
+    guild_id: Optional[int] = None,
+) -> Optional[YTDLExtractResult]:
+    """Await a yt-dlp extraction on the shared process pool — the single entry point
+    for _ytdlp_extract (submitted by _hedged_run), so every extraction path keeps the
+    pool binding in one place. Both module-level names it reads (`ytdlp_pool`,
+    `_ytdlp_extract`) are resolved per call, not captured; that is what keeps the
+    seams the test suite patches working.
+
+    Identical in-flight requests share one job and one outcome — the result dict
+    included, which every caller already treats as read-only. The job is shielded:
+    a waiter cancelled mid-extraction (a prefetch a -clear tore down) leaves it
+    running for the others. Only when the last waiter goes is the job itself
+    cancelled, which aborts it in its worker (YtdlpPool.run) — nobody is left to
+    want the result, and the worker is better spent on the next job.
+
+    `priority` is the pool lane (ExtractPriority). A request joins only a flight
+    submitted at its own priority or a more urgent one: a -play must not wait out a
+    prefetch of the same song still queued behind the bulk lane, so it submits its
+    own job, which later arrivals then join instead. A joiner from another guild
+    shares the job as-is; its `guild_id` only matters when it submits. A flight of
+    playback-critical work that stalls is hedged with a second job (_hedged_run).
+    """
+    loop = asyncio.get_running_loop()
+    key = _flight_key(req)
+    profile = _profile_of(req)
+    entry = _inflight.get(key)
+    if (
+        entry is not None
+        and not entry.task.done()
+        # An aborting flight is as good as done: joining it would only inherit the
+        # cancellation.
+        and not entry.task.cancelling()
+        and entry.task.get_loop() is loop
+        and entry.priority <= priority
+    ):
+        trace.get_current_span().set_attribute("ytdl.coalesced", True)
+    else:
+        entry = _Flight(
+            task=loop.create_task(
+                _hedged_run(req, priority=priority, guild_id=guild_id, label=profile)
+            ),
+            priority=priority,
+        )
+        _inflight[key] = entry
+        entry.task.add_done_callback(partial(_land_flight, key, profile))
+    entry.waiters += 1
+    try:
+        return await asyncio.shield(entry.task)
+    finally:
+        entry.waiters -= 1
+        if not entry.waiters and not entry.task.done():
+            entry.task.cancel()
 
 
 class _YtdlpLogger:
@@ -375,6 +791,14 @@ _STREAM_URL_MAX_TTL = 1800  # 30 minutes
 # entry, then the URL that replaces it) and exceeding it costs a cache entry rather
 # than only a verdict. An unconfirmed URL still plays, so firing early is cheap.
 _STREAM_PROBE_TIMEOUT = float(os.environ.get("STREAM_PROBE_TIMEOUT_SECS", "2.0"))
+# How long the probe session remembers a CDN host's address. The host is sticky — a
+# re-extraction comes back on the same `rrN---sn-…` edge — so one lookup can serve
+# every song start for minutes rather than aiohttp's default 10s.
+_PROBE_DNS_CACHE_SECS = int(os.environ.get("STREAM_PROBE_DNS_CACHE_SECS", "300"))
+# A refusal whose body is at most this big is read to the end, which puts its
+# connection back in the pool for the next probe of the same host. An audio body is
+# never read (see _probe_stream_url), so a PLAYABLE verdict still closes its socket.
+_PROBE_DRAIN_MAX_BYTES = 64 * 1024
 
 # Consecutive UNCONFIRMED verdicts before the probe itself, rather than the URLs, is
 # treated as the fault. Its failure modes (blocked egress, DNS, a stalled loop) are
@@ -394,22 +818,58 @@ _UNCONFIRMED_STREAM_TTL = 120  # 2 minutes
 # cached-entry drop is deliberately NOT charged against this.
 _MAX_STREAM_EXTRACTIONS = 1
 
-# Fields to persist in the stream URL cache — strips ephemeral/large fields.
+# How long a permanent extraction failure is remembered (_known_unplayable); 0
+# turns the negative cache off. Short: "removed" is forever, but "private" and a
+# geo-block can be undone, and a stale entry refuses a song nobody can retry.
+_UNPLAYABLE_TTL = int(os.environ.get("YTDL_UNPLAYABLE_TTL_SECS", "900"))
+# yt-dlp messages marked expected that describe this moment rather than the video
+# (the bot check, rate limiting). Matched lowercase against the message.
+_TRANSIENT_MARKERS = ("not a bot", "rate-limit", "rate limit", "try again later")
+
+# Songs per batched extraction job (YTDL.prefetch_streams). Bounded because the job
+# holds one worker for every song in it, back to back, and a cancelled job loses
+# them all; past this a batch is split into several jobs, run one after another.
+_STREAM_BATCH_MAX = 8
+
+# Stream-copy an Opus source into the voice connection instead of decoding and
+# re-encoding it (YTDL.yt_stream). "0" turns it off: every song is transcoded.
+_OPUS_PASSTHROUGH = os.environ.get("YTDL_OPUS_PASSTHROUGH", "1") != "0"
+
+# Voice channels at or under this bitrate (kbps) are served the extraction's lite
+# rung (_lite_rung) instead of `bestaudio`: Discord delivers at most the channel's
+# bitrate, so a 64 kbps channel fed YouTube's ~130 kbps Opus downloads twice what
+# anyone hears. 0 serves every channel the best rung.
+_LITE_CHANNEL_KBPS = int(os.environ.get("YTDL_LITE_CHANNEL_KBPS", "64"))
+# The highest rung that counts as lite: YouTube's middle Opus rung (itag 250) runs
+# ~70 kbps, its top one (251) ~130-160.
+_LITE_RUNG_MAX_ABR = 96
+# Encoder bitrate (kbps) for a transcoded song, or one re-encoded by the gain stage,
+# is the channel's own, capped here — discord.py's default, and what every song was
+# encoded at before: a boosted channel's 384 kbps would only spend bandwidth
+# re-encoding a ~160 kbps source.
+_ENCODER_MAX_KBPS = 128
+
+# Seconds of Opus packets a reader thread keeps buffered ahead of the voice player
+# (YTDL.read), so a CDN stall or an ffmpeg hiccup shorter than this is absorbed
+# instead of reaching Discord as stutter. 0 (the default) reads straight off the
+# pipe on the player thread, as discord.py does.
+_READAHEAD_SECS = float(os.environ.get("YTDL_READAHEAD_SECS", "0"))
+
+# Fields to persist in the stream URL cache — strips ephemeral/large fields, and
+# anything no reader uses: each one is paid for in every entry and every pickled
+# worker result (_RESULT_FIELDS). uploader_url, upload_date and dislike_count were
+# dropped for that reason — nothing displayed them, and YouTube no longer reports
+# dislikes at all.
 _STREAM_CACHE_FIELDS = frozenset(
     {
         "url",
         "webpage_url",
         "title",
         "uploader",
-        "uploader_url",
-        "upload_date",
         "thumbnail",
-        "description",
         "duration",
-        "tags",
         "view_count",
         "like_count",
-        "dislike_count",
         "abr",
         "asr",
         "acodec",
@@ -418,9 +878,20 @@ _STREAM_CACHE_FIELDS = frozenset(
         "format_id",
         "protocol",
         "vcodec",
+        # The lighter rung for low-bitrate channels (_lite_rung), so a cache hit
+        # can serve either.
+        "lite_url",
+        "lite_abr",
+        "lite_format_id",
     }
 )
 
+# Everything any caller reads from an extraction result: a video's fields, plus the
+# `id`/`_type` yt_playlist and yt_source walk a wrapper's entries by. _slim_info
+# projects every result onto this in the worker, so a field read anywhere new must
+# be added here or it silently arrives missing.
+_RESULT_FIELDS = _STREAM_CACHE_FIELDS | {"id", "_type"}
+
 
 # Once per format per process, so a real outage doesn't warn on every song.
 # Optional[str] because an info-dict can omit format_id — that gets its own slot.
@@ -451,8 +922,169 @@ def _record_serving_format(data: YTDLVideoMetadata) -> None:
         )
 
 
-def _stream_cache_key(webpage_url: str) -> str:
-    return f"ytdl:stream:{webpage_url}"
+def _serves_lite(channel_bitrate: Optional[int]) -> bool:
+    """Whether a voice channel of `channel_bitrate` (bps, as discord.py reports it;
+    None when unknown) is served the lite rung."""
+    return channel_bitrate is not None and channel_bitrate <= _LITE_CHANNEL_KBPS * 1000
+
+
+def _encoder_kbps(channel_bitrate: Optional[int]) -> int:
+    """Encoder bitrate for a channel: its own, within what libopus is given by
+    discord.py (16 kbps and up) and _ENCODER_MAX_KBPS."""
+    if channel_bitrate is None:
+        return _ENCODER_MAX_KBPS
+    return max(16, min(_ENCODER_MAX_KBPS, channel_bitrate // 1000))
+
+
+def _audio_rung(data: YTDLVideoInfo, lite: bool) -> YTDLVideoInfo:
+    """`data` as it will be played: the lite rung's URL and shape in place of the
+    primary's when `lite` and the extraction found one, else `data` itself. Never
+    written back — the cache keeps both rungs for every channel."""
+    if not lite or "lite_url" not in data:
+        return data
+    served = data.copy()
+    served["url"] = data["lite_url"]
+    served["abr"] = data.get("lite_abr", 0.0)
+    served["format_id"] = data.get("lite_format_id", "")
+    # What _lite_rung admits, by construction.
+    served["acodec"] = "opus"
+    served["vcodec"] = "none"
+    served["protocol"] = "https"
+    return served
+
+
+def _media_key(url: str) -> str:
+    """A media URL's cache identity: `youtube:<id>` for every spelling of a YouTube
+    video (sources.canonical_id), else the URL itself — a SoundCloud or generic-site
+    link names nothing canonical before it is extracted."""
+    return canonical_id(url) or url
+
+
+def stream_cache_key(webpage_url: str) -> str:
+    """Where a song's stream data is cached — one key for every spelling of the
+    same video. Public for the readers outside this module (crash recovery, the
+    stream refresher); writes stay here."""
+    return f"ytdl:stream:{_media_key(webpage_url)}"
+
+
+def _source_cache_key(webpage_url: str) -> str:
+    return f"ytdl:source:{_media_key(webpage_url)}"
+
+
+def _input_key(text: str) -> str:
+    """A search or pasted link as a cache key spells it. A search is case-folded, so
+    "Destiny" and "destiny " share a key; a link folds only its scheme and host and
+    keeps the path and query verbatim — short links and path IDs are case-sensitive
+    on plenty of sites, and folding them would let two songs share one entry."""
+    text = text.strip()
+    parts = urlsplit(text)
+    if not parts.scheme or not parts.netloc:
+        return text.lower()
+    head = f"{parts.scheme}://{parts.netloc}"
+    if not text.lower().startswith(head.lower()):
+        return text  # an unusual spelling: verbatim rather than half-folded
+    return head.lower() + text[len(head) :]
+
+
+def _alias_cache_key(search: str) -> str:
+    """The alias-index key for an input that names no video itself — a search, a
+    non-YouTube link. Its value is the _media_key of the video it resolved to."""
+    return f"ytdl:alias:{_input_key(search)}"
+
+
+async def _cached_source(
+    redis: aioredis.Redis, search: str, canonical: Optional[str]
+) -> Optional[dict[str, Any]]:
+    """yt_source's cached identity for `search`: read by the video's own key for a
+    link to one, else through the alias index — two reads, each usually served by
+    the in-process tier, and what lets a search, the video's watch URL and its
+    youtu.be link share one entry."""
+    if canonical is not None:
+        return await cache_get(redis, f"ytdl:source:{canonical}")
+    media = await cache_get(redis, _alias_cache_key(search))
+    if not isinstance(media, str):
+        return None
+    return await cache_get(redis, f"ytdl:source:{media}")
+
+
+def _unplayable_cache_key(target: str) -> str:
+    """Negative-cache key for a URL or search. By video ID where there is one, so a
+    dead video is remembered for every spelling of its URL a playlist or user uses."""
+    canonical = canonical_id(target) or _input_key(target)
+    return f"ytdl:unplayable:{canonical}"
+
+
+def _is_permanent(error: ExtractionError) -> bool:
+    """Whether a failure belongs to the video rather than to this moment: yt-dlp's
+    own verdict (expected — private, removed, age-gated, geo-blocked) or an
+    unsupported site. yt-dlp also marks its bot check and rate limits expected;
+    those pass on their own, and remembering them would refuse playable songs."""
+    if error.unsupported:
+        return True
+    if not error.expected:
+        return False
+    message = error.message.lower()
+    return not any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+def _unplayable_entry(error: ExtractionError) -> dict[str, Any]:
+    return {
+        "message": error.message,
+        "original_type": error.original_type,
+        "expected": error.expected,
+        "video_id": error.video_id,
+        "cause_type": error.cause_type,
+        "unsupported": error.unsupported,
+    }
+
+
+def _remembered_error(entry: dict[str, Any]) -> ExtractionError:
+    return ExtractionError(
+        message=str(entry.get("message", "")),
+        original_type=str(entry.get("original_type", "")),
+        expected=bool(entry.get("expected", False)),
+        video_id=str(entry.get("video_id", "")),
+        cause_type=str(entry.get("cause_type", "")),
+        unsupported=bool(entry.get("unsupported", False)),
+        remembered=True,
+    )
+
+
+async def _known_unplayable(
+    redis: Optional[aioredis.Redis], target: str
+) -> Optional[ExtractionError]:
+    """The remembered failure for `target`, or None. Consulted before extracting, so
+    a dead entry of a shared playlist, or a -play retried on a private video, costs
+    a cache read instead of a worker."""
+    if redis is None or _UNPLAYABLE_TTL <= 0:
+        return None
+    entry = await cache_get(redis, _unplayable_cache_key(target))
+    if entry is None:
+        return None
+    trace.get_current_span().set_attribute("ytdl.known_unplayable", True)
+    return _remembered_error(entry)
+
+
+def _unplayable_entries(
+    target: str, error: ExtractionError
+) -> list[tuple[str, Any, int]]:
+    """The negative-cache writes for `error`, as cache_set_many entries: one under
+    `target`, and one under the video yt-dlp named when that is another key — a
+    search that resolved to a dead video is then known for the video's own URL."""
+    if _UNPLAYABLE_TTL <= 0 or error.remembered or not _is_permanent(error):
+        return []
+    entry = _unplayable_entry(error)
+    keys = {_unplayable_cache_key(target)}
+    if error.video_id and not error.unsupported:
+        keys.add(f"ytdl:unplayable:youtube:{error.video_id}")
+    return [(key, entry, _UNPLAYABLE_TTL) for key in sorted(keys)]
+
+
+async def _remember_unplayable(
+    redis: Optional[aioredis.Redis], target: str, error: ExtractionError
+) -> None:
+    if redis is not None:
+        await cache_set_many(redis, _unplayable_entries(target, error))
 
 
 def _stream_url_ttl(stream_url: str) -> Optional[int]:
@@ -514,9 +1146,10 @@ def _record_probe_outcome(probe: StreamProbe) -> StreamProbe:
     return probe
 
 
-# One session for every stream probe. The probe closes each connection rather
-# than pooling it, so this saves the connector and SSL-context construction a
-# per-call session paid — not a handshake. See docs/ARCHITECTURE.md#stream-probe-session
+# One session for every stream probe. A PLAYABLE probe closes its connection, so
+# for the common case this saves the connector, the SSL context and — via its DNS
+# cache — the lookup, not the handshake; only a drained refusal is pooled. See
+# docs/ARCHITECTURE.md#stream-probe-session
 _probe_session: Optional[aiohttp.ClientSession] = None
 # One-shot, like MusicBotApp.close()'s own _teardown_started: the playback loop
 # outlives close_probe_session() by up to the 30s span flush, and rebuilding on
@@ -542,8 +1175,11 @@ def _get_probe_session() -> aiohttp.ClientSession:
         _probe_session = aiohttp.ClientSession(
             # limit=0: one connector now serves every guild, and the default 100
             # would queue the 101st probe against its own 2s budget and report a
-            # healthy URL as UNCONFIRMED. Costs nothing — the probe never pools.
-            connector=aiohttp.TCPConnector(limit=0),
+            # healthy URL as UNCONFIRMED. Costs nothing — the pool only ever holds
+            # the few connections a drained refusal left idle.
+            connector=aiohttp.TCPConnector(
+                limit=0, ttl_dns_cache=_PROBE_DNS_CACHE_SECS
+            ),
             timeout=aiohttp.ClientTimeout(total=_STREAM_PROBE_TIMEOUT),
             cookie_jar=aiohttp.DummyCookieJar(),
         )
@@ -561,6 +1197,18 @@ async def close_probe_session() -> None:
         await session.close()
 
 
+def _drainable(response: aiohttp.ClientResponse) -> bool:
+    """True for a refusal small enough to read so its connection is kept. Needs a
+    declared length: a chunked body could be anything, and the read counts
+    against the same 2s budget as the status line."""
+    length = response.content_length
+    return (
+        response.status >= 400
+        and length is not None
+        and length <= _PROBE_DRAIN_MAX_BYTES
+    )
+
+
 async def _probe_stream_url(stream_url: str) -> StreamProbe:
     """What YouTube will do with this stream URL right now. A revoked URL makes ffmpeg
     403 and exit, which discord.py cannot tell from a song that simply ended — silence,
@@ -585,7 +1233,16 @@ async def _probe_stream_url(stream_url: str) -> StreamProbe:
             # delete the cache entry and refuse a song ffmpeg's own -reconnect
             # would very likely have played.
             status = response.status
-            response.close()
+            if _drainable(response):
+                # A refusal is a short error page, and the resolve that got it is
+                # about to probe a fresh URL on the same edge: reading it to the
+                # end pools the connection and saves that probe its handshake.
+                try:
+                    await response.read()
+                except aiohttp.ClientError, TimeoutError, OSError:
+                    pass  # the verdict stands; only the connection is not kept
+            else:
+                response.close()
             if status < 400:
                 return _record_probe_outcome(StreamProbe.PLAYABLE)
             if status == 429 or status >= 500:
@@ -615,6 +1272,23 @@ async def _probe_stream_url(stream_url: str) -> StreamProbe:
         return _record_probe_outcome(StreamProbe.UNCONFIRMED)
 
 
+def _stream_cache_entry(
+    data: YTDLVideoInfo, *, max_ttl: Optional[int] = None
+) -> Optional[tuple[dict[str, Any], int]]:
+    """The stream-cache entry for `data` and its TTL, or None when the URL isn't worth
+    caching (no usable expiry). `max_ttl` caps the lifetime below the URL's own —
+    used for a URL that could not be confirmed."""
+    ttl = _stream_url_ttl(data.get("url", ""))
+    if not ttl:
+        return None
+    if max_ttl is not None:
+        ttl = min(ttl, max_ttl)
+    # Absent keys are dropped, not written as None: `{"title": None}` would contradict
+    # YTDLVideoInfo, which types title as str and treats absent fields as *missing*.
+    stripped = {k: data[k] for k in _STREAM_CACHE_FIELDS if data.get(k) is not None}
+    return stripped, ttl
+
+
 async def _cache_stream(
     redis: Optional[aioredis.Redis],
     cache_key: str,
@@ -623,26 +1297,20 @@ async def _cache_stream(
     max_ttl: Optional[int] = None,
 ) -> bool:
     """Persist a probed stream URL. True when an entry was written, False when the URL
-    isn't worth caching (no usable expiry). `max_ttl` caps the lifetime below the URL's
-    own — used for a URL that could not be confirmed."""
-    # Absent keys are dropped, not written as None: `{"title": None}` would contradict
-    # YTDLVideoInfo, which types title as str and treats absent fields as *missing*.
-    stripped = {k: data[k] for k in _STREAM_CACHE_FIELDS if data.get(k) is not None}
-    ttl = _stream_url_ttl(data.get("url", ""))
-    if ttl:
-        if max_ttl is not None:
-            ttl = min(ttl, max_ttl)
-        await cache_set(redis, cache_key, stripped, ttl)
-        return True
-    return False
+    isn't worth caching (see _stream_cache_entry)."""
+    entry = _stream_cache_entry(data, max_ttl=max_ttl)
+    if entry is None:
+        return False
+    await cache_set(redis, cache_key, *entry)
+    return True
 
 
-async def _probe_and_cache(
-    redis: Optional[aioredis.Redis], cache_key: str, data: YTDLVideoInfo
-) -> bool:
+async def _probed_stream_entry(
+    data: YTDLVideoInfo,
+) -> Optional[tuple[dict[str, Any], int]]:
     """Success-path post-processing for a full stream extraction: record the serving
-    format, probe the URL, cache it. True when an entry was written. Shared by
-    prefetch_stream and yt_source so both write identical entries.
+    format, probe the URL, and return the entry to cache (_stream_cache_entry), or
+    None when nothing should be.
 
     A DEAD URL is never cached. An UNCONFIRMED one is, for _UNCONFIRMED_STREAM_TTL
     only: probe failures are process-wide, so declining the write would stop anything
@@ -651,21 +1319,32 @@ async def _probe_and_cache(
     _record_serving_format(data)
     if _stream_url_ttl(data.get("url", "")) is None:
         # Uncacheable (no usable expiry — e.g. SoundCloud): probing would spend a
-        # network round only for _cache_stream to decline the write anyway.
-        return False
+        # network round only for the entry to be declined anyway.
+        return None
     probe = await _probe_stream_url(data.get("url", ""))
     span.set_attribute("ytdl.stream_probe", probe.value)
     if probe is StreamProbe.PLAYABLE:
-        return await _cache_stream(redis, cache_key, data)
+        return _stream_cache_entry(data)
     if probe is StreamProbe.UNCONFIRMED:
         log.warning(
             "could not confirm a freshly extracted stream URL — caching it for "
             f"{_UNCONFIRMED_STREAM_TTL}s only"
         )
-        return await _cache_stream(
-            redis, cache_key, data, max_ttl=_UNCONFIRMED_STREAM_TTL
-        )
-    return False
+        return _stream_cache_entry(data, max_ttl=_UNCONFIRMED_STREAM_TTL)
+    return None
+
+
+async def _probe_and_cache(
+    redis: Optional[aioredis.Redis], cache_key: str, data: YTDLVideoInfo
+) -> bool:
+    """_probed_stream_entry, written to the cache. True when an entry was written.
+    Shared by prefetch_stream and yt_source so both write identical entries, and
+    with prefetch_streams, which writes the same entries a batch at a time."""
+    entry = await _probed_stream_entry(data)
+    if entry is None:
+        return False
+    await cache_set(redis, cache_key, *entry)
+    return True
 
 
 async def invalidate_stream_cache(
@@ -673,7 +1352,7 @@ async def invalidate_stream_cache(
 ) -> bool:
     """Drop a song's cached stream URL so the next play re-extracts a fresh one.
     Returns whether an entry existed to drop."""
-    return await cache_del(redis, _stream_cache_key(webpage_url))
+    return await cache_del(redis, stream_cache_key(webpage_url))
 
 
 @dataclass(frozen=True, slots=True)
@@ -756,6 +1435,121 @@ def _enrich_queueobject(qo: QueueObject, data: YTDLVideoMetadata) -> None:
         qo.thumbnail = data.get("thumbnail")
 
 
+@cache
+def live_volume_available() -> bool:
+    """Whether libopus loads, which the in-process gain stage (YTDL.read) needs.
+
+    discord.py loads it lazily and only to encode PCM, which an Opus source never
+    asks for, so a host can play fine without it. Without it volume falls back to
+    the ffmpeg filter, fixed for the life of each ffmpeg. Cached: the answer is
+    the host's and cannot change while the process runs."""
+    try:
+        discord.opus.Decoder()
+    except discord.opus.OpusNotLoaded:
+        return False
+    return True
+
+
+class _GainStage:
+    """Opus in, Opus out at another volume: decoded with libopus's own decoder gain
+    and re-encoded — at the song's encoder bitrate. Only a stream copy has one (a
+    transcode takes its volume in ffmpeg's encode, see yt_stream), and only while
+    its volume is not 1.0, so a song at 100% is never decoded."""
+
+    def __init__(self, bitrate: int) -> None:
+        self._decoder = discord.opus.Decoder()
+        self._encoder = discord.opus.Encoder(bitrate=bitrate)
+        self._volume: Optional[float] = None
+
+    def apply(self, packet: bytes, volume: float) -> bytes:
+        if volume != self._volume:
+            # Decoder gain is in dB, which has no 0; -120 dB stands in for mute.
+            self._decoder.set_volume(max(volume, 1e-6))
+            self._volume = volume
+        pcm = self._decoder.decode(packet, fec=False)
+        return self._encoder.encode(pcm, len(pcm) // discord.opus.Decoder.SAMPLE_SIZE)
+
+
+class _ReadAhead:
+    """A bounded buffer of Opus packets between ffmpeg's pipe and the voice player.
+
+    One daemon thread calls `read` (the unbuffered FFmpegOpusAudio.read) until end
+    of stream and queues what it gets; get() is the player thread's side. The end
+    of stream is queued like a packet, so it reaches the player only once every
+    packet before it has — and FFmpegOpusAudio.read has already run its return-code
+    check by then, so the player still finds ffmpeg's failure on the source. A
+    raise in the reader is queued the same way and re-raised by get(), where the
+    player would have met it reading the pipe itself."""
+
+    def __init__(self, read: Callable[[], bytes], packets: int) -> None:
+        self._read = read
+        self._packets: queue.Queue[bytes] = queue.Queue(maxsize=packets)
+        self._error: Optional[Exception] = None
+        self._closed = threading.Event()
+        self._drained = False  # the end of stream has been handed out
+        self._flowing = False  # a packet has been handed out; see get()
+        self._thread = threading.Thread(
+            target=self._fill, name="ytdl-readahead", daemon=True
+        )
+        self._thread.start()
+
+    def _fill(self) -> None:
+        try:
+            while not self._closed.is_set():
+                data = self._read()
+                self._put(data)
+                if not data:
+                    return
+        except Exception as e:
+            self._error = e
+            self._put(b"")
+
+    def _put(self, data: bytes) -> None:
+        # Timed, so a full buffer nobody drains (the player stopped) cannot hold
+        # the thread past close().
+        while not self._closed.is_set():
+            try:
+                self._packets.put(data, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def get(self) -> bytes:
+        if self._drained:
+            return b""
+        try:
+            data = self._packets.get_nowait()
+        except queue.Empty:
+            # The wait before the first packet is ffmpeg's startup, not an
+            # underrun; priming (YTDL.prime) is what covers that one.
+            if self._flowing:
+                _READAHEAD_UNDERRUNS.add(1)
+            started = time.monotonic()
+            data = self._wait()
+            if self._flowing:
+                _READAHEAD_STALL.record(time.monotonic() - started)
+        if not data:
+            self._drained = True
+            if self._error is not None:
+                raise self._error
+            return b""
+        self._flowing = True
+        return data
+
+    def _wait(self) -> bytes:
+        while not self._closed.is_set():
+            try:
+                return self._packets.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return b""
+
+    def close(self) -> None:
+        """Stop the reader. It exits at its next put, or at the end of stream the
+        caller's ffmpeg kill delivers to a read it is blocked in."""
+        self._closed.set()
+
+
 class YTDL(discord.FFmpegOpusAudio):
     FFMPEG_OPTS = {
         "before_options": "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5",
@@ -784,10 +1578,30 @@ class YTDL(discord.FFmpegOpusAudio):
         np_channel_id: int = 0,
         np_dedicated: bool = False,
         np_host_ref: Optional[NpHostRef] = None,
+        codec: Optional[str] = None,
+        volume: float = 1.0,
+        live_volume: bool = True,
+        bitrate: int = _ENCODER_MAX_KBPS,
     ) -> None:
         super().__init__(
-            url, executable="ffmpeg", before_options=before_options, options=options
+            url,
+            bitrate=bitrate,
+            executable="ffmpeg",
+            before_options=before_options,
+            options=options,
+            codec=codec,
         )
+        # kbps of anything encoded for this song: ffmpeg's -b:a when transcoding,
+        # and the gain stage's encoder (see yt_stream's _encoder_kbps).
+        self.bitrate: int = bitrate
+        # "opus" makes discord.py run ffmpeg with `-c:a copy`: the source's Opus
+        # packets go to Discord as they are (see yt_stream).
+        self.passthrough: bool = codec == "opus"
+        # Applied by read() as packets reach the player, so a change is heard at
+        # once (see _GainStage). live_volume=False — a transcode, or no libopus —
+        # means ffmpeg's filter carries this song's level and it cannot change.
+        self.volume: float = volume
+        self.live_volume: bool = live_volume
 
         self.requester = requester
         self.channel = channel
@@ -821,12 +1635,8 @@ class YTDL(discord.FFmpegOpusAudio):
 
         self.data = data
         self.uploader = data.get("uploader")
-        self.uploader_url = data.get("uploader_url")
-        self.date = data.get("upload_date") or "00000000"
-        self.upload_date = self.date[6:8] + "." + self.date[4:6] + "." + self.date[0:4]
         self.title = data.get("title")
         self.thumbnail = data.get("thumbnail")
-        self.description = data.get("description")
         # `or 0`, not a dict default: yt-dlp sets "duration" to None (not absent)
         # for livestreams and some age-gated videos, so data.get("duration", 0)
         # would hand int() a None and raise.
@@ -834,28 +1644,84 @@ class YTDL(discord.FFmpegOpusAudio):
         # fmt_duration, not str(timedelta): the latter spells 3m30s "0:03:30", which
         # left the recovered embed and presence card disagreeing with the bar's "3:30".
         self.duration = fmt_duration(self.duration_secs)
-        self.tags = data.get("tags")
         self.webpage_url = data.get("webpage_url")
         self.views = data.get("view_count")
         self.likes = data.get("like_count")
-        self.dislikes = data.get("dislike_count")
         self.url = data.get("url")
         self.abr = data.get("abr")
         self.asr = data.get("asr")
         self.acodec = data.get("acodec")
 
         self._frames_read: int = 0
+        # Opus packets read ahead of the player by prime(), served first by read().
+        self._primed: deque[bytes] = deque()
+        # Started by the first read(), so a prefetched song holds no thread.
+        self._readahead: Optional[_ReadAhead] = None
+        # Only while volume is not 1.0; dropped on the way back, so its decoder
+        # never runs for a song at 100%.
+        self._gain: Optional[_GainStage] = None
 
     def __getitem__(self, item: str) -> Any:
         return self.__getattribute__(item)
 
     def read(self) -> bytes:
-        """Read the next audio frame, tracking frame count for elapsed_secs."""
-        data = super().read()
+        """Read the next audio frame, tracking frame count for elapsed_secs.
+
+        With YTDL_READAHEAD_SECS set, frames come from a _ReadAhead filled by its
+        own thread; they are counted here either way, as they reach the player.
+        The volume is applied here too, last, so a change reaches the very next
+        packet rather than one a buffer's length later."""
+        if self._readahead is None and _READAHEAD_SECS > 0:
+            # Before the primed packets are served, so it fills while they drain.
+            packets = int(_READAHEAD_SECS * 1000 / discord.opus.Encoder.FRAME_LENGTH)
+            self._readahead = _ReadAhead(super().read, max(1, packets))
+        if self._primed:
+            data = self._primed.popleft()
+        elif self._readahead is not None:
+            data = self._readahead.get()
+        else:
+            data = super().read()
+        # One read of a float the loop thread may be rewriting: either value is
+        # a whole one, and the next packet sees the newer.
+        volume = self.volume
+        if data and volume != 1.0:
+            if self._gain is None:
+                self._gain = _GainStage(self.bitrate)
+            data = self._gain.apply(data, volume)
+        elif self._gain is not None:
+            self._gain = None
         if data:
             self._frames_read += 1
         return data
 
+    def cleanup(self) -> None:
+        if self._readahead is not None:
+            self._readahead.close()
+        super().cleanup()
+
+    def prime(self, frames: int) -> int:
+        """Read up to `frames` Opus packets off ffmpeg now, for read() to serve first.
+
+        BLOCKING — run it in a worker, and only before vc.play(): from the first
+        read() on, the player thread (or its read-ahead thread) owns the pipe. What
+        it hides is ffmpeg's startup (spawn, the HTTP connect, the probe), which
+        otherwise lands on the player thread's first read() as silence between two
+        songs. Frames are counted when read() hands them to the player, not here, so
+        elapsed_secs and produced_audio still describe audio actually delivered.
+        Stops early at end of stream; returns how many packets are buffered."""
+        while len(self._primed) < frames:
+            data = super().read()
+            if not data:
+                break
+            self._primed.append(data)
+        return len(self._primed)
+
+    @property
+    def primed(self) -> bool:
+        """Whether prime() has audio waiting, i.e. vc.play() starts without a wait
+        on ffmpeg."""
+        return bool(self._primed)
+
     @property
     def produced_audio(self) -> bool:
         """False when ffmpeg exited without delivering a frame — the stream never opened
@@ -884,29 +1750,36 @@ class YTDL(discord.FFmpegOpusAudio):
         cls,
         qo: QueueObject,
         redis: Optional[aioredis.Redis] = None,
+        *,
+        priority: ExtractPriority = ExtractPriority.PREFETCH,
     ) -> None:
         """Eagerly populate the stream URL cache for a queued song, so yt_stream() is a
         cache hit by the time it plays. No-op with no redis or an already-cached URL;
         errors are logged and swallowed — yt_stream() recovers by extracting fresh.
+        `priority` is raised by callers a user is waiting on (-playnow).
         """
         trace.get_current_span().set_attribute("ytdl.url", qo.webpage_url)
         if redis is None:
             trace.get_current_span().set_attribute("ytdl.skipped", True)
             return
-        cache_key = _stream_cache_key(qo.webpage_url)
+        cache_key = stream_cache_key(qo.webpage_url)
         cached: Optional[YTDLVideoInfo] = await cache_get(redis, cache_key)
         already_cached = cached is not None
         trace.get_current_span().set_attribute("ytdl.already_cached", already_cached)
         if already_cached:
             _enrich_queueobject(qo, cached)
             return
+        if await _known_unplayable(redis, qo.webpage_url) is not None:
+            return  # the play-time resolve reports it, without extracting either
         try:
             # Single-video cast: _YTDL_STREAM_OPTS on a watch URL never yields a
             # search/playlist wrapper, so the result is always a lone video here.
             data = cast(
                 Optional[YTDLVideoInfo],
                 await _run_extract(
-                    ExtractRequest(url=qo.webpage_url, opts=_YTDL_STREAM_OPTS)
+                    ExtractRequest(url=qo.webpage_url, opts=_YTDL_STREAM_OPTS),
+                    priority=priority,
+                    guild_id=guild_of(qo.requester),
                 ),
             )
             trace.get_current_span().set_attribute(
@@ -918,18 +1791,115 @@ class YTDL(discord.FFmpegOpusAudio):
                 StatusCode.ERROR, f"prefetch_stream failed: {e}"
             )
             log.warning(f"prefetch_stream failed for {qo.webpage_url}: {e}")
+            if isinstance(e, ExtractionError):
+                await _remember_unplayable(redis, qo.webpage_url, e)
             return
         if data is not None:
             await _probe_and_cache(redis, cache_key, data)
             _enrich_queueobject(qo, data)
 
+    @classmethod
+    @_tracer.start_as_current_span("ytdl.prefetch_streams")
+    async def prefetch_streams(
+        cls,
+        qos: Sequence[QueueObject],
+        redis: Optional[aioredis.Redis] = None,
+        *,
+        priority: ExtractPriority = ExtractPriority.PREFETCH,
+        refresh: bool = False,
+    ) -> None:
+        """prefetch_stream for several songs at once — warming a freshly queued
+        playlist. The cache is read in one MGET; the misses are extracted as one
+        pool job (_ytdlp_extract_batch, split past _STREAM_BATCH_MAX), probed
+        concurrently, and written in one pipeline. Same contract as prefetch_stream:
+        no-op with no redis, errors logged and swallowed, one song's failure costs
+        only that song. `refresh` skips the cache read and re-extracts every song,
+        replacing entries about to expire (StreamRefresher).
+
+        Not coalesced with _run_extract's in-flight jobs: a batch is not one request
+        a single caller could join. The guild is the first song's; a playlist is
+        queued by one requester.
+        """
+        span = trace.get_current_span()
+        span.set_attribute("ytdl.batch_size", len(qos))
+        if redis is None or not qos:
+            span.set_attribute("ytdl.skipped", True)
+            return
+        by_url: dict[str, list[QueueObject]] = {}
+        for qo in qos:
+            by_url.setdefault(qo.webpage_url, []).append(qo)
+        urls = list(by_url)
+        cached: list[Optional[YTDLVideoInfo]] = (
+            [None] * len(urls)
+            if refresh
+            else await cache_get_many(redis, [stream_cache_key(url) for url in urls])
+        )
+        misses: list[str] = []
+        for url, data in zip(urls, cached):
+            if data is None:
+                misses.append(url)
+                continue
+            for qo in by_url[url]:
+                _enrich_queueobject(qo, data)
+        span.set_attribute("ytdl.already_cached", len(urls) - len(misses))
+        if misses and _UNPLAYABLE_TTL > 0:
+            dead = await cache_get_many(
+                redis, [_unplayable_cache_key(url) for url in misses]
+            )
+            misses = [url for url, entry in zip(misses, dead) if entry is None]
+            span.set_attribute("ytdl.known_unplayable", len(dead) - len(misses))
+        guild_id = guild_of(qos[0].requester)
+        for start in range(0, len(misses), _STREAM_BATCH_MAX):
+            chunk = misses[start : start + _STREAM_BATCH_MAX]
+            try:
+                outcomes = await ytdlp_pool.run(
+                    _ytdlp_extract_batch,
+                    tuple(
+                        ExtractRequest(url=url, opts=_YTDL_STREAM_OPTS) for url in chunk
+                    ),
+                    priority=priority,
+                    guild_id=guild_id,
+                    label="stream",
+                )
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(StatusCode.ERROR, f"prefetch_streams failed: {e}")
+                log.warning(f"prefetch_streams failed for {len(chunk)} songs: {e}")
+                return
+            resolved: list[tuple[str, YTDLVideoInfo]] = []
+            unplayable: list[tuple[str, Any, int]] = []
+            for url, outcome in zip(chunk, outcomes):
+                if isinstance(outcome, ExtractionError):
+                    _count_failure(outcome, "stream")
+                    log.warning(f"prefetch_streams failed for {url}: {outcome}")
+                    unplayable += _unplayable_entries(url, outcome)
+                elif outcome is not None:
+                    # Single-video cast, as in prefetch_stream.
+                    resolved.append((url, cast(YTDLVideoInfo, outcome)))
+            entries = await asyncio.gather(
+                *(_probed_stream_entry(data) for _, data in resolved)
+            )
+            await cache_set_many(
+                redis,
+                [
+                    (stream_cache_key(url), *entry)
+                    for (url, _), entry in zip(resolved, entries)
+                    if entry is not None
+                ]
+                + unplayable,
+            )
+            for url, data in resolved:
+                for qo in by_url[url]:
+                    _enrich_queueobject(qo, data)
+
     @classmethod
     async def _resolve_playable_stream(
         cls,
         qo: QueueObject,
         redis: Optional[aioredis.Redis],
         *,
-        allow_reextract: bool = True,
+        priority: ExtractPriority = ExtractPriority.PLAYBACK,
+        lite: bool = False,
     ) -> YTDLVideoInfo:
         """Resolve a song to stream data whose URL YouTube will actually serve. Every URL
         is probed first, because a revoked one fails in the worst way: ffmpeg 403s and
@@ -942,12 +1912,13 @@ class YTDL(discord.FFmpegOpusAudio):
         signed URL on the same edge and format, which cures an early revocation. That
         drop is FREE, never charged against _MAX_STREAM_EXTRACTIONS.
 
-        Two brakes stop it becoming self-inflicted load: once the probe path looks
-        broken process-wide the cached URL is served untouched, and
-        `allow_reextract=False` (the background prefetch) declines to re-extract.
+        A brake stops it becoming self-inflicted load: once the probe path looks
+        broken process-wide the cached URL is served untouched. The background
+        prefetch re-extracts like any other caller — a bulk mutation that cancels it
+        aborts the extraction rather than waiting it out (YtdlpPool.run).
         """
         span = trace.get_current_span()
-        cache_key = _stream_cache_key(qo.webpage_url)
+        cache_key = stream_cache_key(qo.webpage_url)
 
         data: Optional[YTDLVideoInfo] = await cache_get(redis, cache_key)
         span.set_attribute("ytdl.cache_hit", data is not None)
@@ -958,20 +1929,32 @@ class YTDL(discord.FFmpegOpusAudio):
             if data is None:
                 if extractions >= _MAX_STREAM_EXTRACTIONS:
                     break
-                # Single-video cast, as in prefetch_stream.
-                data = cast(
-                    Optional[YTDLVideoInfo],
-                    await _run_extract(
-                        ExtractRequest(url=qo.webpage_url, opts=_YTDL_STREAM_OPTS)
-                    ),
-                )
+                if extractions == 0:
+                    known = await _known_unplayable(redis, qo.webpage_url)
+                    if known is not None:
+                        raise known
+                try:
+                    # Single-video cast, as in prefetch_stream.
+                    data = cast(
+                        Optional[YTDLVideoInfo],
+                        await _run_extract(
+                            ExtractRequest(url=qo.webpage_url, opts=_YTDL_STREAM_OPTS),
+                            priority=priority,
+                            guild_id=guild_of(qo.requester),
+                        ),
+                    )
+                except ExtractionError as e:
+                    await _remember_unplayable(redis, qo.webpage_url, e)
+                    raise
                 extractions += 1
                 span.set_attribute("ytdl.extracted_fresh", True)
                 if data is None:
                     raise RuntimeError("Could not extract stream data")
                 extracted_fresh = True
 
-            probe = await _probe_stream_url(data.get("url", ""))
+            # The URL that will be played is the one probed; the caller picks the
+            # rung with the same `lite` (see _audio_rung).
+            probe = await _probe_stream_url(_audio_rung(data, lite).get("url", ""))
             span.set_attribute("ytdl.stream_probe", probe.value)
 
             if probe is StreamProbe.PLAYABLE:
@@ -989,13 +1972,11 @@ class YTDL(discord.FFmpegOpusAudio):
                         redis, cache_key, data, max_ttl=_UNCONFIRMED_STREAM_TTL
                     )
                     return data
-                if probe_path_looks_broken() or not allow_reextract:
-                    # The probe, not the URL, is what is in doubt — or a caller that
-                    # must not block on an extraction. Serve what we have.
+                if probe_path_looks_broken():
+                    # The probe, not the URL, is what is in doubt. Serve what we have.
                     log.warning(
                         f"serving the cached stream URL for {qo.webpage_url} unverified "
-                        f"(probe unhealthy={probe_path_looks_broken()}, "
-                        f"reextract_allowed={allow_reextract})"
+                        "(the probe path looks broken)"
                     )
                     _record_serving_format(data)
                     return data
@@ -1045,31 +2026,68 @@ class YTDL(discord.FFmpegOpusAudio):
         channel: discord.TextChannel,
         *,
         volume: float = 1.0,
+        channel_bitrate: Optional[int] = None,
         redis: Optional[aioredis.Redis] = None,
-        allow_reextract: bool = True,
+        priority: ExtractPriority = ExtractPriority.PLAYBACK,
     ) -> "YTDL":
         """Resolve a queued song to a playable YTDL source, using the Redis
         stream-URL cache if present and extracting fresh via yt-dlp otherwise.
 
-        `allow_reextract=False` keeps an unconfirmable cached URL rather than dropping
-        and re-extracting it — for the background prefetch, whose cancellation is what
-        every bulk mutation waits on, and which must not put an uninterruptible
-        executor job in that path."""
-        trace.get_current_span().set_attribute("ytdl.url", qo.webpage_url)
+        channel_bitrate is the target VoiceChannel.bitrate (bps), None when not
+        known: it picks the audio rung (_serves_lite) and the encoder bitrate."""
+        span = trace.get_current_span()
+        span.set_attribute("ytdl.url", qo.webpage_url)
 
-        data = await cls._resolve_playable_stream(
-            qo, redis, allow_reextract=allow_reextract
+        lite = _serves_lite(channel_bitrate)
+        data = _audio_rung(
+            await cls._resolve_playable_stream(qo, redis, priority=priority, lite=lite),
+            lite,
         )
+        span.set_attribute("ytdl.lite_rung", "lite_url" in data and lite)
 
         ffmpeg_opts = cls.FFMPEG_OPTS.copy()
         if qo.ts is not None:
-            ffmpeg_opts["options"] += f" -ss {qo.ts}"
+            # An input option, before -i: ffmpeg seeks the demuxer through the
+            # container's index, which over HTTP is one range request to the cue
+            # nearest the offset, so a resume 50 minutes into a mix starts as fast
+            # as one at 0:00. On the output side it downloaded and decoded all 50
+            # minutes first. Transcoded, the landing is exact (ffmpeg decodes from
+            # the cue and discards up to the offset: -accurate_seek, its default);
+            # stream-copied, see -copypriorss below. Either way the first frame
+            # read is at `ts`, so start_offset and position_secs stay exact.
+            ffmpeg_opts["before_options"] += f" -ss {qo.ts}"
             # No user notice here. This runs at CONSTRUCTION, which prefetch does
             # while the previous song is still playing, so announcing "Starting song
             # at Xs" from here fired at the wrong moment. MusicPlayer's start path
             # announces it — alongside "Resuming…", which was already moved there.
-        if volume != 1.0:
+        # YouTube's audio-only rung (itag 251) is already Opus, the codec Discord
+        # takes, and transcoding it — decode, resample, re-encode — is nearly all of
+        # a song's ffmpeg CPU. Copied instead, ffmpeg only remuxes WebM into Ogg;
+        # the input -ss above still applies, and lands on a packet boundary. Any
+        # other codec (an m4a or muxed fallback rung) needs the encode, and so does
+        # a volume other than 1.0 where libopus is missing (the filter below).
+        # frames_read stays a 20 ms count either way: YouTube's Opus packets are
+        # 20 ms frames.
+        live_available = live_volume_available()
+        passthrough = (
+            _OPUS_PASSTHROUGH
+            and (live_available or volume == 1.0)
+            and data.get("acodec") == "opus"
+        )
+        # Volume is applied in-process by read() on a stream copy, so -volume
+        # reaches a playing song and ffmpeg never decodes. A song ffmpeg encodes
+        # anyway takes it in that encode, as a filter fixed for the song's life:
+        # the gain stage there would decode and re-encode every packet a second
+        # time — twice the CPU, and a second lossy pass.
+        live_volume = live_available and passthrough
+        if volume != 1.0 and not live_volume:
             ffmpeg_opts["options"] += f" -filter:a volume={volume}"
+        trace.get_current_span().set_attribute("ytdl.opus_passthrough", passthrough)
+        if passthrough and qo.ts is not None:
+            # A stream copy keeps the packets between the cue the input seek landed
+            # on and the offset itself — up to a cluster of audio before `ts`.
+            # -copypriorss 0 drops them, so playback starts at `ts` to the packet.
+            ffmpeg_opts["options"] += " -copypriorss 0"
 
         return cls(
             channel,
@@ -1091,6 +2109,10 @@ class YTDL(discord.FFmpegOpusAudio):
             np_channel_id=qo.np_channel_id,
             np_dedicated=qo.np_dedicated,
             np_host_ref=qo.np_host_ref,
+            codec="opus" if passthrough else None,
+            volume=volume if live_volume else 1.0,
+            live_volume=live_volume,
+            bitrate=_encoder_kbps(channel_bitrate),
         )
 
     @classmethod
@@ -1106,9 +2128,11 @@ class YTDL(discord.FFmpegOpusAudio):
         download: bool = False,
         ts: Optional[int] = None,
         redis: Optional[aioredis.Redis] = None,
+        priority: ExtractPriority = ExtractPriority.INTERACTIVE,
     ) -> QueueObject:
         """Resolve a search term or URL to a QueueObject via yt-dlp, using the
-        Redis source cache if present.
+        Redis source cache if present. `priority` defaults to a user waiting on it;
+        the playback loop resolving a queued Spotify title passes PLAYBACK.
 
         query_source, analytics and user_input are REQUIRED so the QueueObject
         leaves here complete — a default would let a new call site forget them and
@@ -1120,12 +2144,13 @@ class YTDL(discord.FFmpegOpusAudio):
         link -remove matches on."""
         origin = user_input if user_input is not None else search
         trace.get_current_span().set_attribute("ytdl.search", search)
-        # Normalised so "Destiny" and "destiny " both hit. ts is excluded — a
+        # A link to a video is keyed by the video itself; anything else goes through
+        # the alias index to the video it resolved to last time. ts is excluded — a
         # per-request playback offset, not part of the video identity.
-        cache_key = f"ytdl:source:{search.strip().lower()}"
+        canonical = canonical_id(search)
 
         if redis is not None:
-            cached = await cache_get(redis, cache_key)
+            cached = await _cached_source(redis, search, canonical)
             if cached is not None:
                 trace.get_current_span().set_attribute("ytdl.source_cache_hit", True)
                 trace.get_current_span().set_attribute(
@@ -1152,12 +2177,18 @@ class YTDL(discord.FFmpegOpusAudio):
         # format selection, so data["url"] would be absent and the stream-cache write
         # below would silently never happen for direct-URL plays.
         try:
+            known = await _known_unplayable(redis, search)
+            if known is not None:
+                raise known
             data = await _run_extract(
                 ExtractRequest(
                     url=search, opts=_YTDL_STREAM_SEARCH_OPTS, download=download
-                )
+                ),
+                priority=priority,
+                guild_id=guild_of(requester),
             )
         except ExtractionError as e:
+            await _remember_unplayable(redis, search, e)
             # parse_url whitelists no domains — any dotted host lands here for yt-dlp
             # to accept or reject. An unrecognised site arrives as
             # ExtractionError.unsupported (flattened in the worker, since
@@ -1211,24 +2242,27 @@ class YTDL(discord.FFmpegOpusAudio):
         trace.get_current_span().set_attribute("ytdl.result_title", title)
 
         if redis is not None:
-            await cache_set(
-                redis,
-                cache_key,
-                {
-                    "webpage_url": webpage_url,
-                    "title": title,
-                    "duration": duration,
-                    "uploader": uploader,
-                    "thumbnail": thumbnail,
-                },
-                _YT_SOURCE_TTL,
-            )
+            source_entry = {
+                "webpage_url": webpage_url,
+                "title": title,
+                "duration": duration,
+                "uploader": uploader,
+                "thumbnail": thumbnail,
+            }
+            writes: list[tuple[str, Any, int]] = [
+                (_source_cache_key(webpage_url), source_entry, _YT_SOURCE_TTL)
+            ]
+            if canonical is None:
+                writes.append(
+                    (_alias_cache_key(search), _media_key(webpage_url), _YT_SOURCE_TTL)
+                )
+            await cache_set_many(redis, writes)
             # Warm the stream cache from the same extraction, so queue_put's
             # prefetch_stream is a cache-hit no-op instead of a second extraction.
             # Awaited, not spawned, so the write lands before prefetch_stream's
             # cache_get can race it. A failed probe never fails yt_source.
             stream_cached = await _probe_and_cache(
-                redis, _stream_cache_key(webpage_url), video_data
+                redis, stream_cache_key(webpage_url), video_data
             )
             trace.get_current_span().set_attribute("ytdl.stream_cached", stream_cached)
 
@@ -1254,15 +2288,22 @@ class YTDL(discord.FFmpegOpusAudio):
         query_source: str,
         analytics: Analytics,
         user_input: str,
+        priority: ExtractPriority = ExtractPriority.BULK,
     ) -> list[QueueObject]:
-        """Fetch flat entry metadata for every video in a YouTube playlist.
+        """Fetch flat entry metadata for every video in a YouTube playlist. BULK by
+        default: a flat extraction of a long playlist can hold a worker for tens of
+        seconds, and must not do it while a -play elsewhere waits for one.
 
         query_source, analytics and user_input are REQUIRED (see yt_source).
         `analytics` is the head's — track positions are derived per kept track
         below. `user_input` is the playlist link the user pasted, carried onto every
         track so -remove can match it."""
         trace.get_current_span().set_attribute("ytdl.url", url)
-        data = await _run_extract(ExtractRequest(url=url, opts=_YTDL_PLAYLIST_OPTS))
+        data = await _run_extract(
+            ExtractRequest(url=url, opts=_YTDL_PLAYLIST_OPTS),
+            priority=priority,
+            guild_id=guild_of(requester),
+        )
         if data is None:
             raise Exception(f"Could not fetch YouTube playlist: {url}")
         # Optional in the element type, not re-annotated on the loop target: yt-dlp
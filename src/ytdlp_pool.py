@@ -2,25 +2,32 @@
 
 Extraction is only half I/O — JSON parsing, signature decryption and format selection
 are GIL-bound, so processes (not threads) give concurrent extractions real parallelism
-instead of contention that also starves the voice heartbeat. Each worker costs a full
+instead of contention that also starves the voice heartbeat. Each worker holds a full
 CPython + yt-dlp import (~80–120 MB RSS), hence the conservative YTDLP_POOL_WORKERS
-default. Lifecycle is all this module owns: the callable is supplied per call (run()),
-which is what lets tests swap in a thread-pool-backed instance.
+default; workers fork from a forkserver that already did that import
+(src/ytdlp_preload.py), so it is paid once and shared copy-on-write. Lifecycle is all
+this module owns: the callable is supplied per call (run()), which is what lets
+tests swap in a thread-pool-backed instance.
 
 What crosses the process boundary, and the pickle contract each side owes:
 docs/ARCHITECTURE.md#yt-dlp-process-boundary.
 """
 
 import asyncio
+import concurrent.futures
+import itertools
 import logging
 import multiprocessing
 import os
 import pickle
+import signal
 import sys
 import threading
 import traceback
+from collections import Counter, deque
 from collections.abc import Callable
 from dataclasses import dataclass
+from enum import IntEnum
 from concurrent.futures import Executor, ProcessPoolExecutor
 from concurrent.futures import BrokenExecutor
 from concurrent.futures.process import BrokenProcessPool
@@ -31,17 +38,83 @@ from typing import Any, Optional, TypeVar
 import structlog
 from opentelemetry import trace
 
-from src.telemetry import configure_worker_logging
-from src.util import get_logger
+from src.telemetry import configure_worker_logging, get_meter
+from src.util import get_logger, percentile
 
 log = get_logger(__name__)
 
 T = TypeVar("T")
 
 _DEFAULT_WORKERS = int(os.environ.get("YTDLP_POOL_WORKERS", "4"))
+# The pool scales between these two: YTDLP_POOL_WORKERS is the ceiling, this the floor
+# an idle pool shrinks back to (see _reap).
+_DEFAULT_MIN_WORKERS = int(os.environ.get("YTDLP_POOL_MIN_WORKERS", "1"))
+# How long background work must queue for a worker before the pool grows by one. A
+# queued INTERACTIVE job grows it at once — a burst of prefetches may wait out a busy
+# worker, a -play may not. 0 grows for anything that would queue.
+_DEFAULT_SCALE_UP_WAIT_SECS = float(
+    os.environ.get("YTDLP_POOL_SCALE_UP_WAIT_SECS", "0.5")
+)
+# A pool that has not needed its full capacity for this long gives a worker back.
+_DEFAULT_IDLE_SECS = float(os.environ.get("YTDLP_POOL_IDLE_SECS", "300"))
+# A worker exits and is replaced after this many extractions, shedding what yt-dlp's
+# caches accumulated. 0 disables.
+_DEFAULT_MAX_TASKS_PER_WORKER = int(
+    os.environ.get("YTDLP_POOL_MAX_TASKS_PER_WORKER", "250")
+)
+# A worker whose RSS passes this (MB) gets the pool recycled. 0 disables.
+_DEFAULT_WORKER_RSS_MB = int(os.environ.get("YTDLP_POOL_WORKER_RSS_MB", "400"))
+# Worker slots only INTERACTIVE work may occupy, so a -play always has a worker to
+# start on however much background work is queued. Clamped per pool to leave the
+# other classes at least one slot.
+_DEFAULT_INTERACTIVE_RESERVE = int(
+    os.environ.get("YTDLP_POOL_INTERACTIVE_RESERVE", "1")
+)
+# Most workers one guild's background work may hold at once. Unset → half the
+# background capacity, rounded up (2 of the default 4 workers with 1 reserved).
+_DEFAULT_GUILD_SHARE: Optional[int] = (
+    int(os.environ["YTDLP_POOL_GUILD_SHARE"])
+    if os.environ.get("YTDLP_POOL_GUILD_SHARE")
+    else None
+)
+# What the forkserver imports before forking any worker. "__main__" is the stdlib's
+# default, kept; src.ytdlp_preload is the warm template (see that module).
+_FORKSERVER_PRELOAD = ("__main__", "src.ytdlp_preload")
+# How a cancelled job is interrupted inside its worker (see _abort). None off Unix,
+# where a cancelled job simply runs out and only its result is dropped.
+_ABORT_SIGNAL: Optional[signal.Signals] = getattr(signal, "SIGUSR1", None)
+# Jobs the abort board tracks at once: slot = job id modulo this, so two jobs only
+# share a slot when this many were submitted while the first still ran.
+_ABORT_SLOTS = 256
 # How long shutdown waits before abandoning the join: yt-dlp's socket_timeout=30 with
 # retries=10 can outlive any shutdown. Mirrors loop.shutdown_default_executor()'s.
 _SHUTDOWN_TIMEOUT_SECS = 10.0
+# Jobs the -debug percentiles are taken over: the most recent this many, so the line
+# describes the pool as it is now rather than averaged over the process's life.
+_STATS_WINDOW = 256
+
+# Exported over OTLP (src/telemetry.py). Proxies until setup installs the provider,
+# so creating them at import costs nothing under OTEL_SDK_DISABLED. Every record is
+# made on the loop thread at a point run() already passes through; the attributes
+# are low-cardinality by construction (a priority, a profile label, an outcome).
+_meter = get_meter(__name__)
+_QUEUE_WAIT = _meter.create_histogram(
+    "ytdlp.pool.queue_wait",
+    unit="s",
+    description="Time a job waited in its lane for a worker.",
+)
+_RUN_TIME = _meter.create_histogram(
+    "ytdlp.pool.run_time",
+    unit="s",
+    description="Time from handing a job to the executor to its outcome.",
+)
+_IN_FLIGHT = _meter.create_up_down_counter(
+    "ytdlp.pool.in_flight", description="Jobs holding a worker slot."
+)
+_EVENTS = _meter.create_counter(
+    "ytdlp.pool.events",
+    description="Executor lifecycle events: heal, recycle, and job abort.",
+)
 
 
 def _warmup_noop() -> None:
@@ -50,39 +123,129 @@ def _warmup_noop() -> None:
     return None
 
 
-def _worker_init(log_queue: Optional[Any] = None) -> None:
+# Worker-side abort state: the board _worker_init received, and the id of the job
+# this worker is running (0 between jobs). Never set in the parent.
+_abort_board: Optional[Any] = None
+_current_job = 0
+
+
+class JobAborted(BaseException):
+    """Raised inside a worker's job when the parent cancelled it. A BaseException, like
+    KeyboardInterrupt, so neither yt-dlp's retry loops nor _picklable_call's net can
+    swallow it and carry on extracting for nobody. Nothing in the parent awaits it:
+    the caller was already cancelled, and the job only ends so its worker is free."""
+
+
+def _slot(job_id: int) -> int:
+    # Three int64s per job on the board: [started job, its worker's pid, aborted job].
+    return 3 * (job_id % _ABORT_SLOTS)
+
+
+def _on_abort_signal(signum: int, frame: Any) -> None:
+    """Interrupt the running job if the board marks it aborted. The signal is only
+    ever sent to the pid that claimed the job, but a job that finished just before it
+    landed leaves a successor running, hence the check; between jobs it is a no-op."""
+    job = _current_job
+    if job and _abort_board is not None and _abort_board[_slot(job) + 2] == job:
+        raise JobAborted(f"job {job} cancelled by the parent")
+
+
+def _worker_init(
+    log_queue: Optional[Any] = None, abort_board: Optional[Any] = None
+) -> None:
     """Per-worker setup, hardened so it can never raise: per the stdlib contract
     (verified on 3.14.6) an initializer that raises makes every pending AND future submit
     raise BrokenProcessPool, and run()'s heal-once retry cannot help since a rebuilt pool
     runs the same initializer. Unstructured worker logs beat bricking all extraction —
-    reported on stderr, because what just failed is the logging configuration.
+    reported on stderr, because what just failed is the logging configuration. A
+    failed abort-handler install only costs cancellation its teeth (see _abort).
     """
     try:
         configure_worker_logging(log_queue)
     except Exception:
         print("yt-dlp worker logging setup failed:", file=sys.stderr)
         traceback.print_exc()
+    if abort_board is None or _ABORT_SIGNAL is None:
+        return
+    global _abort_board
+    try:
+        signal.signal(_ABORT_SIGNAL, _on_abort_signal)
+        _abort_board = abort_board
+    except Exception:
+        print("yt-dlp worker abort handler setup failed:", file=sys.stderr)
+        traceback.print_exc()
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """forkserver wherever it exists (every Unix; already the 3.14 default on Linux),
+    spawn elsewhere — named explicitly because max_tasks_per_child refuses fork, and
+    the worker-log queue must come from the same context as the workers it crosses
+    into. The forkserver preloads _FORKSERVER_PRELOAD, so workers fork warm."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Read when the forkserver starts (the first spawn), ignored after; setting it
+    # on every call is what keeps the first spawn, whoever makes it, covered.
+    context.set_forkserver_preload(list(_FORKSERVER_PRELOAD))
+    return context
+
+
+def _worker_rss_bytes(pid: int) -> Optional[int]:
+    """A worker's resident set from /proc/<pid>/status; None off Linux, or for a
+    worker that exited between listing and reading."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError, IndexError, ValueError:
+        return None
+    return None
 
 
-def _trace_carrier() -> dict[str, str]:
+def trace_carrier() -> dict[str, str]:
     """The parent's trace context as picklable strings for a worker to rebind. Workers
     have no TracerProvider, so get_current_span() is always invalid there and correlation
-    must be carried explicitly. Empty when no span is active (prewarm, tests)."""
+    must be carried explicitly. Empty when no span is active (prewarm, tests).
+
+    `trace_flags` (W3C hex) rides along for a process that opens spans under the
+    carrier — the yt-dlp service — so it samples the trace as the caller did."""
     ctx = trace.get_current_span().get_span_context()
     if not ctx.is_valid:
         return {}
     return {
         "trace_id": format(ctx.trace_id, "032x"),
         "span_id": format(ctx.span_id, "016x"),
+        "trace_flags": format(ctx.trace_flags, "02x"),
     }
 
 
-def _call_with_context(carrier: dict[str, str], fn: Callable[..., T], *args: Any) -> T:
+def _call_with_context(
+    carrier: dict[str, str], job_id: int, fn: Callable[..., T], *args: Any
+) -> T:
     """Bind the parent's trace context, then run fn through the picklable-error net.
     Runs in the worker (or the test thread). bound_contextvars resets on exit, so the
-    worker's next job does not inherit a stale trace_id."""
-    with structlog.contextvars.bound_contextvars(**carrier):
-        return _picklable_call(fn, *args)
+    worker's next job does not inherit a stale trace_id.
+
+    In a worker with an abort board the job is claimed first — pid before id, so a
+    parent that reads the id also reads the right pid — and one the parent cancelled
+    before it started (it sat in the executor's call queue) ends here unrun."""
+    global _current_job
+    board = _abort_board
+    if board is None:
+        with structlog.contextvars.bound_contextvars(**carrier):
+            return _picklable_call(fn, *args)
+    slot = _slot(job_id)
+    board[slot + 1] = os.getpid()
+    board[slot] = job_id
+    try:
+        _current_job = job_id
+        if board[slot + 2] == job_id:
+            raise JobAborted(f"job {job_id} cancelled before it started")
+        with structlog.contextvars.bound_contextvars(**carrier):
+            return _picklable_call(fn, *args)
+    finally:
+        _current_job = 0
 
 
 class RemoteCallError(Exception):
@@ -118,6 +281,21 @@ def _picklable_call(fn: Callable[..., T], *args: Any) -> T:
         raise
 
 
+class ExtractPriority(IntEnum):
+    """Dispatch classes for pool work, most urgent first. Lower value wins: a queued
+    job never starts ahead of a queued job of a more urgent class, whatever order
+    they arrived in. Within a class, FIFO."""
+
+    # A user is waiting on the reply: -play, -playnow.
+    INTERACTIVE = 0
+    # The playback loop resolving the song that plays next; a stall is dead air.
+    PLAYBACK = 1
+    # Background stream prefetch for songs further down a queue.
+    PREFETCH = 2
+    # Whole-playlist enumeration: large, slow, and nobody hears the difference.
+    BULK = 3
+
+
 class PoolClosedError(RuntimeError):
     """Raised when work is submitted after shutdown(). An error rather than a silent
     rebuild: a submit during shutdown means a background task outlived close(), and fresh
@@ -126,16 +304,67 @@ class PoolClosedError(RuntimeError):
     """
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GuildLoad:
+    """One guild's footprint in the pool. `guild_id` None is work no guild asked for
+    (or that could not be attributed), scheduled as one more flow."""
+
+    guild_id: Optional[int]
+    running: int
+    queued: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PoolStats:
+    """What the pool's jobs have cost. The counts are for the process's life; the
+    percentiles (seconds) cover the last _STATS_WINDOW jobs and are None before the
+    first. `wait` is time queued for a slot, `run` is time in the executor, so a high
+    wait with a normal run is a pool too small, and the reverse is YouTube."""
+
+    completed: int = 0
+    failed: int = 0
+    aborted: int = 0
+    wait_p50: Optional[float] = None
+    wait_p95: Optional[float] = None
+    run_p50: Optional[float] = None
+    run_p95: Optional[float] = None
+
+    @property
+    def jobs(self) -> int:
+        return self.completed + self.failed + self.aborted
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PoolState:
     """The pool's lifecycle as -debug reports it. `spawned` is False until the first
     extraction — the executor is lazy — and `generation` counts executors BUILT, so
-    a value above 1 means a worker died abnormally and the pool was healed."""
+    a value above 1 means a worker died abnormally and the pool was healed.
+
+    `guilds` lists every guild with work running or queued, busiest first;
+    `guild_share` is the most workers any one of them may hold for background work.
+    `capacity` is where the autoscaler currently sits between `min_workers` and
+    `max_workers`; `recycled` counts executors retired on purpose (memory or idle),
+    so `generation - recycled - 1` is the number of heals.
+
+    `service` is the address of the extraction service a RemoteYtdlpPool submits
+    to (src/ytdlp_service.py), where the workers are; empty for this pool."""
 
     max_workers: int
     spawned: bool
     generation: int
     closed: bool
+    min_workers: int = 1
+    capacity: int = 0
+    recycled: int = 0
+    running: int = 0
+    guild_share: int = 1
+    guilds: tuple[GuildLoad, ...] = ()
+    stats: PoolStats = PoolStats()
+    service: str = ""
+
+    @property
+    def queued(self) -> int:
+        return sum(load.queued for load in self.guilds)
 
 
 class YtdlpPool:
@@ -151,15 +380,54 @@ class YtdlpPool:
         self,
         max_workers: int = _DEFAULT_WORKERS,
         executor_factory: Optional[Callable[[], Executor]] = None,
+        *,
+        interactive_reserve: int = _DEFAULT_INTERACTIVE_RESERVE,
+        guild_share: Optional[int] = _DEFAULT_GUILD_SHARE,
+        min_workers: int = _DEFAULT_MIN_WORKERS,
+        scale_up_wait: float = _DEFAULT_SCALE_UP_WAIT_SECS,
+        idle_secs: float = _DEFAULT_IDLE_SECS,
+        max_tasks_per_worker: int = _DEFAULT_MAX_TASKS_PER_WORKER,
+        worker_rss_mb: int = _DEFAULT_WORKER_RSS_MB,
     ) -> None:
         self._max_workers = max_workers
+        # Autoscaling. Admission is what scales: `_capacity` replaces max_workers in
+        # every limit, and the executor — sized to the ceiling — spawns a process only
+        # when a submit finds none idle, so processes follow capacity up. Down is
+        # _reap's job. Loop-thread only, like the admission state below.
+        self._min_workers = max(1, min(min_workers, max_workers))
+        self._capacity = self._min_workers
+        self._scale_up_wait = scale_up_wait
+        self._idle_secs = idle_secs
+        self._max_tasks_per_worker = max_tasks_per_worker or None
+        self._worker_rss_bytes = worker_rss_mb * 1_048_576
+        self._scale_due = False
+        self._scale_timer: Optional[asyncio.TimerHandle] = None
+        self._reap_timer: Optional[asyncio.TimerHandle] = None
+        # Most jobs running at once since the last _reap — what capacity was needed.
+        self._peak = 0
+        # Admission, in front of the executor rather than inside it: the executor's
+        # own queue is FIFO, so at most max_workers jobs are ever submitted and the
+        # rest wait here. Each priority lane holds one FIFO flow per guild, served
+        # round-robin — dict order is the rotation, and a served flow moves to the
+        # back. Loop-thread only — run() is the sole writer — so none of it is under
+        # _lock.
+        self._reserve = max(0, min(interactive_reserve, max_workers - 1))
+        background = max_workers - self._reserve
+        self._guild_share = max(1, min(guild_share or -(-background // 2), background))
+        self._running = 0
+        self._running_by_guild: Counter[Optional[int]] = Counter()
+        self._lanes: dict[
+            ExtractPriority, dict[Optional[int], deque[asyncio.Future[None]]]
+        ] = {priority: {} for priority in ExtractPriority}
         self._executor_factory = executor_factory or self._spawn_process_pool
         self._executor: Optional[Executor] = None
         self._closed = False
         # Monotonic per executor built, so "the pool broke" logs from before and after a
         # rebuild are distinguishable and repeated breaks don't look like one break.
         self._generation = 0
-        # Guards _executor, _closed and _generation. Defence in depth — aclose() keeps
+        # Executors retired on purpose by _recycle, as opposed to healed by _replace.
+        self._recycled = 0
+        # Guards _executor, _closed, _generation and _recycled. Defence in depth — aclose() keeps
         # every mutation on the loop thread — but shutdown() may run from atexit/signal.
         self._lock = threading.Lock()
         # Worker-log plumbing. Pool-scoped, not executor-scoped: built on the first real
@@ -167,23 +435,45 @@ class YtdlpPool:
         # parent's root handlers regardless of generation. None under the test seam.
         self._log_queue: Optional[Any] = None
         self._log_listener: Optional[QueueListener] = None
+        # Cancellation plumbing, pool-scoped for the same reason: a lock-free shared
+        # int64 array every worker of every generation inherits, where a worker claims
+        # the job it starts and the parent marks the jobs it aborts (see _abort).
+        # Job ids are never 0, which is "no job" on both sides.
+        self._abort_board: Optional[Any] = None
+        self._job_ids = itertools.count(1)
+        # -debug's job statistics. Loop-thread only, like admission, and written at
+        # the same points: plain ints and bounded deques, O(1) per job and no lock.
+        # The OTLP instruments above carry the same numbers with full history.
+        self._completed = 0
+        self._failed = 0
+        self._aborted = 0
+        self._waits: deque[float] = deque(maxlen=_STATS_WINDOW)
+        self._runs: deque[float] = deque(maxlen=_STATS_WINDOW)
 
     def _spawn_process_pool(self) -> Executor:
         # initializer runs _worker_init() per worker so yt-dlp's warnings reach the
         # parent structured. Cheap under the lock: __init__ does not spawn.
+        context = _mp_context()
         if self._log_listener is None:
             # respect_handler_level=True so a worker DEBUG record is not force-emitted
             # by an INFO handler. Takes the root handlers live at spawn time — post-
             # setup_telemetry() in production, so worker records reach Loki.
-            self._log_queue = multiprocessing.Queue()
+            self._log_queue = context.Queue()
             self._log_listener = QueueListener(
                 self._log_queue, *logging.root.handlers, respect_handler_level=True
             )
             self._log_listener.start()
+        if self._abort_board is None and _ABORT_SIGNAL is not None:
+            self._abort_board = context.RawArray("q", 3 * _ABORT_SLOTS)
+        # max_tasks_per_child is the stdlib's own recycling: the worker exits after
+        # sending its last result and the executor spawns the replacement — a clean
+        # exit, never a BrokenProcessPool, so heal-once is untouched.
         return ProcessPoolExecutor(
             max_workers=self._max_workers,
             initializer=_worker_init,
-            initargs=(self._log_queue,),
+            initargs=(self._log_queue, self._abort_board),
+            mp_context=context,
+            max_tasks_per_child=self._max_tasks_per_worker,
         )
 
     def _stop_log_listener(self) -> None:
@@ -203,15 +493,46 @@ class YtdlpPool:
 
     @property
     def state(self) -> PoolState:
-        """A read-only lifecycle snapshot for -debug. Deliberately only what the
-        pool already tracks: an in-flight or completed-extraction counter would be
-        bookkeeping on the hot path for a diagnostic line."""
+        """A read-only snapshot for -debug: lifecycle, the admission counts the pool
+        keeps to schedule, and the job statistics run() keeps beside them. The
+        percentiles sort at most _STATS_WINDOW samples, here rather than per job.
+        Read on the loop thread, like every admission write."""
+        queued: Counter[Optional[int]] = Counter()
+        for flows in self._lanes.values():
+            for guild_id, flow in flows.items():
+                queued[guild_id] += len(flow)
+        guilds = sorted(
+            (
+                GuildLoad(
+                    guild_id=guild_id,
+                    running=self._running_by_guild[guild_id],
+                    queued=queued[guild_id],
+                )
+                for guild_id in self._running_by_guild.keys() | queued.keys()
+            ),
+            key=lambda load: (-(load.running + load.queued), str(load.guild_id)),
+        )
         with self._lock:
             return PoolState(
                 max_workers=self._max_workers,
                 spawned=self._executor is not None,
                 generation=self._generation,
                 closed=self._closed,
+                min_workers=self._min_workers,
+                capacity=self._capacity,
+                recycled=self._recycled,
+                running=self._running,
+                guild_share=self._guild_share,
+                guilds=tuple(guilds),
+                stats=PoolStats(
+                    completed=self._completed,
+                    failed=self._failed,
+                    aborted=self._aborted,
+                    wait_p50=percentile(self._waits, 0.5),
+                    wait_p95=percentile(self._waits, 0.95),
+                    run_p50=percentile(self._runs, 0.5),
+                    run_p95=percentile(self._runs, 0.95),
+                ),
             )
 
     def _acquire(self) -> Executor:
@@ -234,43 +555,334 @@ class YtdlpPool:
             if self._executor is not broken:
                 return
             self._executor = None
+        _EVENTS.add(1, {"event": "heal"})
         try:
             broken.shutdown(wait=False, cancel_futures=True)
         except Exception as e:
             log.debug(f"discarding broken yt-dlp pool raised: {e}")
 
-    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+    def _recycle(self, executor: Executor, reason: str) -> None:
+        """Retire `executor` on purpose: later submits build a fresh one, while jobs
+        already in it run to completion — shutdown(wait=False) without cancelling,
+        so nothing sees BrokenProcessPool and heal-once stays for real deaths. Idle
+        workers exit at once, busy ones after their job. Identity-checked like
+        _replace, and a no-op for a pool that was never spawned.
+        """
+        with self._lock:
+            if self._closed or self._executor is not executor:
+                return
+            self._executor = None
+            self._recycled += 1
+            generation = self._generation
+        _EVENTS.add(1, {"event": "recycle"})
+        log.info(f"recycling yt-dlp pool #{generation}: {reason}")
+        try:
+            executor.shutdown(wait=False)
+        except Exception as e:
+            log.debug(f"retiring yt-dlp pool raised: {e}")
+        try:
+            self._spawn_warm(self._acquire(), self._capacity)
+        except PoolClosedError:
+            pass  # closed since the check above; nothing left to warm
+
+    def _processes(self, executor: Executor) -> list[int]:
+        """The executor's worker pids, from the stdlib's own pid → Process map; a
+        thread pool (tests) has none. The executor's manager thread mutates the map,
+        so a copy that races it is simply skipped — the next job reads it again."""
+        try:
+            return list(getattr(executor, "_processes", None) or ())
+        except RuntimeError:
+            return []
+
+    def _check_memory(self, executor: Executor) -> None:
+        """Recycle the pool once any of its workers passes the RSS watermark. The
+        whole executor rather than the one worker: the stdlib offers no way to retire
+        a single worker except killing it, which is exactly a BrokenProcessPool.
+        Local /proc reads, cheap enough to run after every job."""
+        if not self._worker_rss_bytes:
+            return
+        for pid in self._processes(executor):
+            rss = _worker_rss_bytes(pid)
+            if rss is not None and rss > self._worker_rss_bytes:
+                self._recycle(
+                    executor,
+                    f"worker {pid} at {rss // 1_048_576} MB RSS, over the "
+                    f"{self._worker_rss_bytes // 1_048_576} MB watermark",
+                )
+                return
+
+    def _limit(self, priority: ExtractPriority) -> int:
+        """How many jobs may be running for `priority` to start one more. The reserve
+        shrinks with capacity, so a scaled-down pool still runs background work."""
+        if priority is ExtractPriority.INTERACTIVE:
+            return self._capacity
+        return self._capacity - min(self._reserve, self._capacity - 1)
+
+    def _scale_up(self, priority: ExtractPriority) -> bool:
+        """Called when `priority` has work queued for want of capacity; True if
+        capacity grew and dispatch should go round again. Background work grows the
+        pool only once it has queued for scale_up_wait — the timer's pass sets
+        _scale_due — so a burst that a busy worker would absorb spawns nothing."""
+        if self._capacity >= self._max_workers:
+            return False
+        if (
+            priority is ExtractPriority.INTERACTIVE
+            or self._scale_up_wait <= 0
+            or self._scale_due
+        ):
+            self._scale_due = False
+            self._capacity += 1
+            self._arm_reap()
+            return True
+        if self._scale_timer is None:
+            self._scale_timer = asyncio.get_running_loop().call_later(
+                self._scale_up_wait, self._on_scale_timer
+            )
+        return False
+
+    def _on_scale_timer(self) -> None:
+        self._scale_timer = None
+        if self.is_closed:
+            return
+        self._scale_due = True
+        self._dispatch()
+        self._scale_due = False
+
+    def _arm_reap(self) -> None:
+        if self._reap_timer is None and self._capacity > self._min_workers:
+            self._reap_timer = asyncio.get_running_loop().call_later(
+                self._idle_secs, self._reap
+            )
+
+    def _reap(self) -> None:
+        """Shrink capacity to what the last idle_secs actually used (never below the
+        floor), and recycle the executor if it still holds more processes than that:
+        the stdlib never lets an idle worker go on its own. The replacement is
+        prewarmed to the new capacity, so the shrink costs no cold start."""
+        self._reap_timer = None
+        if self.is_closed:
+            return
+        used = max(self._peak, self._running, self._min_workers)
+        self._peak = self._running
+        if used < self._capacity:
+            self._capacity = used
+            with self._lock:
+                executor = self._executor
+            if executor is not None and len(self._processes(executor)) > used:
+                self._recycle(executor, f"idle — scaling down to {used} workers")
+        self._arm_reap()
+
+    def _eligible(self, priority: ExtractPriority, guild_id: Optional[int]) -> bool:
+        """Whether `guild_id` may take another slot for `priority` work. INTERACTIVE is
+        exempt from the share: a guild's own -play must never wait out its own queued
+        prefetches, and a command is bounded by people typing it anyway."""
+        if priority is ExtractPriority.INTERACTIVE:
+            return True
+        return self._running_by_guild[guild_id] < self._guild_share
+
+    def _dispatch(self) -> None:
+        """Hand free slots to queued jobs, most urgent class first, and within a class
+        round-robin across guilds — deficit round-robin with every job costing one
+        quantum, since what a job will cost is unknown until it ends. A guild at its
+        share is passed over rather than blocking the guilds behind it. A class that
+        stops for want of capacity blocks every class behind it (each later limit is
+        no higher); one that stops because only capped guilds are left does not."""
+        for priority in ExtractPriority:
+            flows = self._lanes[priority]
+            while flows and self._running < self._limit(priority):
+                for guild_id in flows:
+                    if self._eligible(priority, guild_id):
+                        break
+                else:
+                    break  # only guilds at their share are left in this class
+                flow = flows.pop(guild_id)
+                waiter = flow.popleft()
+                if flow:
+                    flows[guild_id] = flow  # to the back of the rotation
+                if waiter.done():
+                    continue  # cancelled while queued
+                waiter.set_result(None)
+                self._take(guild_id)
+            else:
+                if flows:
+                    if self._scale_up(priority):
+                        return self._dispatch()
+                    return
+
+    def _take(self, guild_id: Optional[int]) -> None:
+        self._running += 1
+        self._running_by_guild[guild_id] += 1
+        self._peak = max(self._peak, self._running)
+        _IN_FLIGHT.add(1)
+
+    async def _admit(self, priority: ExtractPriority, guild_id: Optional[int]) -> None:
+        """Wait for a slot. Every job queues, then one dispatch pass runs, so an
+        arrival starts at once only if the schedule would have picked it anyway —
+        FIFO holds within a guild's flow and nothing overtakes a more urgent job."""
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._lanes[priority].setdefault(guild_id, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted in the same tick the caller was cancelled: the slot is
+                # ours, so pass it on rather than leak it.
+                self._release(guild_id)
+            else:
+                # cancel() cancels the waiter at once, and a _release() in the same
+                # tick can pop it before this runs — taking the flow with it once
+                # that left it empty. Gone means nothing left to withdraw.
+                flows = self._lanes[priority]
+                flow = flows.get(guild_id)
+                if flow is not None and waiter in flow:
+                    flow.remove(waiter)
+                    if not flow:
+                        del flows[guild_id]
+            raise
+
+    def _release(self, guild_id: Optional[int]) -> None:
+        self._running -= 1
+        self._running_by_guild[guild_id] -= 1
+        _IN_FLIGHT.add(-1)
+        if not self._running_by_guild[guild_id]:
+            del self._running_by_guild[guild_id]
+        self._dispatch()
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: ExtractPriority = ExtractPriority.INTERACTIVE,
+        guild_id: Optional[int] = None,
+        label: str = "",
+    ) -> T:
         """Run `fn(*args)` in the pool, healing a broken pool once. A ProcessPoolExecutor
         breaks permanently when a worker dies abnormally (most plausibly the OOM killer),
         after which every submit raises BrokenProcessPool for the life of the process; a
         second failure propagates. `fn` is a parameter, never stored — looked up in the
         caller's module at call time, which keeps `patch(...)` on it working.
+
+        `priority` picks the lane the job queues in while every worker is busy. The
+        default is the most urgent class, so a caller that forgets to classify its work
+        is never the one left waiting. `guild_id` is the flow the job is scheduled
+        in, so one guild's backlog cannot hold every worker (see _dispatch). `label`
+        names the kind of work for the metrics only — the pool never reads it.
+
+        Cancelling the task awaiting this is the abort handle. It returns at once,
+        whatever the job is doing: a queued job leaves its lane, a submitted one that
+        has not started is cancelled in the executor, and a running one is interrupted
+        inside its worker (_abort) — the worker survives and takes the next job. The
+        slot stays held until the worker actually lets go, so an abort never lets the
+        pool run more jobs than it has workers.
         """
         loop = asyncio.get_running_loop()
-        carrier = _trace_carrier()
-        executor = self._acquire()
+        carrier = trace_carrier()
+        # Checked before queueing too, so a closed pool fails fast rather than after
+        # a wait for a slot that would only end in the same error.
+        self._acquire()
+        attributes = {"priority": priority.name.lower(), "profile": label}
+        queued_at = loop.time()
+        await self._admit(priority, guild_id)
+        started = loop.time()
+        self._waits.append(started - queued_at)
+        _QUEUE_WAIT.record(started - queued_at, attributes)
+        job_id = next(self._job_ids)
+        future: Optional[concurrent.futures.Future[T]] = None
+        held = False
+        outcome = "error"
         try:
-            return await loop.run_in_executor(
-                executor, _call_with_context, carrier, fn, *args
-            )
-        except BrokenProcessPool:
-            log.warning(
-                f"yt-dlp process pool #{self._generation} broke (a worker died) — "
-                "rebuilding and retrying once"
-            )
-            self._replace(executor)
-            return await loop.run_in_executor(
-                self._acquire(), _call_with_context, carrier, fn, *args
-            )
+            executor = self._acquire()
+            try:
+                future = executor.submit(_call_with_context, carrier, job_id, fn, *args)
+                result = await asyncio.wrap_future(future)
+                outcome = "ok"
+                self._check_memory(executor)
+                return result
+            except BrokenProcessPool:
+                log.warning(
+                    f"yt-dlp process pool #{self._generation} broke (a worker died) — "
+                    "rebuilding and retrying once"
+                )
+                self._replace(executor)
+                future = self._acquire().submit(
+                    _call_with_context, carrier, job_id, fn, *args
+                )
+                result = await asyncio.wrap_future(future)
+                outcome = "ok"
+                return result
+        except asyncio.CancelledError:
+            outcome = "aborted"
+            # wrap_future already tried future.cancel(), which only a job still in
+            # the executor's queue accepts. Not done means a worker has it.
+            if future is not None and not future.done():
+                self._abort(job_id)
+                held = True
+                future.add_done_callback(partial(self._release_later, loop, guild_id))
+            raise
+        finally:
+            elapsed = loop.time() - started
+            _RUN_TIME.record(elapsed, {**attributes, "outcome": outcome})
+            # An aborted job's time is when its caller gave up, not what it cost, so
+            # it is counted but kept out of the percentiles.
+            if outcome == "aborted":
+                self._aborted += 1
+            else:
+                self._runs.append(elapsed)
+                if outcome == "ok":
+                    self._completed += 1
+                else:
+                    self._failed += 1
+            if not held:
+                self._release(guild_id)
+
+    def _abort(self, job_id: int) -> None:
+        """Interrupt a job a worker holds. Marked on the board first, so a job still
+        in the executor's call queue ends unrun when it is claimed; then, if a worker
+        has claimed it, that one pid is signalled and its handler raises JobAborted
+        inside the job. Signalled rather than killed: a killed worker is a
+        BrokenProcessPool, which fails every co-tenant job and spends heal-once on
+        nothing. Without a board (thread-backed tests, non-Unix) the job runs out."""
+        _EVENTS.add(1, {"event": "abort"})
+        board = self._abort_board
+        if board is None or _ABORT_SIGNAL is None:
+            return
+        slot = _slot(job_id)
+        board[slot + 2] = job_id
+        if board[slot] != job_id:
+            return  # not claimed yet; _call_with_context will see the mark
+        try:
+            os.kill(board[slot + 1], _ABORT_SIGNAL)
+        except ProcessLookupError:
+            pass  # the worker exited with the job (recycled); nothing left to stop
+        log.debug(f"aborted yt-dlp job {job_id} in worker {board[slot + 1]}")
+
+    def _release_later(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        guild_id: Optional[int],
+        _future: concurrent.futures.Future[Any],
+    ) -> None:
+        # The done callback of an aborted job, on the executor's manager thread.
+        try:
+            loop.call_soon_threadsafe(self._release, guild_id)
+        except RuntimeError:
+            pass  # the loop is closed; there is no one left to hand the slot to
 
     def prewarm(self) -> None:
-        """Spawn the workers now (from setup_hook) so the first -play doesn't absorb
-        process-spawn + yt-dlp-import latency. Fire-and-forget: submits one no-op per
-        worker and returns without awaiting them."""
-        executor = self._acquire()
+        """Spawn the floor's workers now (from setup_hook) so the first -play doesn't
+        absorb process-spawn + yt-dlp-import latency. Fire-and-forget: submits one
+        no-op per worker and returns without awaiting them. Workers above the floor
+        spawn as the autoscaler grows capacity."""
+        self._spawn_warm(self._acquire(), self._capacity)
+
+    @staticmethod
+    def _spawn_warm(executor: Executor, count: int) -> None:
         if not isinstance(executor, ProcessPoolExecutor):
             return  # a thread pool (tests) has nothing to spawn
-        for _ in range(self._max_workers):
+        # The executor spawns per submit that finds no idle worker, so `count`
+        # back-to-back no-ops spawn `count` processes.
+        for _ in range(count):
             executor.submit(_warmup_noop)
 
     def _close(self) -> Optional[Executor]:
@@ -281,6 +893,10 @@ class YtdlpPool:
         with self._lock:
             self._closed = True
             executor, self._executor = self._executor, None
+        for timer in (self._scale_timer, self._reap_timer):
+            if timer is not None:
+                timer.cancel()
+        self._scale_timer = self._reap_timer = None
         return executor
 
     async def aclose(self, timeout: float = _SHUTDOWN_TIMEOUT_SECS) -> None:
@@ -0,0 +1,36 @@
+"""What the yt-dlp pool's forkserver imports before it forks a single worker.
+
+Named in ytdlp_pool's forkserver preload and imported nowhere else: the side effects
+below are the whole point. The forkserver is the template every worker is forked
+from, so whatever it has already imported a worker starts with — a fresh or healed
+worker skips the CPython + yt-dlp import it used to pay (the seconds a healed
+BrokenProcessPool spent with no workers), and the pages stay shared copy-on-write
+across workers instead of being built once per process.
+
+Hardened like ytdlp_pool._worker_init, for a stronger reason: the stdlib swallows
+only an ImportError from a preload module, and any other exception kills the
+forkserver, after which no worker can ever be forked. A cold worker beats none.
+"""
+
+import gc
+import sys
+import traceback
+
+try:
+    # The module _ytdlp_extract unpickles from — and with it yt_dlp, discord and
+    # everything else a worker's first job would otherwise import.
+    import src.youtube  # noqa: F401
+
+    # The extractor registry and the plugins (bgutil's PO-token provider), both
+    # otherwise loaded by the first YoutubeDL a worker constructs.
+    import yt_dlp.extractor.extractors  # noqa: F401
+    from yt_dlp.plugins import load_all_plugins
+
+    load_all_plugins()
+except Exception:
+    print("yt-dlp forkserver preload failed:", file=sys.stderr)
+    traceback.print_exc()
+
+# Everything above is now immortal to the collector, so a worker's first collection
+# does not touch — and so copy — every page the template shares with it.
+gc.freeze()
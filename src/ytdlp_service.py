@@ -0,0 +1,368 @@
+"""The yt-dlp extraction pool as a standalone local service, shared by bot processes.
+
+In-process, every bot process carries its own YtdlpPool — its own workers (~80–120 MB
+RSS each) and its own yt-dlp disk cache — so running more than one gateway process
+multiplies both. With YTDLP_SERVICE_ADDRESS set, src.youtube submits to a service
+instead (RemoteYtdlpPool, same surface as YtdlpPool), and the service runs one
+YtdlpPool for everybody: extraction capacity is sized where it is spent, not per
+gateway process. Unset — the default — nothing here is used.
+
+    python -m src.ytdlp_service      # serves YTDLP_SERVICE_ADDRESS
+
+The address is a Unix socket path (`/run/ytdlp/ytdlp.sock`), and nothing else: a
+request is a pickle, and unpickling runs whatever the pickle says, so whoever can
+connect can run code as the service. A socket file lets the filesystem decide who
+that is — it is created group-writable and nothing else — where a TCP port, even on
+loopback, is open to every local user. On top of that the service runs only the
+jobs named in _JOBS, so a well-formed request cannot name any other callable.
+
+One connection per job: a length-prefixed pickle each way. Closing the connection is
+the abort handle — the service cancels the job, which YtdlpPool.run turns into an
+abort inside its worker, so a -clear on any bot stops its extractions on the service.
+Trace context crosses like it crosses into a worker (trace_carrier): the service
+opens its span under the caller's, so the worker's log lines still carry the
+caller's trace_id.
+"""
+
+import asyncio
+import importlib
+import os
+import pickle
+import signal
+import stat
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar, Union
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+from src.telemetry import get_tracer
+from src.util import get_logger
+from src.ytdlp_pool import (
+    ExtractPriority,
+    PoolClosedError,
+    PoolState,
+    RemoteCallError,
+    YtdlpPool,
+    trace_carrier,
+)
+
+log = get_logger(__name__)
+_tracer = get_tracer(__name__)
+
+T = TypeVar("T")
+
+# Empty (the default) runs the pool in-process; see make_pool().
+_SERVICE_ADDRESS = os.environ.get("YTDLP_SERVICE_ADDRESS", "")
+# A service that does not accept within this is down, not busy: accepting never waits
+# for a worker, only the reply does.
+_CONNECT_TIMEOUT_SECS = float(os.environ.get("YTDLP_SERVICE_CONNECT_TIMEOUT_SECS", "5"))
+# Group read/write: the bots that share a service share its group, nobody else may
+# connect — see the module docstring on what a connection can do.
+_SOCKET_MODE = 0o660
+# What a request may run, by qualified name: the extraction jobs src.youtube submits.
+# A name, not the callable, crosses the socket (ServiceJob.fn), and one not listed
+# here is refused before it reaches the pool.
+_JOBS = frozenset({"src.youtube._ytdlp_extract", "src.youtube._ytdlp_extract_batch"})
+
+_HEADER = struct.Struct("!I")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServiceJob:
+    """One YtdlpPool.run call, as it crosses the socket. `fn` is the job's qualified
+    name (_job_name), resolved against _JOBS on the service; `carrier` is the
+    caller's trace_carrier(); the rest are run()'s own arguments."""
+
+    fn: str
+    args: tuple[Any, ...]
+    priority: ExtractPriority
+    guild_id: Optional[int]
+    label: str
+    carrier: dict[str, str]
+
+
+def _socket_path(address: str) -> str:
+    """The service's Unix socket path. Raises ValueError for anything else — a
+    `host:port` included, see the module docstring."""
+    if not address.startswith("/"):
+        raise ValueError(
+            f"yt-dlp service address {address!r} is not an absolute Unix socket path"
+        )
+    return address
+
+
+def _job_name(fn: Callable[..., Any]) -> str:
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+def _resolve_job(name: str) -> Callable[..., Any]:
+    """The callable a request names. Raises PermissionError for one not in _JOBS,
+    without importing anything it names."""
+    if name not in _JOBS:
+        raise PermissionError(f"{name!r} is not a yt-dlp service job")
+    module, _, attr = name.rpartition(".")
+    fn: Callable[..., Any] = getattr(importlib.import_module(module), attr)
+    return fn
+
+
+def _frame(payload: bytes) -> bytes:
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return await reader.readexactly(size)
+
+
+def _dump_reply(status: str, value: Any) -> bytes:
+    """The reply frame. An outcome that will not pickle becomes a RemoteCallError
+    rather than a dropped connection, which the caller would read as the service
+    dying — the same net _picklable_call puts under a worker's results."""
+    try:
+        return pickle.dumps((status, value))
+    except Exception as e:
+        culprit = value if status == "error" else e
+        return pickle.dumps(
+            ("error", RemoteCallError(str(culprit), type(culprit).__name__))
+        )
+
+
+def _remote_context(carrier: dict[str, str]) -> Optional[Context]:
+    """The caller's span as a remote parent, or None (a root) without one. Its
+    flags are the caller's: a trace the bot chose not to sample is not recorded
+    here either (the sampler is parent-based, see src.telemetry)."""
+    if not carrier:
+        return None
+    parent = SpanContext(
+        trace_id=int(carrier["trace_id"], 16),
+        span_id=int(carrier["span_id"], 16),
+        is_remote=True,
+        trace_flags=TraceFlags(int(carrier.get("trace_flags", "00"), 16)),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(parent))
+
+
+class YtdlpService:
+    """Serves `pool` at `address`. The pool is a parameter, not built here: main()
+    hands it a real one, tests a thread-pool-backed one — the local stand-in that
+    puts both ends of the socket in one process."""
+
+    def __init__(self, pool: YtdlpPool, address: str) -> None:
+        self._pool = pool
+        self._address = address
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self) -> None:
+        path = _socket_path(self._address)
+        # A socket file outlives a killed service and would fail the bind; anything
+        # that is not a socket is someone else's file, so it is left to fail loudly.
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        self._server = await asyncio.start_unix_server(self._handle, path)
+        os.chmod(path, _SOCKET_MODE)
+
+    async def aclose(self) -> None:
+        """Stop accepting, then close the pool — which is what ends jobs in flight,
+        and with them their connections."""
+        if self._server is not None:
+            self._server.close()
+        await self._pool.aclose()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            job: ServiceJob = pickle.loads(await _read_frame(reader))
+        except Exception as e:
+            log.warning(f"yt-dlp service dropped an unreadable request: {e!r}")
+            writer.close()
+            return
+        try:
+            fn = _resolve_job(job.fn)
+        except Exception as e:
+            log.warning(f"yt-dlp service refused a request: {e}")
+            try:
+                writer.write(_frame(_dump_reply("error", e)))
+                await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+            return
+        run = asyncio.create_task(self._run(fn, job))
+        # The caller writes nothing after its request, so this completes only when
+        # it hangs up — cancelled, or gone.
+        hangup = asyncio.create_task(reader.read(1))
+        try:
+            await asyncio.wait({run, hangup}, return_when=asyncio.FIRST_COMPLETED)
+            if not run.done():
+                return  # the finally cancels it: an abort in its worker
+            if run.cancelled():
+                return  # the service is closing; the caller reads a hangup
+            error = run.exception()
+            if error is None:
+                reply = _dump_reply("ok", run.result())
+            else:
+                reply = _dump_reply("error", error)
+            writer.write(_frame(reply))
+            await writer.drain()
+        except ConnectionError:
+            pass  # the caller went away while the reply was on its way
+        finally:
+            run.cancel()
+            hangup.cancel()
+            writer.close()
+
+    async def _run(self, fn: Callable[..., Any], job: ServiceJob) -> Any:
+        with _tracer.start_as_current_span(
+            "ytdlp.service.run", context=_remote_context(job.carrier)
+        ):
+            return await self._pool.run(
+                fn,
+                *job.args,
+                priority=job.priority,
+                guild_id=job.guild_id,
+                label=job.label,
+            )
+
+
+class RemoteYtdlpPool:
+    """YtdlpPool's surface, submitting to a YtdlpService. Holds no connection between
+    jobs, so a restarted service is picked up by the next job; while it is down,
+    run() raises the connect error (OSError) and the caller fails like any other
+    extraction. Scheduling — lanes, guild shares, healing — is the service's, which
+    sees every bot's work and so schedules across all of them."""
+
+    def __init__(
+        self, address: str, connect_timeout: float = _CONNECT_TIMEOUT_SECS
+    ) -> None:
+        self._path = _socket_path(address)
+        self._address = address
+        self._connect_timeout = connect_timeout
+        self._closed = False
+        # Jobs this process has at the service; loop-thread only.
+        self._running = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    @property
+    def state(self) -> PoolState:
+        """This process's side only: the service's workers are not its to report."""
+        return PoolState(
+            max_workers=0,
+            spawned=False,
+            generation=0,
+            closed=self._closed,
+            running=self._running,
+            service=self._address,
+        )
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.wait_for(
+            asyncio.open_unix_connection(self._path), self._connect_timeout
+        )
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: ExtractPriority = ExtractPriority.INTERACTIVE,
+        guild_id: Optional[int] = None,
+        label: str = "",
+    ) -> T:
+        """YtdlpPool.run, over the socket. `fn` must be one of the service's _JOBS —
+        any other is refused there, raising PermissionError here. Cancelling returns
+        at once and closes the connection, which is what aborts the job on the
+        service."""
+        if self._closed:
+            raise PoolClosedError("yt-dlp extraction pool is shut down")
+        request = pickle.dumps(
+            ServiceJob(
+                fn=_job_name(fn),
+                args=args,
+                priority=priority,
+                guild_id=guild_id,
+                label=label,
+                carrier=trace_carrier(),
+            )
+        )
+        reader, writer = await self._connect()
+        self._running += 1
+        try:
+            writer.write(_frame(request))
+            await writer.drain()
+            try:
+                status, value = pickle.loads(await _read_frame(reader))
+            except asyncio.IncompleteReadError:
+                raise ConnectionError(
+                    f"yt-dlp service at {self._address} hung up mid-job"
+                ) from None
+        finally:
+            self._running -= 1
+            writer.close()
+        if status == "error":
+            raise value
+        return value
+
+    def prewarm(self) -> None:
+        """The service prewarms its own workers; nothing to spawn here."""
+
+    async def aclose(self) -> None:
+        self._closed = True
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._closed = True
+
+
+def make_pool() -> Union[YtdlpPool, RemoteYtdlpPool]:
+    """The pool src.youtube submits to: the service when YTDLP_SERVICE_ADDRESS names
+    one, an in-process YtdlpPool otherwise."""
+    if _SERVICE_ADDRESS:
+        return RemoteYtdlpPool(_SERVICE_ADDRESS)
+    return YtdlpPool()
+
+
+async def _serve(address: str) -> None:
+    pool = YtdlpPool()
+    service = YtdlpService(pool, address)
+    await service.start()
+    pool.prewarm()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    log.info(f"yt-dlp service listening on {address}")
+    try:
+        await stop.wait()
+    finally:
+        log.info("yt-dlp service shutting down")
+        await service.aclose()
+
+
+def main() -> None:
+    # Same first call as the bot's main(): structlog must be configured before
+    # anything logs, and the service's spans join the bots' traces in Tempo.
+    from src.telemetry import setup_telemetry, shutdown_telemetry
+
+    setup_telemetry()
+    if not _SERVICE_ADDRESS:
+        raise SystemExit("YTDLP_SERVICE_ADDRESS is not set")
+    try:
+        asyncio.run(_serve(_SERVICE_ADDRESS))
+    finally:
+        shutdown_telemetry()
+
+
+if __name__ == "__main__":
+    main()
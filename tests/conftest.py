@@ -84,6 +84,67 @@ def reset_probe_streak() -> Iterator[None]:
     youtube._unconfirmed_streak = 0
 
 
+@pytest.fixture(autouse=True)
+def reset_worker_ydls() -> Iterator[None]:
+    """Drop the reusable YoutubeDL instances between tests.
+
+    The thread-pool seam runs _ytdlp_extract in this process, so the worker-side
+    cache is this process's too. Its class check already refuses an instance built
+    under another test's patch; emptying it keeps "was one constructed" assertable.
+    """
+    import src.youtube as youtube
+
+    youtube._idle_ydls.clear()
+    yield
+    youtube._idle_ydls.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_extraction_failures() -> Iterator[None]:
+    """Zero the process-wide failure counts -debug renders, so one test's failed
+    extractions do not surface as a `pool errors` row in another's output."""
+    import src.youtube as youtube
+
+    youtube._failure_counts.clear()
+    yield
+    youtube._failure_counts.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_extract_times() -> Iterator[None]:
+    """Empty the window the hedge deadline is a percentile of, so a test's fast
+    fakes never pull the next test's deadline down to the floor."""
+    import src.youtube as youtube
+
+    youtube._extract_times.clear()
+    yield
+    youtube._extract_times.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_local_cache() -> Iterator[None]:
+    """Empty the in-process cache tier: every test gets its own fake Redis, and an
+    entry mirrored from the last one would answer for a key this one never wrote."""
+    import src.redis_client as redis_client
+
+    redis_client._local_cache.clear()
+    yield
+    redis_client._local_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def sequential_hand_over(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run the playback loop without the gapless hand-over unless a test opts in.
+
+    Song doubles are MagicMocks, which answer `primed` and `produced_audio` truthy
+    without ever having read a packet, so the hand-over would engage under every
+    loop test written against the sequential one. TestGaplessHandOff patches the
+    knob back on."""
+    import src.config as config
+
+    monkeypatch.setattr(config, "GAPLESS_PRIME_FRAMES", 0)
+
+
 @pytest.fixture(autouse=True)
 async def close_shared_http_sessions(
     monkeypatch: pytest.MonkeyPatch,
@@ -456,6 +517,9 @@ def music_bot(mock_bot: MagicMock) -> MusicBot:
     cog._active_spans = {}
     cog.voice_watchdog = VoiceWatchdog(cog)
     cog._restore_tasks = set()
+    # None, the no-Redis shape: a running refresher would re-extract the queues
+    # the tests build. TestStreamRefresher drives one directly.
+    cog.stream_refresher = None
     # Off, matching the ship default and the DEBUG_MODE scrub above: with debug
     # mode on, every embed grows a footer and the suite's embed assertions would be
     # asserting against decorated output everywhere. The mock cog used by player
@@ -504,6 +568,9 @@ def music_bot_with_redis(mock_bot: MagicMock, fake_redis_bot: Redis) -> MusicBot
     cog._active_spans = {}
     cog.voice_watchdog = VoiceWatchdog(cog)
     cog._restore_tasks = set()
+    # None, the no-Redis shape: a running refresher would re-extract the queues
+    # the tests build. TestStreamRefresher drives one directly.
+    cog.stream_refresher = None
     # Debug state, same shape __init__ builds. The cog reads these on every send and
     # now persists them, so a fixture without them tests a bot that cannot start.
     # Constructed, not hand-assembled: DebugSettings owns its own field set, so a
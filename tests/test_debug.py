@@ -28,6 +28,7 @@ from src.musicbot import MusicBot as MusicBotCog
 from src.util import spawn_background
 from tests.helpers import command_callback
 from src.musicplayer import MusicPlayer
+from src.ytdlp_pool import GuildLoad, PoolState, PoolStats
 from src.debug import (
     DebugAction,
     DebugInputs,
@@ -1368,6 +1369,113 @@ class TestRuntimeBlock:
         assert "<t:" not in line
         assert line == "uptime       1:02:05"
 
+    async def test_an_idle_pool_is_one_line(self) -> None:
+        lines = debug.runtime_lines()
+        pool = [line for line in lines if line.startswith(("yt-dlp pool", "pool "))]
+        assert len(pool) == 1
+        assert "queued" not in pool[0]
+
+    async def test_a_busy_pool_shows_its_backlog_and_the_busiest_guilds(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The per-guild row is what tells an operator one guild's playlist is
+        holding the pool, and whether the share is what is keeping it in check."""
+        state = PoolState(
+            max_workers=4,
+            spawned=True,
+            generation=1,
+            closed=False,
+            min_workers=1,
+            capacity=3,
+            running=3,
+            guild_share=2,
+            guilds=(
+                GuildLoad(guild_id=111, running=2, queued=40),
+                GuildLoad(guild_id=222, running=1, queued=0),
+            ),
+        )
+        monkeypatch.setattr(debug, "pool_state", lambda: state)
+
+        lines = debug.runtime_lines()
+
+        assert "yt-dlp pool  3/4 workers · spawned · 3 running · 40 queued" in lines
+        assert "pool guilds  ≤2 each · running+queued 111 2+40 · 222 1+0" in lines
+
+    async def test_recycled_executors_are_not_reported_as_heals(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """generation counts every executor built; only the ones nobody planned —
+        a worker died — are worth an operator's attention."""
+        state = PoolState(
+            max_workers=4,
+            spawned=True,
+            generation=5,
+            closed=False,
+            min_workers=4,
+            recycled=3,
+        )
+        monkeypatch.setattr(debug, "pool_state", lambda: state)
+
+        lines = debug.runtime_lines()
+
+        assert "yt-dlp pool  4 workers · spawned · healed 1× · 3 recycled" in lines
+
+    async def test_a_remote_pool_names_its_service_instead_of_workers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        state = PoolState(
+            max_workers=0,
+            spawned=False,
+            generation=0,
+            closed=False,
+            running=2,
+            service="/run/ytdlp/ytdlp.sock",
+        )
+        monkeypatch.setattr(debug, "pool_state", lambda: state)
+
+        lines = debug.runtime_lines()
+
+        assert "yt-dlp pool  service /run/ytdlp/ytdlp.sock · 2 running" in lines
+
+    async def test_job_stats_and_failures_get_a_row_each_once_there_are_any(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        state = PoolState(
+            max_workers=4,
+            spawned=True,
+            generation=1,
+            closed=False,
+            min_workers=4,
+            stats=PoolStats(
+                completed=40,
+                failed=5,
+                aborted=2,
+                wait_p50=0.0,
+                wait_p95=1.25,
+                run_p50=2.5,
+                run_p95=None,
+            ),
+        )
+        monkeypatch.setattr(debug, "pool_state", lambda: state)
+        monkeypatch.setattr(
+            debug,
+            "failure_counts",
+            lambda: [
+                ("unavailable", 3),
+                ("HTTPError", 1),
+                ("unsupported", 1),
+                ("x", 1),
+            ],
+        )
+
+        lines = debug.runtime_lines()
+
+        assert (
+            "pool jobs    40 ok · 5 failed · 2 aborted · wait p50 0.0s p95 1.2s · "
+            "run p50 2.5s p95 –"
+        ) in lines
+        assert "pool errors  unavailable 3 · HTTPError 1 · unsupported 1 · …" in lines
+
 
 class TestGitSha:
     @pytest.fixture(autouse=True)
@@ -1487,6 +1595,24 @@ class TestRedisBlock:
         )
         assert "1284 total · 92 persistent" in keys
 
+    def test_renders_the_local_tier_hit_ratio_per_prefix(self) -> None:
+        from src.redis_client import LocalCacheStats
+
+        first, second = self._samples()
+        stats = [
+            LocalCacheStats(prefix="ytdl:source", hits=0, misses=0),
+            LocalCacheStats(prefix="ytdl:stream", hits=3, misses=1),
+        ]
+        with patch.object(debug, "local_cache_stats", return_value=stats):
+            lines = debug.redis_lines(first, second, dbsize=0)
+        # A prefix nothing has looked up yet has no ratio to show.
+        assert lines[-1] == "local        ytdl:stream 75% of 4"
+
+    def test_no_local_row_before_any_lookup(self) -> None:
+        first, second = self._samples()
+        lines = debug.redis_lines(first, second, dbsize=0)
+        assert not any(line.startswith("local") for line in lines)
+
     def test_degrades_when_info_is_unavailable(self) -> None:
         lines = debug.redis_lines(None, None, dbsize=None)
         assert len(lines) == 1
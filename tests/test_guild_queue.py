@@ -8,7 +8,7 @@ import redis.asyncio as aioredis
 from dataclasses import replace
 from typing import Any
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -1747,6 +1747,14 @@ class TestDisplayAccess:
         await gq.put([first, _qobj(2, mock_author)])
         assert gq.peek_next() is first
 
+    async def test_upcoming_skips_the_claimed_head(
+        self, gq: GuildQueue, mock_author: MagicMock
+    ) -> None:
+        items = [_qobj(n, mock_author) for n in range(4)]
+        await gq.put(items)
+        gq.get_nowait()  # claimed: whoever holds it is already resolving it
+        assert gq.upcoming(2) == items[1:3]
+
 
 # ── loop dequeue bookkeeping ──────────────────────────────────────────────────
 
@@ -1924,6 +1932,32 @@ class TestDequeueBookkeeping:
         await gq.clear()
         assert await gq.try_commit_dequeue(generation) is False
 
+    async def test_try_commit_dequeue_runs_then_under_the_lock(
+        self, gq: GuildQueue, mock_author: MagicMock
+    ) -> None:
+        """The hand-over's LPOP rides `then`: no bulk mutation may rebuild the
+        mirror between the in-memory commit and it."""
+        await gq.put([_qobj(1, mock_author)])
+        await gq.get()
+        held: list[bool] = []
+
+        async def then() -> None:
+            held.append(gq._mutex.locked())
+
+        assert await gq.try_commit_dequeue(gq.generation, then=then) is True
+        assert held == [True]
+
+    async def test_try_commit_dequeue_skips_then_when_refused(
+        self, gq: GuildQueue, mock_author: MagicMock
+    ) -> None:
+        await gq.put([_qobj(1, mock_author)])
+        await gq.get()
+        generation = gq.generation
+        await gq.clear()
+        then = AsyncMock()
+        assert await gq.try_commit_dequeue(generation, then=then) is False
+        then.assert_not_awaited()
+
 
 # ── requeue_front ─────────────────────────────────────────────────────────────
 
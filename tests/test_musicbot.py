@@ -38,6 +38,7 @@ from src.musicbot import (
 )
 from src.redis_client import HISTORY_CACHE_LIMIT, GuildRedisStore
 from src.util import EMBED_FIELD_LIMIT
+from src.ytdlp_pool import ExtractPriority
 from src.sources import (
     SpotifySource,
     SpotifyType,
@@ -824,6 +825,31 @@ class TestEnqueuePlaylist:
         assert source.url in embed.description
         assert "Track 1" in embed.description
 
+    async def test_yt_warms_the_queued_tracks(
+        self, music_bot: MusicBot, mock_ctx: MagicMock
+    ) -> None:
+        """Resolved YouTube tracks get their stream URLs warmed as one batch —
+        queue_put itself is told not to prefetch them one by one."""
+        source = YTSource(
+            url="https://www.youtube.com/playlist?list=PLtest",
+            type=YTType.PLAYLIST,
+            list_id="PLtest",
+        )
+        qobjs = [QueueObject("https://yt.com/watch?v=1", "Track 1", mock_ctx.author)]
+        mp = self._make_enqueue_mp(mock_ctx)
+
+        await music_bot._enqueue_playlist(
+            mock_ctx,
+            source,
+            ResolvedYoutubePlaylist(tracks=qobjs),
+            mp,
+            analytics=_ANALYTICS,
+            origin=_ORIGIN,
+        )
+
+        mp.queue_put.assert_awaited_once_with(qobjs, prefetch=False)
+        mp.warm_streams.assert_called_once_with(qobjs)
+
     async def test_yt_embed_states_the_skipped_songs(
         self, music_bot: MusicBot, mock_ctx: MagicMock
     ) -> None:
@@ -2242,6 +2268,7 @@ class TestVolumeCommand:
         self, music_bot: MusicBot, mock_ctx: MagicMock, mock_guild: MagicMock
     ) -> None:
         mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=True)
         mp.store.set_volume = AsyncMock(return_value=True)
         music_bot.get_mp = MagicMock(return_value=mp)
         await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
@@ -2253,6 +2280,7 @@ class TestVolumeCommand:
         self, music_bot: MusicBot, mock_ctx: MagicMock, mock_guild: MagicMock
     ) -> None:
         mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=True)
         mp.store = None
         music_bot.get_mp = MagicMock(return_value=mp)
         await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
@@ -2264,6 +2292,7 @@ class TestVolumeCommand:
         self, music_bot: MusicBot, mock_ctx: MagicMock, mock_guild: MagicMock
     ) -> None:
         mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=True)
         mp.store.set_volume = AsyncMock(return_value=True)
         music_bot.get_mp = MagicMock(return_value=mp)
         await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
@@ -2278,6 +2307,7 @@ class TestVolumeCommand:
         promises the level survives a restart. Confirming it anyway is the exact
         failure the debug toggle fixed: a setting that quietly reverts."""
         mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=True)
         mp.store.set_volume = AsyncMock(return_value=False)
         music_bot.get_mp = MagicMock(return_value=mp)
         await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
@@ -2286,6 +2316,29 @@ class TestVolumeCommand:
         # Still applied to this process's player, as the debug toggle is.
         assert mp.volume == 0.5
 
+    async def test_applies_to_the_playing_song(
+        self, music_bot: MusicBot, mock_ctx: MagicMock, mock_guild: MagicMock
+    ) -> None:
+        mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=True)
+        mp.store.set_volume = AsyncMock(return_value=True)
+        music_bot.get_mp = MagicMock(return_value=mp)
+        await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
+        mp.apply_volume.assert_awaited_once()
+        assert "next song" not in self._description(mock_ctx)
+
+    async def test_says_next_song_when_it_cannot_apply_live(
+        self, music_bot: MusicBot, mock_ctx: MagicMock, mock_guild: MagicMock
+    ) -> None:
+        """Without libopus the level is baked into ffmpeg's filter, so the
+        playing song keeps the old one and the reply must not claim otherwise."""
+        mp = MagicMock()
+        mp.apply_volume = AsyncMock(return_value=False)
+        mp.store.set_volume = AsyncMock(return_value=True)
+        music_bot.get_mp = MagicMock(return_value=mp)
+        await command_callback(MusicBot.volume)(music_bot, mock_ctx, "50")
+        assert "takes effect on next song" in self._description(mock_ctx)
+
     async def test_rejects_non_numeric_string(
         self, music_bot: MusicBot, mock_ctx: MagicMock
     ) -> None:
@@ -4655,7 +4708,10 @@ class TestPlaynow:
         with patch("src.musicbot.YTDL.prefetch_stream", new=prefetch):
             await command_callback(MusicBot.playnow)(music_bot, mock_ctx, url="test")
 
-        prefetch.assert_awaited_once_with(qobj, redis=music_bot.redis)
+        # INTERACTIVE: the user who typed -playnow is waiting on this extraction.
+        prefetch.assert_awaited_once_with(
+            qobj, redis=music_bot.redis, priority=ExtractPriority.INTERACTIVE
+        )
         assert order == ["prefetch", "interject"]
 
 
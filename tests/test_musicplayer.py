@@ -7,7 +7,7 @@ import dataclasses
 import re
 from zoneinfo import ZoneInfo
 import time
-from typing import Any, Never, cast
+from typing import Any, Never, Optional, cast
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Sequence
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
@@ -16,7 +16,9 @@ import orjson
 import pytest
 from opentelemetry import trace as trace_api
 
+from src import config
 from src.debug import RuntimeSnapshot
+from src.guild_history import GuildHistory
 from src.guild_queue import GuildQueue, RemoveMode
 from src.guild_state import (
     ANALYTICS_ZERO,
@@ -41,7 +43,7 @@ from src.musicplayer import (
 from src.redis_client import HISTORY_CACHE_LIMIT
 from src.sources import YTSource
 from src.util import cancel_task, fmt_duration
-from src.youtube import NpHostRef, QueueObject, YTDL
+from src.youtube import ExtractionError, NpHostRef, QueueObject, YTDL
 from tests.helpers import seed_queue, described, mocked, queue_object, stub_create_task
 
 
@@ -386,6 +388,54 @@ class TestQueuePut:
         mock_pf.assert_not_awaited()
 
 
+class TestWarmStreams:
+    async def test_warms_only_the_songs_near_the_queue_head(
+        self, music_player: MusicPlayer, mock_author: MagicMock
+    ) -> None:
+        """One batch, holding the playlist's songs that sit within _WARM_HEAD_SONGS
+        of the head — the rest would expire before they play."""
+        from src import musicplayer, youtube
+
+        await music_player.queue_put(
+            [QueueObject("https://yt.com/v=old", "Old", mock_author)], prefetch=False
+        )
+        tracks = [
+            QueueObject(f"https://yt.com/v={i}", f"Track {i}", mock_author)
+            for i in range(musicplayer._WARM_HEAD_SONGS + 3)
+        ]
+        await music_player.queue_put(tracks, prefetch=False)
+        with patch.object(
+            youtube.YTDL, "prefetch_streams", new=AsyncMock()
+        ) as mock_warm:
+            music_player.warm_streams(tracks)
+            await asyncio.sleep(0)
+
+        mock_warm.assert_awaited_once()
+        assert mock_warm.await_args is not None
+        warmed = mock_warm.await_args.args[0]
+        assert warmed == tracks[: musicplayer._WARM_HEAD_SONGS - 1]
+
+    async def test_nothing_spawns_when_no_song_is_near_the_head(
+        self, music_player: MusicPlayer, mock_author: MagicMock
+    ) -> None:
+        from src import musicplayer, youtube
+
+        ahead = [
+            QueueObject(f"https://yt.com/v=a{i}", f"Ahead {i}", mock_author)
+            for i in range(musicplayer._WARM_HEAD_SONGS)
+        ]
+        await music_player.queue_put(ahead, prefetch=False)
+        late = [QueueObject("https://yt.com/v=late", "Late", mock_author)]
+        await music_player.queue_put(late, prefetch=False)
+        with patch.object(
+            youtube.YTDL, "prefetch_streams", new=AsyncMock()
+        ) as mock_warm:
+            music_player.warm_streams(late)
+            await asyncio.sleep(0)
+
+        mock_warm.assert_not_awaited()
+
+
 # ── QueueClear ────────────────────────────────────────────────────────────────
 
 
@@ -4056,6 +4106,25 @@ class TestStreamSource:
             result = await music_player._stream_source(queue_obj)
         assert result is mock_ytdl
 
+    async def test_passes_the_voice_channels_bitrate(
+        self, music_player: MusicPlayer, queue_obj: QueueObject
+    ) -> None:
+        vc = MagicMock(spec=discord.VoiceClient)
+        vc.channel = MagicMock(spec=discord.VoiceChannel)
+        vc.channel.bitrate = 64000
+        music_player._guild.voice_client = vc
+        with patch("src.musicplayer.YTDL.yt_stream", new=AsyncMock()) as yt_stream:
+            await music_player._stream_source(queue_obj)
+        assert yt_stream.await_args.kwargs["channel_bitrate"] == 64000
+
+    async def test_no_bitrate_before_joining(
+        self, music_player: MusicPlayer, queue_obj: QueueObject
+    ) -> None:
+        music_player._guild.voice_client = None
+        with patch("src.musicplayer.YTDL.yt_stream", new=AsyncMock()) as yt_stream:
+            await music_player._stream_source(queue_obj)
+        assert yt_stream.await_args.kwargs["channel_bitrate"] is None
+
 
 # ── FromContext ───────────────────────────────────────────────────────────────
 
@@ -6355,6 +6424,21 @@ class TestLoop:
         # 32-hex trace id, or the "unavailable" sentinel when no span is active.
         assert music_player._last_stream_error.trace_id
 
+    async def test_stream_source_names_an_extraction_failure_safely(
+        self, music_player: MusicPlayer, queue_obj: QueueObject
+    ) -> None:
+        """The skip notice carries the classified reason — the remembered note of
+        the negative cache included — not yt-dlp's raw message."""
+        known = ExtractionError(
+            "ERROR: [youtube] x: Private video", expected=True, remembered=True
+        )
+        with patch.object(YTDL, "yt_stream", new=AsyncMock(side_effect=known)):
+            await music_player._stream_source(queue_obj)
+
+        assert music_player._last_stream_error is not None
+        assert music_player._last_stream_error.detail == known.user_message
+        assert "known unplayable" in music_player._last_stream_error.detail
+
     async def test_resolve_failure_balances_queue_and_redis(
         self,
         music_player: MusicPlayer,
@@ -7687,6 +7771,296 @@ class TestLoopAdditional:
         mock_song.cleanup.assert_called_once()
 
 
+class TestGaplessHandOff:
+    """The prefetched song starts the moment the current one ends, and the ended
+    song's Redis bookkeeping runs under its audio instead of in the gap. Driven
+    through two real loop iterations, as the hand-over spans both: iteration 1
+    starts song 2 and writes its start transaction, iteration 2 adopts it."""
+
+    @pytest.fixture(autouse=True)
+    def _gapless(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(config, "GAPLESS_PRIME_FRAMES", 50)
+
+    @staticmethod
+    def _next_song(title: str) -> MagicMock:
+        song = MagicMock()
+        song.title = title
+        song.webpage_url = "https://www.youtube.com/watch?v=next"
+        song.duration_secs = 180
+        song.duration = "3:00"
+        song.thumbnail = None
+        song.uploader = None
+        song.start_offset = 0
+        song.elapsed_secs = 0.0
+        song.played_at = 0.0
+        song.interjected = False
+        song.is_resume = False
+        song.start_paused = False
+        song.analytics = ANALYTICS_ZERO
+        song.query_source = ""
+        song.user_input = None
+        song.persisted = True
+        song.primed = True
+        return song
+
+    async def _run(
+        self,
+        music_player: MusicPlayer,
+        first: MagicMock,
+        second: MagicMock,
+        *,
+        cleared: bool = False,
+        history_error: Optional[Exception] = None,
+    ) -> tuple[list[str], MagicMock, list[dict[str, Any]]]:
+        music_player.bot.wait_until_ready = AsyncMock()
+        mocked(music_player.bot.is_closed).side_effect = [False, False, True]
+        music_player.bot.loop = asyncio.get_running_loop()
+        seed_queue(music_player.queue, QueueObject("u1", "one", first.requester))
+        seed_queue(music_player.queue, QueueObject("u2", "two", first.requester))
+
+        events: list[str] = []
+        vc = MagicMock(spec=discord.VoiceClient)
+        vc.is_connected.return_value = True
+        vc.play.side_effect = lambda song, after: events.append(f"play {song.title}")
+        mocked(music_player._guild).voice_client = vc
+        music_player.play_next.wait = AsyncMock()
+
+        async def _prefetch() -> Optional[MagicMock]:
+            try:
+                music_player.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            if cleared:
+                # A -clear landing during the extraction, then a -play, so the
+                # loop has something to take once the prefetch is discarded.
+                await music_player.queue.clear()
+                seed_queue(music_player.queue, QueueObject("u3", "three", None))
+            return second
+
+        def _record(name: str) -> AsyncMock:
+            return AsyncMock(side_effect=lambda *a, **k: events.append(name))
+
+        clear = _record("clear")
+        history = _record("history")
+        if history_error is not None:
+            history.side_effect = history_error
+
+        assert music_player.store is not None
+        with (
+            patch.object(
+                MusicPlayer, "_resolve_source", new=AsyncMock(side_effect=lambda s: s)
+            ),
+            patch.object(
+                MusicPlayer, "_stream_source", new=AsyncMock(return_value=first)
+            ),
+            patch.object(MusicPlayer, "_send_now_playing", new=AsyncMock()),
+            patch.object(
+                MusicPlayer, "_prefetch_next_song", new=AsyncMock(side_effect=_prefetch)
+            ),
+            patch.object(MusicPlayer, "update_activity", new=AsyncMock()),
+            patch("src.musicplayer.HistoryEntry.from_song", new=MagicMock()),
+            patch.object(GuildHistory, "add", history),
+            patch.object(music_player.store, "clear_song_end_state", clear),
+            patch.object(
+                music_player.store, "pop_queue_and_start_song", _record("start")
+            ),
+        ):
+            await music_player.loop()
+        return events, vc, [c.kwargs for c in clear.await_args_list]
+
+    async def test_the_next_song_starts_before_the_ended_ones_bookkeeping(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        second = self._next_song("Second")
+        events, _, _ = await self._run(music_player, mock_song, second)
+
+        assert events[:5] == [
+            f"play {mock_song.title}",
+            "start",
+            "play Second",
+            # Written at the hand-over, not deferred behind the ended song's awaits.
+            "start",
+            "history",
+        ]
+        assert events.count("start") == 2
+        assert events.count("play Second") == 1
+
+    async def test_the_ended_songs_clear_is_keyed_on_its_own_play(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """It runs after the new song's start transaction, so a blind clear
+        would wipe that."""
+        mock_song.start_offset = 30
+        second = self._next_song("Second")
+        with patch("src.musicplayer.time.time", side_effect=[1000.0, 2000.0]):
+            _, _, clears = await self._run(music_player, mock_song, second)
+
+        assert clears[0] == {"play_start_epoch": 970.0}
+
+    async def test_the_start_transaction_runs_under_the_queue_lock(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """Between the commit and the LPOP a -shuffle or -remove would rebuild
+        the mirror with the started song still at its head — and -now, -skip
+        and -volume already see it playing."""
+        seen: list[tuple[bool, bool]] = []
+        write = MusicPlayer._write_start_state
+
+        async def _observe(player: MusicPlayer, playback: Any, *, pop: bool) -> None:
+            seen.append(
+                (player.queue._mutex.locked(), player.current_song is playback.song)
+            )
+            await write(player, playback, pop=pop)
+
+        second = self._next_song("Second")
+        with patch.object(MusicPlayer, "_write_start_state", _observe):
+            await self._run(music_player, mock_song, second)
+
+        assert seen == [(False, True), (True, True)]
+
+    async def test_a_loop_error_after_the_hand_over_keeps_the_song_current(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """The handed-off song plays on through the error handler, so -now, -skip
+        and -volume must still find it while the error embed goes out."""
+        current: list[Optional[YTDL]] = []
+
+        async def _send(*args: Any, **kwargs: Any) -> None:
+            if kwargs["embed"].title == "Playback error — skipping song":
+                current.append(music_player.current_song)
+
+        music_player._channel.send = AsyncMock(side_effect=_send)
+        second = self._next_song("Second")
+        events, _, _ = await self._run(
+            music_player, mock_song, second, history_error=RuntimeError("down")
+        )
+
+        # The second is that song's own history write failing at its end.
+        assert current[0] is second
+        assert events.count("play Second") == 1
+
+    async def test_a_teardown_in_the_window_records_the_ended_song(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """current_song is already the next song while the ended one's row is
+        unwritten — that row is the one a teardown must take."""
+        second = self._next_song("Second")
+        music_player.current_song = second
+        music_player._ended_song = mock_song
+        with patch("src.musicplayer.HistoryEntry.from_song") as from_song:
+            assert music_player.claim_current_song_for_history() is not None
+
+        assert from_song.call_args.args[0] is mock_song
+        assert music_player._skip_history_for is mock_song
+
+    async def test_an_unprimed_song_waits_for_the_sequential_path(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        second = self._next_song("Second")
+        second.primed = False
+        events, _, _ = await self._run(music_player, mock_song, second)
+
+        assert events.index("play Second") > events.index("clear")
+
+    async def test_a_song_that_never_played_is_not_handed_over(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """A silent ending has a cache eviction to run first, keyed on a
+        _stopped_deliberately the next vc.play() would reset."""
+        mock_song.produced_audio = False
+        second = self._next_song("Second")
+        with patch.object(
+            MusicPlayer, "_drop_unplayable_stream_cache", new=AsyncMock()
+        ) as drop:
+            events, _, _ = await self._run(music_player, mock_song, second)
+
+        drop.assert_awaited_once()
+        assert events.index("play Second") > events.index("clear")
+
+    async def test_a_clear_during_the_prefetch_discards_the_song(
+        self, music_player: MusicPlayer, mock_song: MagicMock
+    ) -> None:
+        """clear() settled the prefetch's claim, so the song must not play — and
+        its ffmpeg must be reaped, not left for the top of the loop to miss."""
+        second = self._next_song("Second")
+        events, _, _ = await self._run(music_player, mock_song, second, cleared=True)
+
+        assert "play Second" not in events
+        second.cleanup.assert_called_once()
+
+    async def test_off_when_priming_is_off(
+        self,
+        music_player: MusicPlayer,
+        mock_song: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(config, "GAPLESS_PRIME_FRAMES", 0)
+        second = self._next_song("Second")
+        events, _, _ = await self._run(music_player, mock_song, second)
+
+        assert events.index("play Second") > events.index("clear")
+
+
+class TestPrefetchPriming:
+    async def test_primes_the_prefetched_song_off_the_loop(
+        self, music_player: MusicPlayer, queue_obj: QueueObject, mock_song: MagicMock
+    ) -> None:
+        seed_queue(music_player.queue, queue_obj)
+        mock_song.prime = MagicMock(return_value=50)
+        with (
+            patch.object(config, "GAPLESS_PRIME_FRAMES", 50),
+            patch.object(
+                MusicPlayer, "_resolve_source", new=AsyncMock(return_value=queue_obj)
+            ),
+            patch.object(
+                MusicPlayer, "_stream_source", new=AsyncMock(return_value=mock_song)
+            ),
+        ):
+            assert await music_player._prefetch_next_song() is mock_song
+
+        mock_song.prime.assert_called_once_with(50)
+
+    async def test_a_priming_failure_still_returns_the_song(
+        self, music_player: MusicPlayer, queue_obj: QueueObject, mock_song: MagicMock
+    ) -> None:
+        seed_queue(music_player.queue, queue_obj)
+        mock_song.prime = MagicMock(side_effect=ValueError("bad page"))
+        with (
+            patch.object(config, "GAPLESS_PRIME_FRAMES", 50),
+            patch.object(
+                MusicPlayer, "_resolve_source", new=AsyncMock(return_value=queue_obj)
+            ),
+            patch.object(
+                MusicPlayer, "_stream_source", new=AsyncMock(return_value=mock_song)
+            ),
+        ):
+            assert await music_player._prefetch_next_song() is mock_song
+        mock_song.cleanup.assert_not_called()
+
+    async def test_cancelled_while_priming_reaps_ffmpeg_and_returns_the_item(
+        self, music_player: MusicPlayer, queue_obj: QueueObject, mock_song: MagicMock
+    ) -> None:
+        seed_queue(music_player.queue, queue_obj)
+        with (
+            patch.object(config, "GAPLESS_PRIME_FRAMES", 50),
+            patch.object(
+                MusicPlayer, "_resolve_source", new=AsyncMock(return_value=queue_obj)
+            ),
+            patch.object(
+                MusicPlayer, "_stream_source", new=AsyncMock(return_value=mock_song)
+            ),
+            patch(
+                "src.musicplayer.asyncio.to_thread",
+                new=AsyncMock(side_effect=asyncio.CancelledError),
+            ),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await music_player._prefetch_next_song()
+
+        mock_song.cleanup.assert_called_once()
+        assert music_player.queue.qsize() == 1
+
+
 # ── -playnow interjection ─────────────────────────────────────────────────────
 
 
@@ -8850,6 +9224,67 @@ class TestNeutralizePrefetch:
         )
 
 
+class TestApplyVolume:
+    """-volume reaches the playing song through apply_volume; its return value is
+    what lets the reply say whether it did."""
+
+    @staticmethod
+    async def _prefetched(song: Any) -> asyncio.Task[Any]:
+        async def built() -> Any:
+            return song
+
+        task = asyncio.create_task(built())
+        await task
+        return task
+
+    async def test_a_live_song_takes_the_new_level(
+        self, music_player: MusicPlayer
+    ) -> None:
+        song = MagicMock(live_volume=True, volume=1.0)
+        music_player.current_song = song
+        music_player.volume = 0.3
+        assert await music_player.apply_volume() is True
+        assert song.volume == 0.3
+
+    async def test_a_transcoded_song_keeps_its_baked_level(
+        self, music_player: MusicPlayer
+    ) -> None:
+        """Its volume is in ffmpeg's encode; the reply must say next song."""
+        song = MagicMock(live_volume=False, volume=1.0)
+        music_player.current_song = song
+        music_player.volume = 0.3
+        assert await music_player.apply_volume() is False
+        assert song.volume == 1.0
+
+    async def test_nothing_playing_is_not_live(self, music_player: MusicPlayer) -> None:
+        music_player.current_song = None
+        assert await music_player.apply_volume() is False
+
+    async def test_a_baked_prefetch_is_rebuilt(self, music_player: MusicPlayer) -> None:
+        """The prefetched ffmpeg carries the old level in its filter; left alone
+        the next song would play at it too."""
+        music_player._prefetch_task = await self._prefetched(
+            MagicMock(live_volume=False)
+        )
+        with patch.object(
+            MusicPlayer, "_neutralize_prefetch", new=AsyncMock()
+        ) as neutralize:
+            await music_player.apply_volume()
+        neutralize.assert_awaited_once()
+
+    async def test_a_live_prefetch_is_kept(self, music_player: MusicPlayer) -> None:
+        """_play hands it the new level at vc.play(); rebuilding it would only
+        throw away its ffmpeg."""
+        music_player._prefetch_task = await self._prefetched(
+            MagicMock(live_volume=True)
+        )
+        with patch.object(
+            MusicPlayer, "_neutralize_prefetch", new=AsyncMock()
+        ) as neutralize:
+            await music_player.apply_volume()
+        neutralize.assert_not_awaited()
+
+
 class TestAnnounceResume:
     async def test_playing_wording(
         self, music_player: MusicPlayer, live_song: MagicMock, mock_channel: MagicMock
@@ -120,6 +120,27 @@ class TestOnReady:
         assert stub.call_count == len(guilds) + 1
         assert passed_guilds == guilds
 
+    async def test_warms_the_stream_cache_once_the_restores_settle(
+        self, music_bot_with_redis: MusicBot
+    ) -> None:
+        settled: list[bool] = []
+
+        async def warm_up(restored: Coroutine[Any, Any, object]) -> int:
+            await restored
+            settled.append(True)
+            return 0
+
+        refresher = MagicMock()
+        refresher.warm_up = AsyncMock(side_effect=warm_up)
+        music_bot_with_redis.stream_refresher = refresher
+        restore = AsyncMock()
+        with patch("src.musicbot.restore_guild", restore):
+            await music_bot_with_redis.on_ready()
+            await asyncio.gather(*list(music_bot_with_redis._restore_tasks))
+
+        assert restore.await_count == len(music_bot_with_redis.bot.guilds)
+        assert settled == [True]
+
 
 class TestRestoreGuildLock:
     async def test_skips_when_lock_already_held(
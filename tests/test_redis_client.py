@@ -2,6 +2,7 @@
 
 import ast
 import inspect
+import time
 from pathlib import Path
 from zoneinfo import ZoneInfo
 from typing import Any, Optional, cast
@@ -41,8 +42,13 @@ from src.redis_client import (
     _prev_stream_id,
     _TRANSIENT_SONG_FIELDS,
     ack_outbox,
+    cache_del,
     cache_get,
+    cache_get_many,
     cache_set,
+    cache_set_many,
+    cache_ttls,
+    local_cache_stats,
     close_redis_pool,
     create_redis_pool,
     ensure_outbox_group,
@@ -199,6 +205,220 @@ class TestCacheSet:
         await cache_set(bad_redis, "k", "v", 60)  # must not raise
 
 
+class TestCacheGetMany:
+    async def test_returns_values_and_misses_in_key_order(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await fake_redis.set("a", orjson.dumps({"x": 1}))
+        await fake_redis.set("c", orjson.dumps([3]))
+        assert await cache_get_many(fake_redis, ["a", "b", "c"]) == [
+            {"x": 1},
+            None,
+            [3],
+        ]
+
+    async def test_all_misses_when_redis_is_none(self) -> None:
+        assert await cache_get_many(None, ["a", "b"]) == [None, None]
+
+    async def test_all_misses_on_redis_error(self) -> None:
+        bad_redis = AsyncMock()
+        bad_redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        assert await cache_get_many(bad_redis, ["a", "b"]) == [None, None]
+
+
+class TestCacheSetMany:
+    async def test_sets_every_entry_with_its_own_ttl(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set_many(fake_redis, [("k1", {"n": 1}, 600), ("k2", [2], 3600)])
+        assert orjson.loads(await fake_redis.get("k1")) == {"n": 1}
+        assert orjson.loads(await fake_redis.get("k2")) == [2]
+        assert 595 <= await fake_redis.ttl("k1") <= 600
+        assert 3595 <= await fake_redis.ttl("k2") <= 3600
+
+    async def test_noop_when_redis_is_none(self) -> None:
+        await cache_set_many(None, [("k", "v", 60)])  # must not raise
+
+    async def test_swallows_redis_error(self) -> None:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+        bad_redis = MagicMock()
+        bad_redis.pipeline = MagicMock(return_value=pipe)
+        await cache_set_many(bad_redis, [("k", "v", 60)])  # must not raise
+
+
+class TestCacheTtls:
+    async def test_seconds_left_absent_and_persistent(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await fake_redis.set("t", b"1", ex=600)
+        await fake_redis.set("p", b"1")
+        left, absent, persistent = await cache_ttls(fake_redis, ["t", "x", "p"])
+        assert 595 <= left <= 600
+        assert absent == 0.0
+        assert persistent == float("inf")
+
+    async def test_none_when_the_read_fails(self) -> None:
+        bad_redis = MagicMock()
+        bad_redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        assert await cache_ttls(bad_redis, ["k"]) is None
+        assert await cache_ttls(None, ["k"]) is None
+
+
+class TestLocalCacheTier:
+    """The in-process tier in front of the ytdl caches. Its contract is that it
+    never answers differently from Redis within its own process, and never for
+    longer than Redis would."""
+
+    async def test_a_second_read_does_not_reach_redis(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set(fake_redis, "ytdl:stream:u", {"url": "x"}, 600)
+        with patch.object(fake_redis, "pipeline", side_effect=AssertionError):
+            assert await cache_get(fake_redis, "ytdl:stream:u") == {"url": "x"}
+
+    async def test_a_redis_hit_is_mirrored(self, fake_redis: aioredis.Redis) -> None:
+        await fake_redis.set("ytdl:source:q", orjson.dumps({"t": 1}), ex=600)
+        assert await cache_get(fake_redis, "ytdl:source:q") == {"t": 1}
+        await fake_redis.delete("ytdl:source:q")
+        # Still served: only another process could have deleted it behind this
+        # one's back, and _LOCAL_CACHE_MAX_TTL_SECS is what bounds that.
+        assert await cache_get(fake_redis, "ytdl:source:q") == {"t": 1}
+
+    async def test_an_entry_never_outlives_its_redis_ttl(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await fake_redis.set("ytdl:stream:u", orjson.dumps({"url": "x"}), ex=5)
+        await cache_get(fake_redis, "ytdl:stream:u")
+        expires_at, _ = redis_client._local_cache._entries["ytdl:stream:u"]
+        # Mirrored with the 5 s Redis had left, not the tier's 60 s ceiling.
+        assert expires_at - time.monotonic() <= 5
+        redis_client._local_cache._entries["ytdl:stream:u"] = (0.0, {"url": "x"})
+        await fake_redis.delete("ytdl:stream:u")
+        assert await cache_get(fake_redis, "ytdl:stream:u") is None
+
+    async def test_cache_del_drops_the_local_entry(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set(fake_redis, "ytdl:stream:u", {"url": "x"}, 600)
+        assert await cache_del(fake_redis, "ytdl:stream:u") is True
+        assert await cache_get(fake_redis, "ytdl:stream:u") is None
+
+    async def test_a_failed_mget_keeps_the_hits_it_already_had(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        """Warm-up and prefetch re-extract every None: the tier's own hits must
+        survive the Redis read failing for the rest."""
+        await cache_set(fake_redis, "ytdl:stream:a", "a", 600)
+        with patch.object(
+            fake_redis, "mget", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            assert await cache_get_many(
+                fake_redis, ["ytdl:stream:a", "ytdl:stream:b"]
+            ) == ["a", None]
+
+    async def test_other_keys_bypass_the_tier(self, fake_redis: aioredis.Redis) -> None:
+        await cache_set(fake_redis, "leaderboard:x", [1], 600)
+        await fake_redis.delete("leaderboard:x")
+        assert await cache_get(fake_redis, "leaderboard:x") is None
+
+    async def test_least_recently_used_is_evicted_first(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        tier = redis_client._LocalCache(max_entries=2, max_ttl=60)
+        with patch.object(redis_client, "_local_cache", tier):
+            await cache_set(fake_redis, "ytdl:stream:a", "a", 600)
+            await cache_set(fake_redis, "ytdl:stream:b", "b", 600)
+            await cache_get(fake_redis, "ytdl:stream:a")  # b is now the oldest
+            await cache_set(fake_redis, "ytdl:stream:c", "c", 600)
+            await fake_redis.delete("ytdl:stream:a", "ytdl:stream:b")
+            assert await cache_get(fake_redis, "ytdl:stream:a") == "a"
+            assert await cache_get(fake_redis, "ytdl:stream:b") is None
+
+    async def test_hit_ratios_are_reported_per_prefix(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set(fake_redis, "ytdl:stream:u", {"url": "x"}, 600)
+        await cache_get(fake_redis, "ytdl:stream:u")
+        await cache_get(fake_redis, "ytdl:stream:missing")
+        await cache_get_many(fake_redis, ["ytdl:source:q"])
+        stats = {s.prefix: s for s in local_cache_stats()}
+        assert (stats["ytdl:stream"].hits, stats["ytdl:stream"].misses) == (1, 1)
+        assert stats["ytdl:stream"].hit_ratio == 0.5
+        assert (stats["ytdl:source"].hits, stats["ytdl:source"].misses) == (0, 1)
+
+
+# A stream entry's size and shape: most of it is the signed googlevideo URL.
+_STREAM_ENTRY = {
+    "url": "https://rr3---sn-abc.googlevideo.com/videoplayback?"
+    + "&".join(f"p{n}=value{n}x{n * 7919}" for n in range(60)),
+    "webpage_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "title": "Never Gonna Give You Up",
+    "duration": 213,
+}
+
+
+class TestCompressedPayloads:
+    """ytdl:stream/ytdl:source values are stored framed and compressed. Reads go
+    through Redis each time here (the local tier is cleared), so what is asserted
+    is the stored format, not the tier's copy."""
+
+    async def test_a_stream_entry_is_stored_compressed_and_reads_back(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set(fake_redis, "ytdl:stream:u", _STREAM_ENTRY, 600)
+        raw = await fake_redis.get("ytdl:stream:u")
+        assert raw[0] == redis_client._FRAME_MAGIC
+        assert raw[1] == redis_client._FRAME_VERSION
+        assert len(raw) < len(orjson.dumps(_STREAM_ENTRY))
+        redis_client._local_cache.clear()
+        assert await cache_get(fake_redis, "ytdl:stream:u") == _STREAM_ENTRY
+
+    async def test_small_values_and_other_prefixes_stay_plain_json(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        await cache_set_many(
+            fake_redis,
+            [
+                ("ytdl:stream:small", {"url": "x"}, 600),
+                ("leaderboard:x", _STREAM_ENTRY, 600),
+            ],
+        )
+        assert orjson.loads(await fake_redis.get("ytdl:stream:small")) == {"url": "x"}
+        assert orjson.loads(await fake_redis.get("leaderboard:x")) == _STREAM_ENTRY
+
+    async def test_an_entry_from_before_framing_still_reads(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        """The migration path: plain-orjson entries are read as they are."""
+        await fake_redis.set("ytdl:stream:old", orjson.dumps(_STREAM_ENTRY), ex=600)
+        assert await cache_get_many(fake_redis, ["ytdl:stream:old"]) == [_STREAM_ENTRY]
+
+    async def test_either_codec_is_read_whichever_one_writes(
+        self, fake_redis: aioredis.Redis
+    ) -> None:
+        """Switching CACHE_COMPRESSION leaves the other codec's entries readable."""
+        zlib_codec = (redis_client._CODEC_ZLIB, redis_client.zlib.compress)
+        with patch.object(redis_client, "_compressor", zlib_codec):
+            await cache_set(fake_redis, "ytdl:source:q", _STREAM_ENTRY, 600)
+        redis_client._local_cache.clear()
+        assert await cache_get(fake_redis, "ytdl:source:q") == _STREAM_ENTRY
+
+    async def test_an_unknown_frame_is_a_miss(self, fake_redis: aioredis.Redis) -> None:
+        await fake_redis.set("ytdl:stream:new", b"\xff\x02zwhatever", ex=600)
+        await fake_redis.set("ytdl:stream:ok", orjson.dumps({"url": "x"}), ex=600)
+        assert await cache_get(fake_redis, "ytdl:stream:new") is None
+        # One unreadable entry does not take its batch's other values with it.
+        assert await cache_get_many(
+            fake_redis, ["ytdl:stream:new", "ytdl:stream:ok"]
+        ) == [None, {"url": "x"}]
+
+    async def test_off_stores_plain_json(self, fake_redis: aioredis.Redis) -> None:
+        with patch.object(redis_client, "_compressor", None):
+            await cache_set(fake_redis, "ytdl:stream:u", _STREAM_ENTRY, 600)
+        assert orjson.loads(await fake_redis.get("ytdl:stream:u")) == _STREAM_ENTRY
+
+
 # ── GuildRedisStore fixtures ──────────────────────────────────────────────────
 
 
@@ -2824,6 +3044,30 @@ class TestClearSongEndState:
     async def test_swallows_redis_error(self, broken_store: GuildRedisStore) -> None:
         await broken_store.clear_song_end_state()  # must not raise
 
+    async def test_keyed_clear_removes_its_own_songs_state(
+        self, store: GuildRedisStore, fake_redis: aioredis.Redis
+    ) -> None:
+        await store.set_current_song_state(_entry(), 1000.25)
+        await fake_redis.hset(store.now_playing_key(), b"title", b"Song")
+        await store.clear_song_end_state(play_start_epoch=1000.25)
+        state = await fake_redis.hgetall(store.state_key())
+        assert b"current_song_url" not in state
+        assert b"play_start_epoch" not in state
+        assert await fake_redis.exists(store.now_playing_key()) == 0
+
+    async def test_keyed_clear_leaves_a_later_songs_state(
+        self, store: GuildRedisStore, fake_redis: aioredis.Redis
+    ) -> None:
+        """A gapless hand-over writes the next song's state before the ended
+        song's clear runs — which must not wipe it."""
+        await store.set_current_song_state(_entry(), 2000.5)
+        await fake_redis.hset(store.now_playing_key(), b"title", b"Song")
+        await store.clear_song_end_state(play_start_epoch=1000.25)
+        state = await fake_redis.hgetall(store.state_key())
+        assert state[b"play_start_epoch"] == b"2000.5"
+        assert b"current_song_url" in state
+        assert await fake_redis.exists(store.now_playing_key()) == 1
+
 
 class TestGuildConfigStore:
     """The durable half of the per-guild debug toggle."""
@@ -5,6 +5,7 @@ import pytest
 from src.guild_state import Analytics
 from src.sources import (
     unquote_argument,
+    canonical_id,
     QUERY_SOURCE_SEARCH,
     TIMESTAMP_FORMATS,
     QUERY_SOURCE_SOUNDCLOUD,
@@ -146,6 +147,47 @@ class TestParseUrlYouTube:
         assert result.ts == 30
 
 
+class TestCanonicalId:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&si=abc&t=42",
+            "youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://music.youtube.com/watch?v=dQw4w9WgXcQ&feature=share",
+            "https://youtu.be/dQw4w9WgXcQ?si=abc",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            " https://youtu.be/dQw4w9WgXcQ ",
+        ],
+    )
+    def test_every_spelling_of_a_video_is_one_id(self, text: str) -> None:
+        assert canonical_id(text) == "youtube:dQw4w9WgXcQ"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "never gonna give you up",
+            "AC/DC - Back in Black",
+            "https://www.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123",
+            "https://www.youtube.com/@channel/videos",
+            "https://soundcloud.com/artist/track",
+            "https://open.spotify.com/track/abc",
+            "https://vimeo.com/12345678",
+        ],
+    )
+    def test_anything_that_names_no_single_video_is_none(self, text: str) -> None:
+        assert canonical_id(text) is None
+
+    def test_music_host_is_routed_as_youtube(self) -> None:
+        result = parse_url("https://music.youtube.com/watch?v=dQw4w9WgXcQ&t=30")
+        assert isinstance(result, YTSource)
+        assert result.stype is URLSource.YOUTUBE
+        assert result.query_source == QUERY_SOURCE_YOUTUBE
+        assert result.ts == 30
+
+
 class TestParseUrlPlaylistIndex:
     """`index=` is YouTube's 1-based position of the video the link was copied
     at. Parsed only on the playlist branch and never allowed to raise — a
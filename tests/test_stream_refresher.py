@@ -0,0 +1,204 @@
+"""Tests for src/stream_refresher.py — keeping the next songs' stream URLs cached.
+
+The refresher is driven one tick at a time (refresh_once) against fake Redis, with
+YTDL.prefetch_streams replaced by a recorder: what is asserted is which songs a
+tick decides to refresh, and in what batches, not the extraction itself — that is
+prefetch_streams' own suite (tests/test_youtube.py)."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from redis.asyncio import Redis
+
+import src.stream_refresher as stream_refresher
+from src.stream_refresher import StreamRefresher
+from src.youtube import YTDL, QueueObject
+
+
+def _song(n: int, requester: Any) -> QueueObject:
+    return QueueObject(f"https://yt.com/watch?v={n}", f"Song {n}", requester)
+
+
+async def _cache(redis: Redis, qo: QueueObject, ttl: int) -> None:
+    await redis.set(f"ytdl:stream:{qo.webpage_url}", orjson.dumps({"url": "x"}), ex=ttl)
+
+
+@pytest.fixture
+def prefetch_streams() -> Any:
+    with patch.object(YTDL, "prefetch_streams", new=AsyncMock()) as mock:
+        yield mock
+
+
+def _refreshed(mock: AsyncMock) -> list[list[str]]:
+    return [[qo.webpage_url for qo in c.args[0]] for c in mock.await_args_list]
+
+
+class TestRefreshOnce:
+    async def test_refreshes_only_entries_about_to_expire(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        fresh, stale, missing = (_song(n, mock_author) for n in range(3))
+        await _cache(fake_redis, fresh, 1500)
+        await _cache(fake_redis, stale, 60)
+        refresher = StreamRefresher(fake_redis, lambda n: [fresh, stale, missing])
+
+        assert await refresher.refresh_once() == 2
+
+        # Most urgent first: the missing entry has nothing left at all.
+        assert _refreshed(prefetch_streams) == [
+            [missing.webpage_url, stale.webpage_url]
+        ]
+        assert prefetch_streams.await_args.kwargs["refresh"] is True
+
+    async def test_the_budget_is_spent_on_the_most_urgent(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        songs = [_song(n, mock_author) for n in range(3)]
+        for qo, ttl in zip(songs, (200, 100, 250)):
+            await _cache(fake_redis, qo, ttl)
+        refresher = StreamRefresher(fake_redis, lambda n: songs)
+
+        with patch.object(stream_refresher, "_REFRESH_BUDGET", 2):
+            assert await refresher.refresh_once() == 2
+
+        assert _refreshed(prefetch_streams) == [
+            [songs[1].webpage_url, songs[0].webpage_url]
+        ]
+
+    async def test_a_refreshed_song_is_not_retried_at_once(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        """A song the cache declines (no usable expiry) stays missing after its
+        refresh; retried every tick it would eat the budget forever."""
+        qo = _song(1, mock_author)
+        refresher = StreamRefresher(fake_redis, lambda n: [qo])
+
+        assert await refresher.refresh_once() == 1
+        assert await refresher.refresh_once() == 0
+        assert prefetch_streams.await_count == 1
+
+    async def test_batches_by_guild(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        other = MagicMock()
+        other.guild.id = 7
+        songs = [_song(1, mock_author), _song(2, other), _song(3, mock_author)]
+        refresher = StreamRefresher(fake_redis, lambda n: songs)
+
+        await refresher.refresh_once()
+
+        assert sorted(map(len, _refreshed(prefetch_streams))) == [1, 2]
+
+    async def test_asks_for_the_configured_depth(
+        self, fake_redis: Redis, prefetch_streams: AsyncMock
+    ) -> None:
+        upcoming = MagicMock(return_value=[])
+        await StreamRefresher(fake_redis, upcoming).refresh_once()
+        upcoming.assert_called_once_with(stream_refresher._REFRESH_AHEAD)
+
+    async def test_does_nothing_when_redis_cannot_be_read(
+        self, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        broken = MagicMock()
+        broken.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        refresher = StreamRefresher(broken, lambda n: [_song(1, mock_author)])
+
+        assert await refresher.refresh_once() == 0
+        prefetch_streams.assert_not_awaited()
+
+
+async def _settled() -> None:
+    pass
+
+
+class TestWarmUp:
+    async def test_extracts_only_the_misses_a_batch_per_guild(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        other = MagicMock()
+        other.guild.id = 7
+        cached, missing, elsewhere = (
+            _song(1, mock_author),
+            _song(2, mock_author),
+            _song(3, other),
+        )
+        await _cache(fake_redis, cached, 60)
+        upcoming = MagicMock(return_value=[cached, missing, elsewhere])
+        refresher = StreamRefresher(fake_redis, upcoming)
+
+        assert await refresher.warm_up(_settled()) == 2
+
+        upcoming.assert_called_once_with(stream_refresher._WARMUP_AHEAD)
+        assert sorted(_refreshed(prefetch_streams)) == [
+            [missing.webpage_url],
+            [elsewhere.webpage_url],
+        ]
+        assert all(c.kwargs["refresh"] for c in prefetch_streams.await_args_list)
+
+    async def test_reads_the_queues_only_once_they_are_restored(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        queue: list[QueueObject] = []
+
+        async def restored() -> None:
+            queue.append(_song(1, mock_author))
+
+        refresher = StreamRefresher(fake_redis, lambda n: queue)
+        assert await refresher.warm_up(restored()) == 1
+
+    async def test_a_stuck_restore_does_not_hold_up_the_rest(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        refresher = StreamRefresher(fake_redis, lambda n: [_song(1, mock_author)])
+        with patch.object(stream_refresher, "_WARMUP_WAIT_SECS", 0.01):
+            assert await refresher.warm_up(asyncio.Event().wait()) == 1
+
+    async def test_the_first_tick_does_not_repeat_it(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        """A song the warm-up could not cache is not sent again a minute later."""
+        refresher = StreamRefresher(fake_redis, lambda n: [_song(1, mock_author)])
+        await refresher.warm_up(_settled())
+        assert await refresher.refresh_once() == 0
+        assert prefetch_streams.await_count == 1
+
+    async def test_zero_ahead_turns_it_off(
+        self, fake_redis: Redis, mock_author: MagicMock, prefetch_streams: AsyncMock
+    ) -> None:
+        refresher = StreamRefresher(fake_redis, lambda n: [_song(1, mock_author)])
+        with patch.object(stream_refresher, "_WARMUP_AHEAD", 0):
+            assert await refresher.warm_up(_settled()) == 0
+        prefetch_streams.assert_not_awaited()
+
+
+class TestLifecycle:
+    async def test_a_failing_tick_does_not_end_the_loop(
+        self, fake_redis: Redis
+    ) -> None:
+        refresher = StreamRefresher(fake_redis, lambda n: [])
+        ticks = 0
+
+        async def failing() -> int:
+            nonlocal ticks
+            ticks += 1
+            raise RuntimeError("boom")
+
+        with (
+            patch.object(stream_refresher, "_REFRESH_TICK_SECS", 0),
+            patch.object(refresher, "refresh_once", side_effect=failing),
+        ):
+            refresher.start()
+            while ticks < 2:
+                await asyncio.sleep(0)
+            await refresher.stop()
+
+        assert refresher._task is None
+
+    async def test_a_zero_budget_never_starts(self, fake_redis: Redis) -> None:
+        refresher = StreamRefresher(fake_redis, lambda n: [])
+        with patch.object(stream_refresher, "_REFRESH_BUDGET", 0):
+            refresher.start()
+        assert refresher._task is None
@@ -16,7 +16,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import structlog
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
@@ -41,6 +42,7 @@ def restore_global_state() -> Iterator[None]:
     saved = (
         telemetry._tracer_provider,
         telemetry._log_provider,
+        telemetry._meter_provider,
         telemetry._setup_done,
     )
     yield
@@ -50,6 +52,7 @@ def restore_global_state() -> Iterator[None]:
     (
         telemetry._tracer_provider,
         telemetry._log_provider,
+        telemetry._meter_provider,
         telemetry._setup_done,
     ) = saved
 
@@ -60,6 +63,7 @@ def clean_setup(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(telemetry, "_setup_done", False)
     monkeypatch.setattr(telemetry, "_tracer_provider", None)
     monkeypatch.setattr(telemetry, "_log_provider", None)
+    monkeypatch.setattr(telemetry, "_meter_provider", None)
 
 
 class TestDiscordGatewayFilter:
@@ -102,6 +106,30 @@ class TestDiscordGatewayFilter:
         )
         assert result.decision is Decision.DROP
 
+    @pytest.mark.parametrize("sampled", [True, False])
+    def test_follows_a_remote_parents_sampled_flag(self, sampled: bool) -> None:
+        """The yt-dlp service opens its spans under a bot's: a trace the bot did
+        not sample must not be recorded there."""
+        from opentelemetry import trace
+        from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+        parent = trace.set_span_in_context(
+            NonRecordingSpan(
+                SpanContext(
+                    trace_id=1,
+                    span_id=2,
+                    is_remote=True,
+                    trace_flags=TraceFlags(
+                        TraceFlags.SAMPLED if sampled else TraceFlags.DEFAULT
+                    ),
+                )
+            )
+        )
+        result = telemetry._DiscordGatewayFilter().should_sample(
+            parent, 1, "ytdlp.service.run"
+        )
+        assert (result.decision is not Decision.DROP) is sampled
+
     def test_description_is_stable(self) -> None:
         assert telemetry._DiscordGatewayFilter(ALWAYS_ON).get_description() == (
             "_DiscordGatewayFilter"
@@ -117,6 +145,7 @@ class TestSetupTelemetry:
 
         assert telemetry._tracer_provider is None
         assert telemetry._log_provider is None
+        assert telemetry._meter_provider is None
         # Logs must still reach stdout — otherwise disabling tracing silently
         # disables `docker logs`.
         assert any(isinstance(h, logging.StreamHandler) for h in logging.root.handlers)
@@ -142,6 +171,7 @@ class TestSetupTelemetry:
         with (
             patch.object(telemetry, "_setup_traces") as traces,
             patch.object(telemetry, "_setup_logs") as logs,
+            patch.object(telemetry, "_setup_metrics") as meters,
             patch.object(telemetry, "_setup_auto_instrumentation") as instr,
         ):
             telemetry.setup_telemetry()
@@ -149,6 +179,7 @@ class TestSetupTelemetry:
 
         traces.assert_called_once()
         logs.assert_called_once()
+        meters.assert_called_once()
         instr.assert_called_once()
 
     def test_enabled_sdk_runs_the_full_setup(
@@ -158,12 +189,14 @@ class TestSetupTelemetry:
         with (
             patch.object(telemetry, "_setup_traces") as traces,
             patch.object(telemetry, "_setup_logs") as logs,
+            patch.object(telemetry, "_setup_metrics") as meters,
             patch.object(telemetry, "_setup_auto_instrumentation") as instr,
         ):
             telemetry.setup_telemetry()
 
         traces.assert_called_once()
         logs.assert_called_once()
+        meters.assert_called_once()
         instr.assert_called_once()
 
     @pytest.mark.parametrize("value", ["TRUE", "True", "true"])
@@ -256,12 +289,48 @@ class TestSetupLogs:
         )
 
 
+class TestSetupMetrics:
+    def test_builds_a_provider_that_exports_measurements(
+        self, clean_setup: None
+    ) -> None:
+        """A real provider read through an in-memory reader: an instrument made
+        from it records, and the resource says whose numbers they are."""
+        reader = InMemoryMetricReader()
+        with (
+            patch(
+                "opentelemetry.exporter.otlp.proto.grpc.metric_exporter"
+                ".OTLPMetricExporter"
+            ),
+            patch(
+                "opentelemetry.sdk.metrics.export.PeriodicExportingMetricReader",
+                return_value=reader,
+            ),
+            patch.object(metrics, "set_meter_provider") as install,
+        ):
+            telemetry._setup_metrics()
+
+        provider = telemetry._meter_provider
+        assert provider is not None
+        install.assert_called_once_with(provider)
+        provider.get_meter(__name__).create_counter("smoke").add(2)
+        data = reader.get_metrics_data()
+        assert data is not None
+        (resource_metrics,) = data.resource_metrics
+        assert resource_metrics.resource.attributes["service.name"] == (
+            telemetry._SERVICE_NAME
+        )
+        (metric,) = resource_metrics.scope_metrics[0].metrics
+        assert metric.name == "smoke"
+        assert [p.value for p in metric.data.data_points] == [2]
+
+
 class TestShutdownTelemetry:
-    def test_flushes_and_shuts_down_both_providers(self) -> None:
-        tracer, logs = MagicMock(), MagicMock()
+    def test_flushes_and_shuts_down_every_provider(self) -> None:
+        tracer, logs, meters = MagicMock(), MagicMock(), MagicMock()
         with (
             patch.object(telemetry, "_tracer_provider", tracer),
             patch.object(telemetry, "_log_provider", logs),
+            patch.object(telemetry, "_meter_provider", meters),
         ):
             telemetry.shutdown_telemetry()
 
@@ -270,11 +339,14 @@ class TestShutdownTelemetry:
         tracer.shutdown.assert_called_once()
         logs.force_flush.assert_called_once()
         logs.shutdown.assert_called_once()
+        meters.force_flush.assert_called_once()
+        meters.shutdown.assert_called_once()
 
     def test_is_a_noop_when_telemetry_never_started(self) -> None:
         with (
             patch.object(telemetry, "_tracer_provider", None),
             patch.object(telemetry, "_log_provider", None),
+            patch.object(telemetry, "_meter_provider", None),
         ):
             telemetry.shutdown_telemetry()  # must not raise
 
@@ -356,3 +428,11 @@ class TestConfigureWorkerLogging:
 class TestGetTracer:
     def test_returns_a_tracer(self) -> None:
         assert telemetry.get_tracer("some.module") is not None
+
+
+class TestGetMeter:
+    def test_instruments_are_safe_before_setup(self) -> None:
+        """Modules create their instruments at import, long before setup runs."""
+        meter = telemetry.get_meter("some.module")
+        meter.create_histogram("h").record(1.0)
+        meter.create_up_down_counter("u").add(-1)
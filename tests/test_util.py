@@ -4,6 +4,7 @@ utilities."""
 import asyncio
 import contextlib
 import logging
+from collections import deque
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +15,7 @@ from src.util import (
     background_typing,
     fmt_duration,
     get_logger,
+    percentile,
     pluralize,
     queue_message,
 )
@@ -175,6 +177,16 @@ class TestFmtDuration:
         assert fmt_duration(61) == "1:01"
 
 
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        samples = deque(float(n) for n in range(100, 0, -1))
+
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.95) == 95.0
+        assert percentile(deque([3.0]), 0.95) == 3.0
+        assert percentile(deque(), 0.5) is None
+
+
 class TestBackgroundTyping:
     """Typing indicator must never delay the command body."""
 
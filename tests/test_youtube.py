@@ -1,6 +1,7 @@
 """Tests for src/youtube.py — QueueObject, YTDL config, yt_source, yt_stream, and stream cache."""
 
 import asyncio
+import copy
 import logging
 import redis.asyncio as aioredis
 import pickle
@@ -29,7 +30,7 @@ from src.youtube import (
     QueueObject,
     _DEGRADED_FORMAT_WARNED,
     _STREAM_CACHE_FIELDS,
-    _UNUSED_INFO_COLLECTIONS,
+    _RESULT_FIELDS,
     _YTDL_PLAYLIST_OPTS,
     _YTDL_STREAM_OPTS,
     _YTDL_STREAM_SEARCH_OPTS,
@@ -50,6 +51,7 @@ from src.youtube import (
     YTDLVideoInfo,
     YTDLVideoMetadata,
 )
+from src.ytdlp_pool import ExtractPriority
 from tests.helpers import noop_ffmpeg_init
 
 # Ask-time analytics for direct yt_source/yt_playlist calls — the command paths
@@ -194,6 +196,165 @@ class TestYTDLElapsedSecs:
             assert song.read() == b"opus-frame"
 
 
+class TestYTDLPrime:
+    """prime() reads packets ahead of the player for the gapless hand-over; read()
+    serves them first, and only read() counts them as delivered audio."""
+
+    def test_buffers_up_to_the_requested_frames(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", return_value=b"opus-frame"
+        ) as read:
+            assert song.prime(3) == 3
+        assert read.call_count == 3
+        assert song.primed
+
+    def test_primed_frames_are_counted_only_when_read(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        packets = iter([b"a", b"b", b"c"])
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", side_effect=lambda: next(packets, b"")
+        ):
+            song.prime(2)
+            assert song.elapsed_secs == 0.0
+            assert not song.produced_audio
+            assert [song.read() for _ in range(4)] == [b"a", b"b", b"c", b""]
+        assert song.elapsed_secs == pytest.approx(0.06)
+        assert not song.primed
+
+    def test_stops_at_end_of_stream(self, ytdl_instance: Callable[..., Any]) -> None:
+        song = ytdl_instance()
+        packets = iter([b"a"])
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", side_effect=lambda: next(packets, b"")
+        ):
+            assert song.prime(50) == 1
+
+
+class TestYTDLReadAhead:
+    """YTDL_READAHEAD_SECS puts a reader thread between ffmpeg and the player;
+    what the player sees — packets, their count, the end of stream, a failure —
+    must be what it saw reading the pipe itself."""
+
+    @pytest.fixture(autouse=True)
+    def _readahead(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.youtube._READAHEAD_SECS", 0.1)
+
+    def test_serves_every_packet_then_the_end_of_stream(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        packets = iter([b"a", b"b", b"c"])
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", side_effect=lambda: next(packets, b"")
+        ):
+            got = [song.read() for _ in range(5)]
+            song.cleanup()
+        assert got == [b"a", b"b", b"c", b"", b""]
+        assert song.elapsed_secs == pytest.approx(0.06)
+
+    def test_primed_packets_come_first(self, ytdl_instance: Callable[..., Any]) -> None:
+        song = ytdl_instance()
+        packets = iter([b"a", b"b", b"c"])
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", side_effect=lambda: next(packets, b"")
+        ):
+            song.prime(1)
+            got = [song.read() for _ in range(4)]
+            song.cleanup()
+        assert got == [b"a", b"b", b"c", b""]
+
+    def test_a_reader_failure_reaches_the_player(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        with patch.object(
+            discord.FFmpegOpusAudio, "read", side_effect=ValueError("bad page")
+        ):
+            with pytest.raises(ValueError, match="bad page"):
+                song.read()
+            song.cleanup()
+
+    def test_counts_an_underrun_once_audio_is_flowing(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        stalled = threading.Event()
+        packets = iter([b"a", b"b"])
+
+        def _read() -> bytes:
+            data = next(packets, b"")
+            if data == b"b":
+                stalled.wait(5)  # a CDN stall between the two packets
+            return data
+
+        underruns = MagicMock()
+        with (
+            patch.object(discord.FFmpegOpusAudio, "read", side_effect=_read),
+            patch("src.youtube._READAHEAD_UNDERRUNS", underruns),
+        ):
+            assert song.read() == b"a"
+            threading.Timer(0.05, stalled.set).start()
+            assert song.read() == b"b"
+            song.cleanup()
+        underruns.add.assert_called_once_with(1)
+
+    def test_off_reads_on_the_player_thread(
+        self, ytdl_instance: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("src.youtube._READAHEAD_SECS", 0)
+        song = ytdl_instance()
+        with patch.object(discord.FFmpegOpusAudio, "read", return_value=b"a"):
+            song.read()
+        assert song._readahead is None
+
+
+class TestYTDLLiveVolume:
+    """read() runs packets through the Opus gain stage only while the volume is
+    not 1.0 — at full level the packets reach the player untouched."""
+
+    def test_full_volume_never_decodes(self, ytdl_instance: Callable[..., Any]) -> None:
+        song = ytdl_instance()
+        with (
+            patch.object(discord.FFmpegOpusAudio, "read", return_value=b"a"),
+            patch("src.youtube._GainStage") as stage,
+        ):
+            assert song.read() == b"a"
+        stage.assert_not_called()
+
+    def test_a_change_applies_to_the_next_packet_and_back(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        with (
+            patch.object(discord.FFmpegOpusAudio, "read", return_value=b"a"),
+            patch("src.youtube._GainStage") as stage,
+        ):
+            stage.return_value.apply.return_value = b"quiet"
+            song.volume = 0.5
+            assert song.read() == b"quiet"
+            stage.return_value.apply.assert_called_once_with(b"a", 0.5)
+            song.volume = 1.0
+            assert song.read() == b"a"
+        assert song._gain is None
+
+    def test_the_end_of_stream_is_not_encoded(
+        self, ytdl_instance: Callable[..., Any]
+    ) -> None:
+        song = ytdl_instance()
+        song.volume = 0.5
+        with (
+            patch.object(discord.FFmpegOpusAudio, "read", return_value=b""),
+            patch("src.youtube._GainStage") as stage,
+        ):
+            assert song.read() == b""
+        stage.return_value.apply.assert_not_called()
+
+
 class TestYTDLPositionSecs:
     """position_secs = start_offset + elapsed_secs — the single source of
     truth for every position surface (progress bar, Activity presence, pause
@@ -717,7 +878,10 @@ class TestYTSource:
             "uploader": "Chan",
         }
         await fake_redis.set(
-            "ytdl:source:cached search", _orjson.dumps(cached), ex=3600
+            "ytdl:alias:cached search", _orjson.dumps(cached["webpage_url"]), ex=3600
+        )
+        await fake_redis.set(
+            "ytdl:source:https://yt.com/v=cached", _orjson.dumps(cached), ex=3600
         )
         result = await YTDL.yt_source(
             mock_ctx.author,
@@ -743,7 +907,10 @@ class TestYTSource:
             "thumbnail": "https://img.yt.com/cached.jpg",
         }
         await fake_redis.set(
-            "ytdl:source:cached search", _orjson.dumps(cached), ex=3600
+            "ytdl:alias:cached search", _orjson.dumps(cached["webpage_url"]), ex=3600
+        )
+        await fake_redis.set(
+            "ytdl:source:https://yt.com/v=cached", _orjson.dumps(cached), ex=3600
         )
         result = await YTDL.yt_source(
             mock_ctx.author,
@@ -924,7 +1091,10 @@ class TestYTSourceUnifiedExtraction:
                 user_input=None,
             )
 
-        source_entry = await fake_redis.get("ytdl:source:unified search")
+        source_entry = await fake_redis.get("ytdl:source:https://yt.com/v=uni1")
+        assert orjson.loads(await fake_redis.get("ytdl:alias:unified search")) == (
+            "https://yt.com/v=uni1"
+        )
         stream_entry = await fake_redis.get("ytdl:stream:https://yt.com/v=uni1")
         assert source_entry is not None
         assert stream_entry is not None
@@ -971,7 +1141,7 @@ class TestYTSourceUnifiedExtraction:
 
         assert isinstance(result, QueueObject)
         assert result.webpage_url == "https://yt.com/v=uni3"
-        assert await fake_redis.get("ytdl:source:dead probe search") is not None
+        assert await fake_redis.get("ytdl:source:https://yt.com/v=uni3") is not None
         assert await fake_redis.get("ytdl:stream:https://yt.com/v=uni3") is None
 
     async def test_uncacheable_url_skips_stream_cache(
@@ -1036,6 +1206,87 @@ class TestYTSourceUnifiedExtraction:
         assert result.thumbnail == "https://img.yt.com/test.jpg"
 
 
+class TestCanonicalCacheKeys:
+    """Every cache youtube.py keeps is keyed on the video, not on how it was
+    spelled: a search, the watch URL with tracking params, youtu.be and the
+    music. host all land on one entry (sources.canonical_id)."""
+
+    _SPELLINGS = (
+        "https://www.youtube.com/watch?v=abc123",
+        "https://youtube.com/watch?v=abc123&si=share",
+        "https://music.youtube.com/watch?v=abc123",
+        "https://youtu.be/abc123",
+    )
+
+    async def _yt_source(
+        self, mock_ctx: MagicMock, search: str, redis: aioredis.Redis
+    ) -> QueueObject:
+        return await YTDL.yt_source(
+            mock_ctx.author,
+            search,
+            redis=redis,
+            query_source="youtube.com",
+            analytics=_ANALYTICS,
+            user_input=None,
+        )
+
+    def test_stream_keys_agree_across_spellings(self) -> None:
+        from src.youtube import stream_cache_key
+
+        keys = {stream_cache_key(url) for url in self._SPELLINGS}
+        assert keys == {"ytdl:stream:youtube:abc123"}
+
+    def test_a_link_with_no_canonical_id_keys_on_itself(self) -> None:
+        from src.youtube import stream_cache_key
+
+        url = "https://soundcloud.com/artist/track"
+        assert stream_cache_key(url) == f"ytdl:stream:{url}"
+
+    async def test_every_spelling_hits_the_entry_one_of_them_wrote(
+        self, mock_ctx: MagicMock, fake_redis: aioredis.Redis
+    ) -> None:
+        fake_data = _fake_ytdl_data(
+            webpage_url="https://www.youtube.com/watch?v=abc123"
+        )
+        with patch("src.youtube._ytdlp_extract", return_value=fake_data) as extract:
+            for url in self._SPELLINGS:
+                await self._yt_source(mock_ctx, url, fake_redis)
+        assert extract.call_count == 1
+
+    async def test_a_search_shares_the_entry_of_the_video_it_found(
+        self, mock_ctx: MagicMock, fake_redis: aioredis.Redis
+    ) -> None:
+        """The alias index: the search remembers which video it resolved to, and
+        the video's own link then needs no extraction either."""
+        fake_data = _fake_ytdl_data(
+            webpage_url="https://www.youtube.com/watch?v=abc123"
+        )
+        with patch("src.youtube._ytdlp_extract", return_value=fake_data) as extract:
+            await self._yt_source(mock_ctx, "Some Song", fake_redis)
+            again = await self._yt_source(mock_ctx, "some song ", fake_redis)
+            await self._yt_source(mock_ctx, "https://youtu.be/abc123", fake_redis)
+        assert extract.call_count == 1
+        assert again.webpage_url == "https://www.youtube.com/watch?v=abc123"
+        assert orjson.loads(await fake_redis.get("ytdl:alias:some song")) == (
+            "youtube:abc123"
+        )
+
+    async def test_prefetch_after_a_different_spelling_is_a_cache_hit(
+        self, mock_ctx: MagicMock, fake_redis: aioredis.Redis
+    ) -> None:
+        fake_data = _fake_ytdl_data(
+            webpage_url="https://www.youtube.com/watch?v=abc123"
+        )
+        with patch("src.youtube._ytdlp_extract", return_value=fake_data):
+            await self._yt_source(mock_ctx, "https://youtu.be/abc123", fake_redis)
+        qobj = QueueObject(
+            "https://music.youtube.com/watch?v=abc123", "Song", mock_ctx.author
+        )
+        with patch("src.youtube._ytdlp_extract") as extract:
+            await YTDL.prefetch_stream(qobj, redis=fake_redis)
+        extract.assert_not_called()
+
+
 class TestYTStreamRuntimeError:
     async def test_raises_when_extract_returns_none(self, mock_ctx: MagicMock) -> None:
         qobj = QueueObject("https://yt.com/v=none", "None Song", mock_ctx.author)
@@ -1067,7 +1318,8 @@ class TestYTStream:
     async def test_yt_stream_appends_volume_filter_when_not_default(
         self, mock_ctx: MagicMock
     ) -> None:
-        """volume != 1.0 must append -filter:a to ffmpeg options."""
+        """Without libopus for the live gain stage, volume != 1.0 must append
+        -filter:a to ffmpeg options."""
         fake_data = _fake_ytdl_data()
         channel = AsyncMock(spec=discord.TextChannel)
         channel.send = AsyncMock()
@@ -1084,6 +1336,8 @@ class TestYTStream:
             executable: str,
             before_options: str,
             options: str,
+            codec: Optional[str] = None,
+            bitrate: Optional[int] = None,
         ) -> None:
             noop_ffmpeg_init(self)
             captured_options["options"] = options
@@ -1091,6 +1345,7 @@ class TestYTStream:
         with (
             patch("src.youtube._ytdlp_extract", return_value=fake_data),
             patch.object(discord.FFmpegOpusAudio, "__init__", new=capture_init),
+            patch("src.youtube.live_volume_available", return_value=False),
         ):
             await YTDL.yt_stream(qobj, channel, volume=0.5)
 
@@ -1115,8 +1370,11 @@ class TestYTStream:
             executable: str,
             before_options: str,
             options: str,
+            codec: Optional[str] = None,
+            bitrate: Optional[int] = None,
         ) -> None:
             noop_ffmpeg_init(self)
+            captured_options["before_options"] = before_options
             captured_options["options"] = options
 
         with (
@@ -1125,7 +1383,10 @@ class TestYTStream:
         ):
             await YTDL.yt_stream(qobj, channel)
 
-        assert "-ss 90" in captured_options["options"]
+        # Input-side: before -i, so ffmpeg seeks the index instead of decoding
+        # everything up to the offset.
+        assert captured_options["before_options"].endswith(" -ss 90")
+        assert "-ss" not in captured_options["options"]
 
     async def test_yt_stream_carries_ts_as_start_offset(
         self, mock_ctx: MagicMock
@@ -1192,6 +1453,164 @@ class TestYTStream:
         assert result.analytics.queue_position == 4
 
 
+class TestOpusPassthrough:
+    """An Opus source is stream-copied (codec="opus" → ffmpeg `-c:a copy`); anything
+    that needs decoded audio is transcoded as before."""
+
+    async def _stream(
+        self,
+        mock_ctx: MagicMock,
+        *,
+        volume: float = 1.0,
+        live_volume: bool = False,
+        **data: Any,
+    ) -> tuple[YTDL, dict[str, Any]]:
+        captured: dict[str, Any] = {}
+
+        def capture_init(self: Any, url: str, **kwargs: Any) -> None:
+            noop_ffmpeg_init(self)
+            captured.update(kwargs)
+
+        qobj = QueueObject(
+            "https://www.youtube.com/watch?v=test", "Test Song", mock_ctx.author, ts=90
+        )
+        with (
+            patch("src.youtube._ytdlp_extract", return_value=_fake_ytdl_data(**data)),
+            patch.object(discord.FFmpegOpusAudio, "__init__", new=capture_init),
+            patch("src.youtube.live_volume_available", return_value=live_volume),
+        ):
+            song = await YTDL.yt_stream(
+                qobj, AsyncMock(spec=discord.TextChannel), volume=volume
+            )
+        return song, captured
+
+    async def test_an_opus_source_is_copied_and_still_seeks(
+        self, mock_ctx: MagicMock
+    ) -> None:
+        song, ffmpeg = await self._stream(mock_ctx, acodec="opus")
+        assert ffmpeg["codec"] == "opus"
+        assert song.passthrough is True
+        assert "-ss 90" in ffmpeg["before_options"]
+        # A copy keeps the pre-roll from the cue the input seek landed on unless
+        # told to drop it; without this the song would start early.
+        assert "-copypriorss 0" in ffmpeg["options"]
+        assert song.start_offset == 90
+
+    async def test_a_volume_filter_needs_the_transcode(
+        self, mock_ctx: MagicMock
+    ) -> None:
+        song, ffmpeg = await self._stream(mock_ctx, volume=0.5, acodec="opus")
+        assert ffmpeg["codec"] is None
+        assert song.passthrough is False
+        assert "volume=0.5" in ffmpeg["options"]
+        # Transcoded, the input seek is already exact (-accurate_seek).
+        assert "-copypriorss" not in ffmpeg["options"]
+
+    async def test_a_live_volume_keeps_the_copy(self, mock_ctx: MagicMock) -> None:
+        """With libopus the level is applied per packet in read(), so a quiet
+        guild still gets the copy and ffmpeg never hears about the volume."""
+        song, ffmpeg = await self._stream(
+            mock_ctx, volume=0.5, live_volume=True, acodec="opus"
+        )
+        assert ffmpeg["codec"] == "opus"
+        assert "volume=" not in ffmpeg["options"]
+        assert song.live_volume is True
+        assert song.volume == 0.5
+
+    async def test_a_transcode_takes_the_volume_in_ffmpegs_encode(
+        self, mock_ctx: MagicMock
+    ) -> None:
+        """ffmpeg encodes this song anyway; the gain stage on top would decode and
+        re-encode every packet a second time."""
+        song, ffmpeg = await self._stream(
+            mock_ctx, volume=0.5, live_volume=True, acodec="mp4a.40.2"
+        )
+        assert ffmpeg["codec"] is None
+        assert "volume=0.5" in ffmpeg["options"]
+        assert song.live_volume is False
+        assert song.volume == 1.0
+
+    @pytest.mark.parametrize("acodec", ["mp4a.40.2", None])
+    async def test_any_other_codec_is_transcoded(
+        self, mock_ctx: MagicMock, acodec: Optional[str]
+    ) -> None:
+        _, ffmpeg = await self._stream(mock_ctx, acodec=acodec)
+        assert ffmpeg["codec"] is None
+
+    async def test_can_be_turned_off(self, mock_ctx: MagicMock) -> None:
+        with patch("src.youtube._OPUS_PASSTHROUGH", False):
+            _, ffmpeg = await self._stream(mock_ctx, acodec="opus")
+        assert ffmpeg["codec"] is None
+
+
+class TestChannelBitrate:
+    """yt_stream fits a song to the voice channel it will play in: the lite rung for
+    a low-bitrate channel, and the channel's bitrate for anything encoded."""
+
+    _LITE = "https://r2.googlevideo.com/lite"
+
+    async def _stream(
+        self, mock_ctx: MagicMock, channel_bitrate: Optional[int], **data: Any
+    ) -> tuple[YTDL, dict[str, Any]]:
+        captured: dict[str, Any] = {}
+
+        def capture_init(self: Any, url: str, **kwargs: Any) -> None:
+            noop_ffmpeg_init(self)
+            captured.update(kwargs, url=url)
+
+        qobj = QueueObject(
+            "https://www.youtube.com/watch?v=test", "Test Song", mock_ctx.author
+        )
+        with (
+            patch("src.youtube._ytdlp_extract", return_value=_fake_ytdl_data(**data)),
+            patch.object(discord.FFmpegOpusAudio, "__init__", new=capture_init),
+        ):
+            song = await YTDL.yt_stream(
+                qobj,
+                AsyncMock(spec=discord.TextChannel),
+                channel_bitrate=channel_bitrate,
+            )
+        return song, captured
+
+    async def test_a_64_kbps_channel_gets_the_lite_rung(
+        self, mock_ctx: MagicMock, playable_urls: AsyncMock
+    ) -> None:
+        song, ffmpeg = await self._stream(
+            mock_ctx, 64000, lite_url=self._LITE, lite_abr=70, lite_format_id="250"
+        )
+        assert ffmpeg["url"] == self._LITE
+        assert ffmpeg["bitrate"] == 64
+        assert song.abr == 70
+        # Probed is what plays.
+        assert playable_urls.await_args.args[0] == self._LITE
+
+    async def test_a_wider_channel_keeps_the_best_rung(
+        self, mock_ctx: MagicMock
+    ) -> None:
+        _, ffmpeg = await self._stream(mock_ctx, 96000, lite_url=self._LITE)
+        assert ffmpeg["url"] != self._LITE
+        assert ffmpeg["bitrate"] == 96
+
+    async def test_without_a_lite_rung_a_low_channel_gets_the_best(
+        self, mock_ctx: MagicMock
+    ) -> None:
+        _, ffmpeg = await self._stream(mock_ctx, 64000)
+        assert ffmpeg["url"].startswith("https://r2.googlevideo.com/stream")
+
+    @pytest.mark.parametrize(("channel", "kbps"), [(None, 128), (384000, 128)])
+    async def test_the_encoder_is_capped_at_the_old_default(
+        self, mock_ctx: MagicMock, channel: Optional[int], kbps: int
+    ) -> None:
+        song, ffmpeg = await self._stream(mock_ctx, channel)
+        assert ffmpeg["bitrate"] == kbps
+        assert song.bitrate == kbps
+
+    async def test_can_be_turned_off(self, mock_ctx: MagicMock) -> None:
+        with patch("src.youtube._LITE_CHANNEL_KBPS", 0):
+            _, ffmpeg = await self._stream(mock_ctx, 64000, lite_url=self._LITE)
+        assert ffmpeg["url"] != self._LITE
+
+
 class TestStreamUrlTtl:
     def test_caps_ttl_regardless_of_expire(self) -> None:
         """A URL claiming hours of life is still only cached for the cap: YouTube
@@ -1554,31 +1973,6 @@ class TestRevokedStreamUrl:
                 await _probe_stream_url("")  # empty URL -> DEAD, a completed verdict
         assert not probe_path_looks_broken()
 
-    async def test_prefetch_never_re_extracts_an_unconfirmed_cached_url(
-        self, mock_ctx: MagicMock, fake_redis: aioredis.Redis, playable_urls: AsyncMock
-    ) -> None:
-        """_cancel_prefetch() awaits this task and an executor job cannot be
-        interrupted, so a re-extraction here would put an uninterruptible wait in front
-        of every -clear/-shuffle/-remove. The play-time resolve decides instead."""
-        webpage_url = "https://yt.com/v=prefetch_noreextract"
-        await self._cache(fake_redis, webpage_url, title="Cached Original")
-        playable_urls.return_value = StreamProbe.UNCONFIRMED
-        qobj = QueueObject(webpage_url, "Prefetch", mock_ctx.author)
-
-        with (
-            patch("src.youtube._ytdlp_extract") as mock_extract,
-            patch.object(discord.FFmpegOpusAudio, "__init__", new=noop_ffmpeg_init),
-        ):
-            song = await YTDL.yt_stream(
-                qobj,
-                AsyncMock(spec=discord.TextChannel),
-                redis=fake_redis,
-                allow_reextract=False,
-            )
-
-        assert song.title == "Cached Original"
-        mock_extract.assert_not_called()
-
     @pytest.mark.parametrize(
         ("status", "expected"),
         [
@@ -1603,6 +1997,7 @@ class TestRevokedStreamUrl:
         so they must not delete a cache entry."""
         response = MagicMock()
         response.status = status
+        response.content_length = None  # a streamed body: closed unread
         session = MagicMock()
         session.get.return_value.__aenter__ = AsyncMock(return_value=response)
         session.get.return_value.__aexit__ = AsyncMock(return_value=False)
@@ -1759,6 +2154,7 @@ class TestRevokedStreamUrl:
         """
         response = MagicMock()
         response.status = 403
+        response.content_length = None
         ctx = MagicMock()
         ctx.__aenter__ = AsyncMock(return_value=response)
         ctx.__aexit__ = AsyncMock(return_value=False)
@@ -1791,6 +2187,47 @@ class TestRevokedStreamUrl:
     async def test_empty_url_is_dead(self) -> None:
         assert await _probe_stream_url("") is StreamProbe.DEAD
 
+    @staticmethod
+    def _session_answering(response: MagicMock) -> MagicMock:
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        return session
+
+    async def test_a_small_refusal_is_drained_so_its_connection_is_kept(
+        self,
+    ) -> None:
+        """The resolve that gets a refusal probes the re-extracted URL next, on
+        the same edge: reading the short error page pools the connection for it."""
+        response = MagicMock(status=403, content_length=512)
+        response.read = AsyncMock(return_value=b"")
+        session = self._session_answering(response)
+        with patch("src.youtube._get_probe_session", return_value=session):
+            assert await _probe_stream_url("https://cdn/x") is StreamProbe.DEAD
+        response.read.assert_awaited_once()
+        response.close.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("status", "length"), [(200, 4_000_000), (200, None), (403, None), (403, 10**6)]
+    )
+    async def test_audio_and_unbounded_bodies_are_never_read(
+        self, status: int, length: Optional[int]
+    ) -> None:
+        response = MagicMock(status=status, content_length=length)
+        response.read = AsyncMock()
+        session = self._session_answering(response)
+        with patch("src.youtube._get_probe_session", return_value=session):
+            await _probe_stream_url("https://cdn/x")
+        response.read.assert_not_awaited()
+        response.close.assert_called_once()
+
+    async def test_a_failed_drain_keeps_the_verdict(self) -> None:
+        response = MagicMock(status=404, content_length=100)
+        response.read = AsyncMock(side_effect=aiohttp.ClientPayloadError("cut"))
+        session = self._session_answering(response)
+        with patch("src.youtube._get_probe_session", return_value=session):
+            assert await _probe_stream_url("https://cdn/x") is StreamProbe.DEAD
+
 
 class TestStreamCache:
     async def test_cache_hit_skips_executor(
@@ -1846,6 +2283,9 @@ class TestStreamCache:
         fake_data = _fake_ytdl_data(webpage_url="https://yt.com/v=err")
         bad_redis = AsyncMock()
         bad_redis.get = AsyncMock(side_effect=ConnectionError("Redis down"))
+        # A ytdl:stream: read also fetches the TTL the in-process tier needs, on a
+        # pipeline — which is synchronous to build, so a plain MagicMock.
+        bad_redis.pipeline = MagicMock(side_effect=ConnectionError("Redis down"))
         qobj = QueueObject("https://yt.com/v=err", "Error Song", mock_ctx.author)
         channel = AsyncMock(spec=discord.TextChannel)
         channel.send = AsyncMock()
@@ -1995,6 +2435,357 @@ class TestPrefetchStream:
         assert cached is None
 
 
+class TestPrefetchStreams:
+    async def test_one_job_fills_the_cache_for_every_miss(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        """The misses go to the pool as ONE job, and every result is written."""
+        from src import youtube
+
+        qobjs = [
+            QueueObject(f"https://yt.com/v=b{i}", f"Batch {i}", mock_ctx.author)
+            for i in range(3)
+        ]
+        calls: list[Any] = []
+        real_run = youtube.ytdlp_pool.run
+
+        async def counting_run(fn: Any, *args: Any, **kwargs: Any) -> Any:
+            calls.append(fn)
+            return await real_run(fn, *args, **kwargs)
+
+        with (
+            patch.object(youtube.ytdlp_pool, "run", side_effect=counting_run),
+            patch(
+                "src.youtube._ytdlp_extract",
+                side_effect=lambda req: _fake_ytdl_data(
+                    webpage_url=req.url, title=req.url
+                ),
+            ),
+        ):
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis)
+
+        assert calls == [youtube._ytdlp_extract_batch]
+        for qo in qobjs:
+            cached = await fake_redis.get(f"ytdl:stream:{qo.webpage_url}")
+            assert cached is not None
+            assert orjson.loads(cached)["title"] == qo.webpage_url
+
+    async def test_cached_songs_are_not_extracted(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        await fake_redis.set(
+            "ytdl:stream:https://yt.com/v=hit",
+            orjson.dumps(_fake_ytdl_data(webpage_url="https://yt.com/v=hit")),
+            ex=3600,
+        )
+        qobjs = [
+            QueueObject("https://yt.com/v=hit", "Hit", mock_ctx.author),
+            QueueObject("https://yt.com/v=miss", "Miss", mock_ctx.author),
+        ]
+        with patch(
+            "src.youtube._ytdlp_extract",
+            side_effect=lambda req: _fake_ytdl_data(webpage_url=req.url),
+        ) as mock_extract:
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis)
+
+        assert [c.args[0].url for c in mock_extract.call_args_list] == [
+            "https://yt.com/v=miss"
+        ]
+        # The hit still back-fills its QueueObject, like prefetch_stream's does.
+        assert qobjs[0].uploader == "Test Channel"
+
+    async def test_one_failure_costs_only_its_song(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        """A private video in the batch lands in its own slot: the job, and the
+        songs around it, carry on."""
+        from src import youtube
+        from src.youtube import ExtractionError
+
+        def extract(req: ExtractRequest) -> YTDLVideoInfo:
+            if req.url.endswith("bad"):
+                raise ExtractionError("ERROR: Private video", expected=True)
+            return _fake_ytdl_data(webpage_url=req.url)
+
+        qobjs = [
+            QueueObject(f"https://yt.com/v={name}", name, mock_ctx.author)
+            for name in ("good1", "bad", "good2")
+        ]
+        with patch("src.youtube._ytdlp_extract", side_effect=extract):
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis)
+
+        assert await fake_redis.get("ytdl:stream:https://yt.com/v=good1") is not None
+        assert await fake_redis.get("ytdl:stream:https://yt.com/v=bad") is None
+        assert await fake_redis.get("ytdl:stream:https://yt.com/v=good2") is not None
+        assert youtube.extraction_failures() == [("unavailable", 1)]
+
+    async def test_a_large_batch_is_split_into_bounded_jobs(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        from src import youtube
+
+        qobjs = [
+            QueueObject(f"https://yt.com/v=s{i}", f"Song {i}", mock_ctx.author)
+            for i in range(3)
+        ]
+        sizes: list[int] = []
+        real_run = youtube.ytdlp_pool.run
+
+        async def sizing_run(fn: Any, reqs: Any, **kwargs: Any) -> Any:
+            sizes.append(len(reqs))
+            return await real_run(fn, reqs, **kwargs)
+
+        with (
+            patch.object(youtube, "_STREAM_BATCH_MAX", 2),
+            patch.object(youtube.ytdlp_pool, "run", side_effect=sizing_run),
+            patch(
+                "src.youtube._ytdlp_extract",
+                side_effect=lambda req: _fake_ytdl_data(webpage_url=req.url),
+            ),
+        ):
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis)
+
+        assert sizes == [2, 1]
+
+    async def test_refresh_replaces_a_cached_entry(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        """refresh=True is StreamRefresher's: the entry exists and is about to
+        expire, so it is extracted anyway and rewritten with a full TTL."""
+        await fake_redis.set(
+            "ytdl:stream:https://yt.com/v=r",
+            orjson.dumps(_fake_ytdl_data(title="Old")),
+            ex=30,
+        )
+        qobj = QueueObject("https://yt.com/v=r", "Refresh", mock_ctx.author)
+        with patch(
+            "src.youtube._ytdlp_extract",
+            return_value=_fake_ytdl_data(webpage_url=qobj.webpage_url, title="New"),
+        ):
+            await YTDL.prefetch_streams([qobj], redis=fake_redis, refresh=True)
+
+        cached = await fake_redis.get("ytdl:stream:https://yt.com/v=r")
+        assert orjson.loads(cached)["title"] == "New"
+        assert await fake_redis.ttl("ytdl:stream:https://yt.com/v=r") > 30
+
+    async def test_no_op_when_redis_none(self, mock_ctx: MagicMock) -> None:
+        qobj = QueueObject("https://yt.com/v=nr", "No Redis", mock_ctx.author)
+        with patch("src.youtube._ytdlp_extract") as mock_extract:
+            await YTDL.prefetch_streams([qobj], redis=None)
+        mock_extract.assert_not_called()
+
+    async def test_swallows_a_failed_job(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        """Anything but a per-song yt-dlp error fails the job, and prefetch_streams
+        swallows it like prefetch_stream does."""
+        qobj = QueueObject("https://yt.com/v=boom", "Boom", mock_ctx.author)
+        with patch("src.youtube._ytdlp_extract", side_effect=RuntimeError("boom")):
+            await YTDL.prefetch_streams([qobj], redis=fake_redis)
+        assert await fake_redis.get("ytdl:stream:https://yt.com/v=boom") is None
+
+
+class TestUnplayableCache:
+    """The negative cache: a permanent extraction failure is remembered for
+    _UNPLAYABLE_TTL under the video's canonical key, and every extraction path
+    consults it first — a dead song costs a cache read, not a worker."""
+
+    @staticmethod
+    def _private(video_id: str = "dead") -> Any:
+        from src.youtube import ExtractionError
+
+        return ExtractionError(
+            f"ERROR: [youtube] {video_id}: Private video",
+            original_type="DownloadError",
+            expected=True,
+            video_id=video_id,
+        )
+
+    async def _yt_source(self, mock_ctx: MagicMock, search: str, redis: Redis) -> Any:
+        return await YTDL.yt_source(
+            mock_ctx.author,
+            search,
+            query_source="youtube.com",
+            analytics=_ANALYTICS,
+            user_input=None,
+            redis=redis,
+        )
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=abc123",
+            "https://youtube.com/watch?v=abc123&si=xyz&t=30",
+            "https://music.youtube.com/watch?v=abc123",
+            "https://youtu.be/abc123?si=xyz",
+            "youtu.be/abc123",
+            "https://m.youtube.com/watch?v=abc123",
+        ],
+    )
+    def test_every_spelling_of_a_video_shares_one_key(self, url: str) -> None:
+        from src.youtube import _unplayable_cache_key
+
+        assert _unplayable_cache_key(url) == "ytdl:unplayable:youtube:abc123"
+
+    def test_a_search_keys_on_its_normalised_text(self) -> None:
+        from src.youtube import _unplayable_cache_key
+
+        assert _unplayable_cache_key(" Some Song ") == "ytdl:unplayable:some song"
+
+    def test_a_link_keeps_its_path_and_query_verbatim(self) -> None:
+        """Short links and path IDs are case-sensitive: one dead link must not
+        refuse a different, playable one that differs only in case."""
+        from src.youtube import _unplayable_cache_key
+
+        assert _unplayable_cache_key(" HTTPS://Bit.LY/AbC?Ref=X ") == (
+            "ytdl:unplayable:https://bit.ly/AbC?Ref=X"
+        )
+        assert _unplayable_cache_key("https://bit.ly/abc") != (
+            _unplayable_cache_key("https://bit.ly/ABC")
+        )
+
+    def test_the_alias_key_folds_a_search_but_not_a_links_path(self) -> None:
+        from src.youtube import _alias_cache_key
+
+        assert _alias_cache_key("Destiny ") == _alias_cache_key("destiny")
+        assert _alias_cache_key("https://Example.com/Track/Xy") == (
+            "ytdl:alias:https://example.com/Track/Xy"
+        )
+
+    async def test_a_private_video_is_not_extracted_twice(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        from src.youtube import ExtractionError
+
+        url = "https://www.youtube.com/watch?v=dead"
+        with patch(
+            "src.youtube._ytdlp_extract", side_effect=self._private()
+        ) as extract:
+            with pytest.raises(ExtractionError):
+                await self._yt_source(mock_ctx, url, fake_redis)
+            with pytest.raises(ExtractionError) as caught:
+                await self._yt_source(mock_ctx, url, fake_redis)
+
+        assert extract.call_count == 1
+        assert caught.value.remembered
+        assert caught.value.user_message.startswith("[youtube] dead: Private video")
+        assert "known unplayable" in caught.value.user_message
+
+    async def test_a_search_that_found_a_dead_video_remembers_the_video(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        """The playlist entry for that video then skips without extracting."""
+        from src.youtube import ExtractionError
+
+        with patch("src.youtube._ytdlp_extract", side_effect=self._private("vid9")):
+            with pytest.raises(ExtractionError):
+                await self._yt_source(mock_ctx, "some song", fake_redis)
+
+        qobj = QueueObject(
+            "https://www.youtube.com/watch?v=vid9", "Some Song", mock_ctx.author
+        )
+        with (
+            patch("src.youtube._ytdlp_extract") as extract,
+            pytest.raises(ExtractionError) as caught,
+        ):
+            await YTDL._resolve_playable_stream(qobj, fake_redis)
+        extract.assert_not_called()
+        assert caught.value.remembered
+
+    @pytest.mark.parametrize(
+        "error_kwargs",
+        [
+            # yt-dlp marks its bot check expected, but it passes on its own.
+            {
+                "message": "ERROR: [youtube] x: Sign in to confirm you're not a bot",
+                "expected": True,
+            },
+            # Not yt-dlp's verdict at all: a network failure says nothing lasting.
+            {"message": "ERROR: unable to download webpage", "expected": False},
+        ],
+    )
+    async def test_a_transient_failure_is_not_remembered(
+        self, mock_ctx: MagicMock, fake_redis: Redis, error_kwargs: dict[str, Any]
+    ) -> None:
+        from src.youtube import ExtractionError
+
+        url = "https://www.youtube.com/watch?v=x"
+        with patch(
+            "src.youtube._ytdlp_extract", side_effect=ExtractionError(**error_kwargs)
+        ):
+            with pytest.raises(ExtractionError):
+                await self._yt_source(mock_ctx, url, fake_redis)
+        assert await fake_redis.keys("ytdl:unplayable:*") == []
+
+    async def test_a_remembered_unsupported_site_keeps_its_friendly_error(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        from src.youtube import ExtractionError
+
+        url = "https://example.com/not-media"
+        unsupported = ExtractionError("ERROR: Unsupported URL", unsupported=True)
+        with patch("src.youtube._ytdlp_extract", side_effect=unsupported) as extract:
+            for _ in range(2):
+                with pytest.raises(Exception, match="isn't from a site I can play"):
+                    await self._yt_source(mock_ctx, url, fake_redis)
+        assert extract.call_count == 1
+
+    async def test_prefetch_remembers_and_then_skips(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        qobj = QueueObject(
+            "https://www.youtube.com/watch?v=dead", "Dead", mock_ctx.author
+        )
+        with patch(
+            "src.youtube._ytdlp_extract", side_effect=self._private()
+        ) as extract:
+            await YTDL.prefetch_stream(qobj, redis=fake_redis)
+            await YTDL.prefetch_stream(qobj, redis=fake_redis)
+        assert extract.call_count == 1
+
+    async def test_a_batch_skips_known_dead_songs_and_remembers_new_ones(
+        self, mock_ctx: MagicMock, fake_redis: Redis
+    ) -> None:
+        from src.youtube import ExtractionError
+
+        extracted: list[str] = []
+
+        def extract(req: ExtractRequest) -> YTDLVideoInfo:
+            extracted.append(req.url)
+            if req.url.endswith("bad"):
+                raise self._private("bad")
+            return _fake_ytdl_data(webpage_url=req.url)
+
+        qobjs = [
+            QueueObject(f"https://www.youtube.com/watch?v={n}", n, mock_ctx.author)
+            for n in ("good", "bad")
+        ]
+        with patch("src.youtube._ytdlp_extract", side_effect=extract):
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis, refresh=True)
+            await YTDL.prefetch_streams(qobjs, redis=fake_redis, refresh=True)
+
+        assert extracted.count("https://www.youtube.com/watch?v=bad") == 1
+        assert extracted.count("https://www.youtube.com/watch?v=good") == 2
+        with pytest.raises(ExtractionError):
+            await YTDL._resolve_playable_stream(qobjs[1], fake_redis)
+
+    async def test_a_zero_ttl_turns_it_off(
+        self, mock_ctx: MagicMock, fake_redis: Redis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src import youtube
+
+        monkeypatch.setattr(youtube, "_UNPLAYABLE_TTL", 0)
+        qobj = QueueObject(
+            "https://www.youtube.com/watch?v=dead", "Dead", mock_ctx.author
+        )
+        with patch(
+            "src.youtube._ytdlp_extract", side_effect=self._private()
+        ) as extract:
+            await YTDL.prefetch_stream(qobj, redis=fake_redis)
+            await YTDL.prefetch_stream(qobj, redis=fake_redis)
+        assert extract.call_count == 2
+
+
 class TestYTStreamPlaynowFlags:
     async def test_flags_carried_onto_ytdl(self, mock_ctx: MagicMock) -> None:
         fake_data = _fake_ytdl_data()
@@ -2048,9 +2839,11 @@ class TestYTStreamPlaynowFlags:
             executable: str,
             before_options: Optional[str],
             options: Optional[str],
+            codec: Optional[str] = None,
+            bitrate: Optional[int] = None,
         ) -> None:
             noop_ffmpeg_init(self)
-            captured_options["options"] = options
+            captured_options["before_options"] = before_options
 
         with (
             patch("src.youtube._ytdlp_extract", return_value=fake_data),
@@ -2059,7 +2852,7 @@ class TestYTStreamPlaynowFlags:
             await YTDL.yt_stream(qobj, channel)
 
         channel.send.assert_not_awaited()
-        assert "-ss 151" in captured_options["options"]
+        assert "-ss 151" in captured_options["before_options"]
 
 
 class TestPotProviderCompatibility:
@@ -2203,21 +2996,22 @@ class TestSlimInfoReturnContract:
         assert restored["webpage_url"] == slim["webpage_url"]
 
     def test_slimmed_info_keeps_every_field_callers_read(self) -> None:
-        """No consumed field is lost to slimming. _STREAM_CACHE_FIELDS is the exhaustive
+        """No consumed field is lost to slimming. _RESULT_FIELDS is the exhaustive
         set of info-dict keys this codebase reads; each one present in the raw dict must
         survive, unchanged."""
         raw = _realistic_raw_info()
         slim = cast(dict[str, Any], _slim_info(raw))
-        for field in _STREAM_CACHE_FIELDS:
+        for field in _RESULT_FIELDS:
             if field in raw:
                 assert slim.get(field) == raw[field], f"{field} lost or altered"
 
-    def test_slimmed_info_drops_the_oversized_collections(self) -> None:
-        """The performance half: the large lists no caller reads are gone, so they are
-        not serialised worker->parent on every extraction."""
-        slim = cast(dict[str, Any], _slim_info(_realistic_raw_info()))
-        for field in _UNUSED_INFO_COLLECTIONS:
-            assert field not in slim, f"{field} should have been dropped"
+    def test_slimmed_info_is_a_projection_onto_what_callers_read(self) -> None:
+        """The performance half: nothing outside _RESULT_FIELDS crosses — not the
+        format ladder, and not the unread scalars (description, tags) either."""
+        raw = _realistic_raw_info(description="x" * 5000, tags=["a", "b"])
+        slim = cast(dict[str, Any], _slim_info(raw))
+        assert set(slim) <= _RESULT_FIELDS
+        assert "formats" not in slim and "description" not in slim
 
     def test_slimming_preserves_search_entries_but_slims_each(self) -> None:
         """A search/playlist wrapper's `entries` list must survive (yt_source unwraps it),
@@ -2232,16 +3026,86 @@ class TestSlimInfoReturnContract:
         assert entries[1] is None  # null entries (deleted/private) are preserved
         for entry in (entries[0], entries[2]):
             assert entry["webpage_url"] == "https://www.youtube.com/watch?v=test"
-            for field in _UNUSED_INFO_COLLECTIONS:
-                assert field not in entry
+            assert set(entry) <= _RESULT_FIELDS
         pickle.loads(pickle.dumps(slim))  # the whole wrapper still round-trips
 
+    def test_a_flat_entry_sheds_the_watch_url_its_id_rebuilds(self) -> None:
+        """yt_playlist rebuilds exactly that URL from `id`; any other URL (a Short,
+        another site) is information and stays."""
+        watch = {
+            "id": "abc",
+            "title": "T",
+            "url": "https://www.youtube.com/watch?v=abc",
+        }
+        short = {"id": "def", "title": "S", "url": "https://www.youtube.com/shorts/def"}
+        slim = cast(dict[str, Any], _slim_info({"entries": [watch, short]}))
+
+        assert slim["entries"] == [
+            {"id": "abc", "title": "T"},
+            {"id": "def", "title": "S", "url": "https://www.youtube.com/shorts/def"},
+        ]
+
+    def test_unset_and_non_scalar_values_are_dropped_as_absent(self) -> None:
+        """yt-dlp sets duration to None for livestreams; the callers' .get() already
+        treats absent and None alike, and a dropped odd-typed value cannot break the
+        pickle."""
+        slim = cast(
+            dict[str, Any],
+            _slim_info(_realistic_raw_info(duration=None, title=threading.Lock())),
+        )
+        assert "duration" not in slim and "title" not in slim
+
     def test_slim_info_passes_none_through(self) -> None:
         """A failed extract_info returns None; callers branch on `data is None`, so
         slimming must not turn it into anything else."""
         assert _slim_info(None) is None
 
 
+class TestLiteRung:
+    """The worker picks a low-bitrate channel's rung from the ladder the extraction
+    already has, so the stream cache holds both and no channel costs a second
+    extraction."""
+
+    @staticmethod
+    def _ladder() -> list[dict[str, Any]]:
+        def fmt(format_id: str, abr: float, acodec: str = "opus") -> dict[str, Any]:
+            return {
+                "format_id": format_id,
+                "abr": abr,
+                "acodec": acodec,
+                "vcodec": "none",
+                "protocol": "https",
+                "url": f"https://x/{format_id}",
+            }
+
+        return [
+            fmt("249", 50),
+            fmt("250", 70),
+            fmt("139", 48, "mp4a.40.5"),
+            fmt("251", 130),
+        ]
+
+    def test_the_best_opus_rung_under_the_cap_is_kept(self) -> None:
+        slim = cast(
+            dict[str, Any], _slim_info(_realistic_raw_info(formats=self._ladder()))
+        )
+        assert slim["lite_url"] == "https://x/250"
+        assert slim["lite_abr"] == 70
+        assert slim["lite_format_id"] == "250"
+        assert {"lite_url", "lite_abr", "lite_format_id"} <= _STREAM_CACHE_FIELDS
+
+    def test_none_when_the_chosen_format_is_already_it(self) -> None:
+        raw = _realistic_raw_info(formats=self._ladder()[:2], format_id="250")
+        assert "lite_url" not in cast(dict[str, Any], _slim_info(raw))
+
+    def test_a_muxed_or_hls_rung_is_not_lite(self) -> None:
+        ladder = self._ladder()
+        ladder[0]["vcodec"] = "avc1"
+        ladder[1]["protocol"] = "m3u8_native"
+        raw = _realistic_raw_info(formats=ladder)
+        assert "lite_url" not in cast(dict[str, Any], _slim_info(raw))
+
+
 class TestExtractionErrorClassification:
     """_ytdlp_extract's worker-side rewrap of yt-dlp's own (unpicklable) errors.
 
@@ -2391,6 +3255,172 @@ class TestExtractionErrorClassification:
             == "Couldn't load this track."
         )
 
+    @pytest.mark.parametrize(
+        ("fields", "kind"),
+        [
+            ({"unsupported": True, "expected": True}, "unsupported"),
+            ({"expected": True, "cause_type": "HTTPError"}, "unavailable"),
+            (
+                {"original_type": "DownloadError", "cause_type": "HTTPError"},
+                "HTTPError",
+            ),
+            ({"original_type": "DownloadError"}, "DownloadError"),
+            ({}, "unknown"),
+        ],
+    )
+    def test_kind_is_the_most_specific_class_known(
+        self, fields: dict[str, Any], kind: str
+    ) -> None:
+        from src.youtube import ExtractionError
+
+        assert ExtractionError("boom", **fields).kind == kind
+
+
+class _RecordingYdl:
+    """A YoutubeDL stand-in with real containers, so a reset can be observed: every
+    extract_info records the state it STARTED from, then dirties all of it the way a
+    real extraction does."""
+
+    built: list["_RecordingYdl"] = []
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        self.params = params
+        # What __init__ writes into the dict it was handed.
+        self.params["http_headers"] = {"User-Agent": "yt-dlp"}
+        self._num_downloads = 0
+        self._playlist_urls: set[str] = set()
+        self._printed_messages: set[str] = set()
+        self.cookiejar = MagicMock()
+        self.closed = False
+        self.seen: list[dict[str, Any]] = []
+        self.error: Optional[BaseException] = None
+        _RecordingYdl.built.append(self)
+
+    def extract_info(self, url: str, download: bool, process: bool) -> dict[str, Any]:
+        self.seen.append(
+            {
+                "params": {
+                    k: copy.copy(v) if isinstance(v, dict) else v
+                    for k, v in self.params.items()
+                },
+                "downloads": self._num_downloads,
+                "playlist_urls": set(self._playlist_urls),
+                "printed": set(self._printed_messages),
+            }
+        )
+        self.params["http_headers"]["Cookie"] = "leaked"
+        self.params["leaked"] = True
+        self._num_downloads += 1
+        self._playlist_urls.add(url)
+        self._printed_messages.add("only-once warning")
+        if self.error is not None:
+            raise self.error
+        return {"webpage_url": url, "title": "T"}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestWorkerYdlReuse:
+    """Each worker keeps one YoutubeDL per opts profile and resets it between uses,
+    instead of paying extractor registration and plugin discovery per extraction."""
+
+    @pytest.fixture(autouse=True)
+    def recording_ydl(self) -> Iterator[None]:
+        _RecordingYdl.built = []
+        with patch("src.youtube.youtube_dl.YoutubeDL", _RecordingYdl):
+            yield
+
+    def test_one_instance_serves_repeated_extractions_of_a_profile(self) -> None:
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS))
+
+        assert len(_RecordingYdl.built) == 1
+        assert len(_RecordingYdl.built[0].seen) == 2
+
+    def test_profiles_are_keyed_by_value_not_identity(self) -> None:
+        """A real worker unpickles a new opts dict per request, so an identity key
+        would never hit there."""
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(
+            ExtractRequest(
+                url="http://b", opts=pickle.loads(pickle.dumps(_YTDL_STREAM_OPTS))
+            )
+        )
+
+        assert len(_RecordingYdl.built) == 1
+
+    def test_each_profile_gets_its_own_instance(self) -> None:
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_PLAYLIST_OPTS))
+
+        assert len(_RecordingYdl.built) == 2
+
+    def test_a_reused_instance_starts_from_its_constructed_state(self) -> None:
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS))
+
+        ydl = _RecordingYdl.built[0]
+        first, second = ydl.seen
+        assert second["params"] == first["params"]
+        assert "leaked" not in second["params"]
+        assert second["params"]["http_headers"] == {"User-Agent": "yt-dlp"}
+        assert second["downloads"] == 0
+        assert second["playlist_urls"] == set()
+        assert second["printed"] == set()
+
+    def test_cookies_never_carry_into_the_next_extraction(self) -> None:
+        """-play reaches the generic extractor with a user-chosen host; a cookie it
+        set must not be replayed to YouTube for the next guild."""
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS))
+
+        _RecordingYdl.built[0].cookiejar.clear.assert_called_once_with()
+
+    def test_the_opts_profile_itself_is_never_written_to(self) -> None:
+        before = dict(_YTDL_STREAM_OPTS)
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+
+        assert _YTDL_STREAM_OPTS == before
+        assert "http_headers" not in _YTDL_STREAM_OPTS
+
+    def test_a_ytdlp_error_keeps_the_instance(self) -> None:
+        """A private video in a playlist is routine; it must not cost a rebuild."""
+        from src.youtube import ExtractionError
+
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        _RecordingYdl.built[0].error = DownloadError("ERROR: Private video")
+        with pytest.raises(ExtractionError):
+            _ytdlp_extract(ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS))
+        _RecordingYdl.built[0].error = None
+        _ytdlp_extract(ExtractRequest(url="http://c", opts=_YTDL_STREAM_OPTS))
+
+        assert len(_RecordingYdl.built) == 1
+        assert not _RecordingYdl.built[0].closed
+
+    def test_any_other_error_discards_the_instance(self) -> None:
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        broken = _RecordingYdl.built[0]
+        broken.error = KeyError("bug")
+        with pytest.raises(KeyError):
+            _ytdlp_extract(ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS))
+        _ytdlp_extract(ExtractRequest(url="http://c", opts=_YTDL_STREAM_OPTS))
+
+        assert broken.closed
+        assert len(_RecordingYdl.built) == 2
+
+    def test_an_instance_from_another_class_is_never_reused(self) -> None:
+        """Re-patching YoutubeDL (as every other test here does) must take effect."""
+        _ytdlp_extract(ExtractRequest(url="http://a", opts=_YTDL_STREAM_OPTS))
+        with patch("src.youtube.youtube_dl.YoutubeDL") as replacement:
+            replacement.return_value.extract_info.return_value = {"title": "New"}
+            result = _ytdlp_extract(
+                ExtractRequest(url="http://b", opts=_YTDL_STREAM_OPTS)
+            )
+
+        assert result is not None and result.get("title") == "New"
+        assert _RecordingYdl.built[0].closed
+
 
 class TestExtractRequest:
     """The request object that crosses the process boundary. Its whole purpose is
@@ -2467,6 +3497,20 @@ class TestRunExtract:
         fn, forwarded = mock_pool.run.call_args[0]
         assert forwarded is req  # not rebuilt, not copied, not spread
 
+    async def test_the_priority_reaches_the_pool_defaulting_to_interactive(
+        self,
+    ) -> None:
+        req = ExtractRequest(url="https://yt.com/v=x", opts={})
+        with patch("src.youtube.ytdlp_pool") as mock_pool:
+            mock_pool.run = AsyncMock(return_value=None)
+            await _run_extract(req)
+            await _run_extract(req, priority=ExtractPriority.BULK)
+
+        assert [c.kwargs["priority"] for c in mock_pool.run.await_args_list] == [
+            ExtractPriority.INTERACTIVE,
+            ExtractPriority.BULK,
+        ]
+
     async def test_submits_the_module_level_ytdlp_extract(self) -> None:
         """The callable must be resolved per call, not captured at def time: ~29
         tests and tests/conftest.py patch `src.youtube._ytdlp_extract` and
@@ -2531,6 +3575,25 @@ class TestRunExtract:
                 is None
             )
 
+    @pytest.mark.parametrize(
+        ("opts", "label"),
+        [
+            (_YTDL_STREAM_OPTS, "stream"),
+            (_YTDL_STREAM_SEARCH_OPTS, "search"),
+            (_YTDL_PLAYLIST_OPTS, "playlist"),
+            ({}, "other"),
+        ],
+    )
+    async def test_the_opts_profile_reaches_the_pool_as_its_label(
+        self, opts: dict[str, Any], label: str
+    ) -> None:
+        req = ExtractRequest(url="https://yt.com/v=x", opts=opts)
+        with patch("src.youtube.ytdlp_pool") as mock_pool:
+            mock_pool.run = AsyncMock(return_value=None)
+            await _run_extract(req)
+
+        assert mock_pool.run.call_args.kwargs["label"] == label
+
     async def test_pool_exception_propagates(self) -> None:
         """_classify_ytdlp_error already ran in the worker; _run_extract must not
         add a second layer of swallowing that would hide it from callers."""
@@ -2540,6 +3603,358 @@ class TestRunExtract:
                 await _run_extract(ExtractRequest(url="https://yt.com/v=x", opts={}))
 
 
+class TestExtractCoalescing:
+    """Identical in-flight requests share one pool job. Each test holds the first
+    job open on an Event, so the second request provably arrives mid-flight rather
+    than after the first landed."""
+
+    @staticmethod
+    def _held_pool(
+        result: Any = None, error: Optional[BaseException] = None
+    ) -> tuple[MagicMock, asyncio.Event]:
+        release = asyncio.Event()
+
+        async def run(fn: Any, req: ExtractRequest, **scheduling: Any) -> Any:
+            await release.wait()
+            if error is not None:
+                raise error
+            return result
+
+        pool = MagicMock()
+        pool.run = AsyncMock(side_effect=run)
+        return pool, release
+
+    async def test_concurrent_identical_requests_share_one_job(self) -> None:
+        payload = {"webpage_url": "https://yt.com/v=x", "title": "Song"}
+        pool, release = self._held_pool(result=payload)
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            first = asyncio.create_task(_run_extract(req))
+            second = asyncio.create_task(
+                _run_extract(ExtractRequest(url=req.url, opts=_YTDL_STREAM_OPTS))
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        pool.run.assert_awaited_once()
+        assert results[0] is payload and results[1] is payload
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ExtractRequest(url="https://yt.com/v=y", opts=_YTDL_STREAM_OPTS),
+            ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_PLAYLIST_OPTS),
+            ExtractRequest(
+                url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS, download=True
+            ),
+        ],
+        ids=["url", "profile", "flags"],
+    )
+    async def test_different_requests_are_not_coalesced(
+        self, other: ExtractRequest
+    ) -> None:
+        pool, release = self._held_pool()
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            first = asyncio.create_task(_run_extract(req))
+            second = asyncio.create_task(_run_extract(other))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert pool.run.await_count == 2
+
+    async def test_a_more_urgent_request_does_not_wait_on_a_background_job(
+        self,
+    ) -> None:
+        """A -play of the song a prefetch is extracting must not queue behind that
+        prefetch's lane; it submits its own job at its own priority."""
+        pool, release = self._held_pool()
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            background = asyncio.create_task(
+                _run_extract(req, priority=ExtractPriority.PREFETCH)
+            )
+            await asyncio.sleep(0)
+            urgent = asyncio.create_task(
+                _run_extract(req, priority=ExtractPriority.INTERACTIVE)
+            )
+            later = asyncio.create_task(
+                _run_extract(req, priority=ExtractPriority.PLAYBACK)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(background, urgent, later)
+
+        priorities = [c.kwargs["priority"] for c in pool.run.await_args_list]
+        # The PLAYBACK arrival joined the INTERACTIVE job rather than a third one.
+        assert priorities == [ExtractPriority.PREFETCH, ExtractPriority.INTERACTIVE]
+
+    async def test_a_less_urgent_request_joins_a_more_urgent_job(self) -> None:
+        pool, release = self._held_pool()
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            first = asyncio.create_task(_run_extract(req))
+            second = asyncio.create_task(
+                _run_extract(req, priority=ExtractPriority.BULK)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+        pool.run.assert_awaited_once()
+
+    async def test_a_landed_flight_is_not_a_cache(self) -> None:
+        """Coalescing covers the window a job is running and nothing more — a later
+        request extracts again, so a result can never outlive the URL it carries."""
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool") as mock_pool:
+            mock_pool.run = AsyncMock(return_value=None)
+            await _run_extract(req)
+            await _run_extract(req)
+
+        assert mock_pool.run.await_count == 2
+
+    async def test_a_failure_reaches_every_waiter(self) -> None:
+        pool, release = self._held_pool(error=RuntimeError("boom"))
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            first = asyncio.create_task(_run_extract(req))
+            second = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            release.set()
+            outcomes = await asyncio.gather(first, second, return_exceptions=True)
+
+        pool.run.assert_awaited_once()
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+    async def test_a_cancelled_waiter_does_not_cancel_the_shared_job(self) -> None:
+        """A prefetch torn down by -clear must not take a -play's extraction with it."""
+        payload = {"title": "Song"}
+        pool, release = self._held_pool(result=payload)
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            doomed = asyncio.create_task(_run_extract(req))
+            survivor = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            release.set()
+            assert await survivor is payload
+
+        with pytest.raises(asyncio.CancelledError):
+            await doomed
+
+    async def test_the_last_waiter_cancelled_aborts_the_job(self) -> None:
+        """Nobody is left to want the result, so the pool job is cancelled — which
+        YtdlpPool.run turns into an abort inside the worker."""
+        import src.youtube as youtube
+
+        pool, _release = self._held_pool()
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            first = asyncio.create_task(_run_extract(req))
+            second = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            job = youtube._inflight[youtube._flight_key(req)].task
+
+            first.cancel()
+            await asyncio.sleep(0)
+            assert not job.cancelling(), "a waiter remains; the job must keep running"
+
+            second.cancel()
+            outcomes = await asyncio.gather(first, second, return_exceptions=True)
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+        assert all(isinstance(o, asyncio.CancelledError) for o in outcomes)
+        assert youtube._inflight == {}
+
+    async def test_a_request_after_an_abort_submits_its_own_job(self) -> None:
+        """An aborting flight is as good as done; joining it would only inherit
+        the cancellation."""
+        pool, release = self._held_pool(result={"title": "Song"})
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            doomed = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            await asyncio.sleep(0)
+            fresh = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            release.set()
+            assert await fresh == {"title": "Song"}
+
+        assert pool.run.await_count == 2
+
+    async def test_the_registry_is_empty_once_a_flight_lands(self) -> None:
+        import src.youtube as youtube
+
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool") as mock_pool:
+            mock_pool.run = AsyncMock(side_effect=RuntimeError("boom"))
+            with pytest.raises(RuntimeError):
+                await _run_extract(req)
+
+        assert youtube._inflight == {}
+
+    async def test_a_failed_job_is_counted_once_by_kind(self) -> None:
+        """Per job, not per waiter: two callers sharing one failure is one failure."""
+        import src.youtube as youtube
+        from src.youtube import ExtractionError
+
+        pool, release = self._held_pool(
+            error=ExtractionError("Private video", expected=True)
+        )
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            waiters = [asyncio.create_task(_run_extract(req)) for _ in range(2)]
+            await asyncio.sleep(0)
+            release.set()
+            outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(o, ExtractionError) for o in outcomes)
+        assert youtube.extraction_failures() == [("unavailable", 1)]
+
+    async def test_an_aborted_job_is_not_a_failure(self) -> None:
+        import src.youtube as youtube
+
+        pool, _release = self._held_pool()
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            doomed = asyncio.create_task(_run_extract(req))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await doomed
+            await asyncio.sleep(0)
+
+        assert youtube.extraction_failures() == []
+
+
+class TestExtractHedging:
+    """A playback-critical extraction still running at the hedge deadline gets a
+    second job, and the first outcome wins. The deadline is patched short; each
+    fake attempt parks until the test releases it by index."""
+
+    @staticmethod
+    def _attempts(*results: Any) -> tuple[MagicMock, list[asyncio.Event], list[bool]]:
+        releases = [asyncio.Event() for _ in results]
+        cancelled = [False] * len(results)
+        calls = 0
+
+        async def run(fn: Any, req: ExtractRequest, **scheduling: Any) -> Any:
+            nonlocal calls
+            index, calls = calls, calls + 1
+            try:
+                await releases[index].wait()
+            except asyncio.CancelledError:
+                cancelled[index] = True
+                raise
+            if isinstance(results[index], BaseException):
+                raise results[index]
+            return results[index]
+
+        pool = MagicMock()
+        pool.run = AsyncMock(side_effect=run)
+        return pool, releases, cancelled
+
+    @pytest.fixture(autouse=True)
+    def _short_deadline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import src.youtube as youtube
+
+        monkeypatch.setattr(youtube, "_HEDGE_MIN_SECS", 0.01)
+
+    async def test_a_stalled_extraction_is_won_by_the_hedge(self) -> None:
+        pool, releases, cancelled = self._attempts({"title": "slow"}, {"title": "fast"})
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            flight = asyncio.create_task(
+                _run_extract(req, priority=ExtractPriority.PLAYBACK)
+            )
+            while pool.run.await_count < 2:
+                await asyncio.sleep(0.005)
+            releases[1].set()
+            assert await flight == {"title": "fast"}
+
+        assert cancelled == [True, False], "the stalled attempt must be aborted"
+        first, second = pool.run.await_args_list
+        assert first.kwargs == second.kwargs  # same lane, same guild, same label
+
+    async def test_the_first_attempt_still_wins_if_it_lands_first(self) -> None:
+        pool, releases, cancelled = self._attempts({"title": "first"}, None)
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            flight = asyncio.create_task(_run_extract(req))
+            while pool.run.await_count < 2:
+                await asyncio.sleep(0.005)
+            releases[0].set()
+            assert await flight == {"title": "first"}
+
+        assert cancelled == [False, True]
+
+    async def test_an_extraction_back_in_time_is_never_hedged(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import src.youtube as youtube
+
+        monkeypatch.setattr(youtube, "_HEDGE_MIN_SECS", 5.0)
+        pool, releases, _ = self._attempts({"title": "T"})
+        releases[0].set()
+        with patch("src.youtube.ytdlp_pool", pool):
+            await _run_extract(ExtractRequest(url="https://yt.com/v=x", opts={}))
+
+        pool.run.assert_awaited_once()
+        assert len(youtube._extract_times) == 1
+
+    @pytest.mark.parametrize(
+        "priority", [ExtractPriority.PREFETCH, ExtractPriority.BULK]
+    )
+    async def test_background_work_is_never_hedged(
+        self, priority: ExtractPriority
+    ) -> None:
+        pool, releases, _ = self._attempts({"title": "T"}, None)
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            flight = asyncio.create_task(_run_extract(req, priority=priority))
+            await asyncio.sleep(0.05)
+            releases[0].set()
+            await flight
+
+        pool.run.assert_awaited_once()
+
+    async def test_cancelling_the_flight_cancels_both_attempts(self) -> None:
+        pool, _releases, cancelled = self._attempts(None, None)
+        req = ExtractRequest(url="https://yt.com/v=x", opts=_YTDL_STREAM_OPTS)
+        with patch("src.youtube.ytdlp_pool", pool):
+            flight = asyncio.create_task(_run_extract(req))
+            while pool.run.await_count < 2:
+                await asyncio.sleep(0.005)
+            flight.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await flight
+            await asyncio.sleep(0)
+
+        assert cancelled == [True, True]
+
+    def test_the_deadline_is_the_percentile_never_below_the_floor(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import src.youtube as youtube
+
+        monkeypatch.setattr(youtube, "_HEDGE_MIN_SECS", 4.0)
+        assert youtube._hedge_delay() == 4.0  # too few samples yet
+
+        youtube._extract_times.extend([3.0] * 19 + [30.0])
+        assert youtube._hedge_delay() == 4.0  # p95 of a healthy window is under it
+
+        youtube._extract_times.extend([9.0] * 20)
+        assert youtube._hedge_delay() == 9.0
+
+        monkeypatch.setattr(youtube, "_HEDGE_PERCENTILE", 0.0)
+        assert youtube._hedge_delay() is None
+
+
 class TestProbeSessionSharing:
     """The probe holds one process-wide session. It pools nothing (the body goes
     unread), so what these pin is the lifecycle: reuse, replacement and close."""
@@ -2626,6 +4041,24 @@ class TestProbeSessionSharing:
         finally:
             await youtube.close_probe_session()
 
+    async def test_probe_connector_caches_dns_across_songs(self) -> None:
+        """The CDN edge is sticky, so its address outlives a song; aiohttp's 10s
+        default would put a lookup back in front of nearly every song start."""
+        import src.youtube as youtube
+
+        with patch.object(
+            aiohttp, "TCPConnector", wraps=aiohttp.TCPConnector
+        ) as connector:
+            youtube._get_probe_session()
+        try:
+            # The connector exposes no accessor for its DNS TTL; its arguments are
+            # the only public record.
+            kwargs = connector.call_args.kwargs
+            assert kwargs["ttl_dns_cache"] == youtube._PROBE_DNS_CACHE_SECS
+            assert kwargs.get("use_dns_cache", True)
+        finally:
+            await youtube.close_probe_session()
+
     async def test_probe_session_keeps_no_cookies(self) -> None:
         """One session serves every guild, and `-play <any url>` reaches it via the
         generic extractor — so a default CookieJar would let one guild set a
@@ -7,8 +7,13 @@ exception — it spawns for real; see its docstring."""
 
 import asyncio
 import os
+import gc
 import pickle
+import subprocess
+import sys
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures import (
     BrokenExecutor,
@@ -18,11 +23,24 @@ from concurrent.futures import (
 )
 from concurrent.futures.process import BrokenProcessPool
 from logging.handlers import QueueListener
+from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+import src.ytdlp_pool as ytdlp_pool_module
 from src.ytdlp_pool import (
+    _ABORT_SIGNAL,
+    ExtractPriority,
+    GuildLoad,
+    JobAborted,
+    PoolStats,
+    _call_with_context,
+    _on_abort_signal,
+    _slot,
+    _mp_context,
+    _worker_rss_bytes,
     PoolClosedError,
     RemoteCallError,
     YtdlpPool,
@@ -116,6 +134,35 @@ def _log_warning_in_worker(message: str) -> int:
     return os.getpid()
 
 
+def _worker_was_forked_warm(_ignored: object) -> tuple[bool, bool]:
+    """Whether this worker inherited the forkserver template: yt-dlp's extractor
+    registry already imported, and objects frozen before the fork."""
+    return "yt_dlp.extractor.extractors" in sys.modules, gc.get_freeze_count() > 0
+
+
+def _sleep_in_worker(seconds: float) -> int:
+    """Hold a worker the way a slow extraction does; time.sleep is interruptible by a
+    signal handler that raises, as yt-dlp's socket waits are."""
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _record_after(gate: threading.Event, order: list[str], label: str) -> str:
+    """Block until `gate` opens, then record that `label` ran. The order list is the
+    dispatch order whenever the pool has one worker."""
+    gate.wait(timeout=5)
+    order.append(label)
+    return label
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition never became true")
+
+
 def _thread_pool_factory(max_workers: int = 2) -> Callable[[], Executor]:
     """A factory the pool can call to get an in-process executor."""
     return lambda: ThreadPoolExecutor(
@@ -141,7 +188,7 @@ class TestLazyCreation:
         """The default factory is the only place a real ProcessPoolExecutor is named.
         Patched rather than constructed: this asserts the wiring (worker count,
         hardened initializer), not that multiprocessing works."""
-        pool = YtdlpPool(max_workers=3)
+        pool = YtdlpPool(max_workers=3, max_tasks_per_worker=50)
         sentinel = MagicMock(name="ProcessPoolExecutor-instance")
 
         with patch("src.ytdlp_pool.ProcessPoolExecutor", return_value=sentinel) as ctor:
@@ -151,10 +198,14 @@ class TestLazyCreation:
             assert executor is sentinel
             # Wiring, not multiprocessing: the hardened initializer plus the worker-log
             # queue handed to it via initargs (Option B).
+            # The context is explicit because max_tasks_per_child (the recycling)
+            # refuses fork, and the log queue must share it.
             ctor.assert_called_once_with(
                 max_workers=3,
                 initializer=_worker_init,
-                initargs=(pool._log_queue,),
+                initargs=(pool._log_queue, pool._abort_board),
+                mp_context=_mp_context(),
+                max_tasks_per_child=50,
             )
             # the real spawn path starts a listener to drain that queue into the parent
             assert pool._log_listener is not None
@@ -228,7 +279,9 @@ class TestPrewarm:
         from concurrent.futures import ProcessPoolExecutor
 
         executor = MagicMock(spec=ProcessPoolExecutor)
-        pool = YtdlpPool(max_workers=3, executor_factory=lambda: executor)
+        pool = YtdlpPool(
+            max_workers=3, min_workers=3, executor_factory=lambda: executor
+        )
 
         pool.prewarm()
 
@@ -236,6 +289,17 @@ class TestPrewarm:
         for call in executor.submit.call_args_list:
             assert call.args[0] is _warmup_noop
 
+    def test_prewarm_spawns_only_the_floor(self) -> None:
+        """Workers above min_workers are the autoscaler's to add, on demand."""
+        executor = MagicMock(spec=ProcessPoolExecutor)
+        pool = YtdlpPool(
+            max_workers=4, min_workers=2, executor_factory=lambda: executor
+        )
+
+        pool.prewarm()
+
+        assert executor.submit.call_count == 2
+
     def test_prewarm_after_shutdown_raises(self) -> None:
         """The closed gate covers every entry point, not just run()."""
         pool = YtdlpPool(executor_factory=_thread_pool_factory())
@@ -319,6 +383,745 @@ class TestRun:
         assert issubclass(PoolClosedError, RuntimeError)
 
 
+class TestPriorityLanes:
+    """Admission in front of the executor: at most max_workers jobs are submitted,
+    the rest queue in per-priority lanes, and `interactive_reserve` slots are held
+    back for INTERACTIVE work. Gated thread jobs make every point where a job is
+    running-vs-queued observable."""
+
+    async def test_interactive_starts_while_background_work_is_queued(self) -> None:
+        """The point of the reserve: with the background classes at their limit and
+        more of them queued, a -play still gets a worker at once."""
+        pool = YtdlpPool(
+            max_workers=2,
+            executor_factory=_thread_pool_factory(2),
+            interactive_reserve=1,
+        )
+        gate, order = threading.Event(), []
+        try:
+            background = [
+                asyncio.create_task(
+                    pool.run(_record_after, gate, order, f"bg{i}", priority=priority)
+                )
+                for i, priority in enumerate(
+                    [ExtractPriority.PREFETCH, ExtractPriority.BULK]
+                )
+            ]
+            await _until(lambda: pool._running == 1)
+
+            assert await pool.run(_double, 21) == 42
+            assert order == []  # nothing in the background finished first
+        finally:
+            gate.set()
+            await asyncio.gather(*background)
+            pool.shutdown(wait=False)
+
+    async def test_queued_jobs_dispatch_most_urgent_first(self) -> None:
+        """Arrival order is the exact reverse of urgency; dispatch order must not be."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(pool.run(_record_after, gate, order, "held"))
+            await _until(lambda: pool._running == 1)
+            queued = []
+            for priority in reversed(ExtractPriority):
+                queued.append(
+                    asyncio.create_task(
+                        pool.run(
+                            _record_after, gate, order, priority.name, priority=priority
+                        )
+                    )
+                )
+                await asyncio.sleep(0)  # fix the arrival order
+
+            gate.set()
+            await asyncio.gather(holder, *queued)
+
+            assert order == ["held"] + [p.name for p in ExtractPriority]
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_class_is_first_in_first_out(self) -> None:
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(pool.run(_record_after, gate, order, "held"))
+            await _until(lambda: pool._running == 1)
+            queued = []
+            for label in ("a", "b", "c"):
+                queued.append(
+                    asyncio.create_task(
+                        pool.run(
+                            _record_after,
+                            gate,
+                            order,
+                            label,
+                            priority=ExtractPriority.PREFETCH,
+                        )
+                    )
+                )
+                await asyncio.sleep(0)
+
+            gate.set()
+            await asyncio.gather(holder, *queued)
+
+            assert order == ["held", "a", "b", "c"]
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_new_arrival_never_overtakes_a_queued_job_of_its_class(
+        self,
+    ) -> None:
+        """A busy pool with a job already waiting: the next caller queues behind it,
+        rather than starting on whichever slot frees first."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        pool._take(None)  # the one worker is busy
+        pool._lanes[ExtractPriority.BULK][None] = deque(
+            [asyncio.get_running_loop().create_future()]
+        )
+        try:
+            task = asyncio.create_task(
+                pool.run(_double, 1, priority=ExtractPriority.BULK)
+            )
+            await asyncio.sleep(0.05)
+
+            assert not task.done()
+            assert len(pool._lanes[ExtractPriority.BULK][None]) == 2
+        finally:
+            task.cancel()
+            pool.shutdown(wait=False)
+
+    def test_the_reserve_always_leaves_background_work_a_slot(self) -> None:
+        """Clamped to max_workers - 1: a one-worker pool reserving its only worker
+        would starve prefetch and playlists forever."""
+        pool = YtdlpPool(max_workers=1, interactive_reserve=3)
+
+        assert pool._limit(ExtractPriority.BULK) == 1
+        assert pool._limit(ExtractPriority.INTERACTIVE) == 1
+
+    async def test_a_cancelled_queued_job_leaves_its_lane(self) -> None:
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(pool.run(_record_after, gate, order, "held"))
+            await _until(lambda: pool._running == 1)
+            doomed = asyncio.create_task(
+                pool.run(
+                    _record_after, gate, order, "doomed", priority=ExtractPriority.BULK
+                )
+            )
+            await asyncio.sleep(0)
+
+            doomed.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await doomed
+            gate.set()
+            await holder
+
+            assert order == ["held"]
+            assert not pool._lanes[ExtractPriority.BULK]
+            assert pool._running == 0
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_job_cancelled_as_a_slot_frees_still_raises_cancelled(
+        self,
+    ) -> None:
+        """cancel() cancels the waiter at once, so a release in the same tick pops
+        it from its lane before the job's own handler runs — which must then find
+        nothing to withdraw, not raise over the CancelledError."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        try:
+            pool._take(None)  # a job holding the only worker
+            doomed = asyncio.create_task(
+                pool.run(_double, 1, priority=ExtractPriority.BULK)
+            )
+            await asyncio.sleep(0)
+
+            doomed.cancel()
+            pool._release(None)
+            with pytest.raises(asyncio.CancelledError):
+                await doomed
+
+            assert not pool._lanes[ExtractPriority.BULK]
+            assert pool._running == 0
+            assert await pool.run(_double, 4) == 8
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_failing_job_releases_its_slot(self) -> None:
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        fn = MagicMock(side_effect=ValueError("boom"))
+        try:
+            with pytest.raises(ValueError):
+                await pool.run(fn)
+
+            assert pool._running == 0
+            assert await pool.run(_double, 4) == 8
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_the_default_priority_is_interactive(self) -> None:
+        """An unclassified caller lands in the most urgent lane rather than behind
+        every prefetch — forgetting to classify must never be the slow path."""
+        pool = YtdlpPool(
+            max_workers=2,
+            executor_factory=_thread_pool_factory(2),
+            interactive_reserve=1,
+        )
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(
+                pool.run(
+                    _record_after, gate, order, "bg", priority=ExtractPriority.PREFETCH
+                )
+            )
+            await _until(lambda: pool._running == 1)
+
+            assert await pool.run(_double, 2) == 4
+        finally:
+            gate.set()
+            await holder
+            pool.shutdown(wait=False)
+
+
+class TestGuildFairness:
+    """Within a priority lane, each guild is its own FIFO flow, served round-robin,
+    and no guild's background work may hold more than `guild_share` workers."""
+
+    async def test_guilds_take_turns_within_a_lane(self) -> None:
+        """One guild's 3-deep backlog does not make a later guild wait for all of it."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(
+                pool.run(_record_after, gate, order, "held", guild_id=1)
+            )
+            await _until(lambda: pool._running == 1)
+            queued = []
+            for guild_id, label in [(1, "a1"), (1, "a2"), (1, "a3"), (2, "b1")]:
+                queued.append(
+                    asyncio.create_task(
+                        pool.run(
+                            _record_after,
+                            gate,
+                            order,
+                            label,
+                            priority=ExtractPriority.PLAYBACK,
+                            guild_id=guild_id,
+                        )
+                    )
+                )
+                await asyncio.sleep(0)
+
+            gate.set()
+            await asyncio.gather(holder, *queued)
+
+            assert order == ["held", "a1", "b1", "a2", "a3"]
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_job_cancelled_as_its_flow_is_served_leaves_the_rest_queued(
+        self,
+    ) -> None:
+        """The same-tick race as in TestPriorityLanes, inside a flow: the release
+        pops the cancelled waiter, grants the one behind it and keeps the flow for
+        the third. The handler must find its waiter gone — neither a ValueError
+        from the flow nor a KeyError once the flow is dropped."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            pool._take(None)  # a job holding the only worker
+            doomed, *rest = [
+                asyncio.create_task(
+                    pool.run(
+                        _record_after,
+                        gate,
+                        order,
+                        label,
+                        priority=ExtractPriority.PLAYBACK,
+                        guild_id=1,
+                    )
+                )
+                for label in ["doomed", "a1", "a2"]
+            ]
+            await asyncio.sleep(0)
+
+            doomed.cancel()
+            pool._release(None)
+            with pytest.raises(asyncio.CancelledError):
+                await doomed
+            assert len(pool._lanes[ExtractPriority.PLAYBACK][1]) == 1
+
+            gate.set()
+            await asyncio.gather(*rest)
+
+            assert order == ["a1", "a2"]
+            assert not pool._lanes[ExtractPriority.PLAYBACK]
+            assert pool._running == 0
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_guild_at_its_share_leaves_workers_for_the_rest(self) -> None:
+        pool = YtdlpPool(
+            max_workers=4,
+            executor_factory=_thread_pool_factory(4),
+            interactive_reserve=1,
+            guild_share=2,
+        )
+        gate, order = threading.Event(), []
+        try:
+            flood = [
+                asyncio.create_task(
+                    pool.run(
+                        _record_after,
+                        gate,
+                        order,
+                        f"flood{i}",
+                        priority=ExtractPriority.PREFETCH,
+                        guild_id=1,
+                    )
+                )
+                for i in range(5)
+            ]
+            await _until(lambda: pool._running == 2)
+            await asyncio.sleep(0.05)
+            assert pool._running == 2  # one background slot still free
+
+            other = await pool.run(
+                _double, 21, priority=ExtractPriority.PREFETCH, guild_id=2
+            )
+
+            assert other == 42
+            assert order == []
+        finally:
+            gate.set()
+            await asyncio.gather(*flood)
+            pool.shutdown(wait=False)
+
+    async def test_interactive_work_is_exempt_from_the_share(self) -> None:
+        """A guild's own -play must not wait out its own queued prefetches."""
+        pool = YtdlpPool(
+            max_workers=4,
+            executor_factory=_thread_pool_factory(4),
+            interactive_reserve=1,
+            guild_share=1,
+        )
+        gate, order = threading.Event(), []
+        try:
+            background = asyncio.create_task(
+                pool.run(
+                    _record_after,
+                    gate,
+                    order,
+                    "bg",
+                    priority=ExtractPriority.PREFETCH,
+                    guild_id=1,
+                )
+            )
+            await _until(lambda: pool._running == 1)
+
+            assert await pool.run(_double, 2, guild_id=1) == 4
+        finally:
+            gate.set()
+            await background
+            pool.shutdown(wait=False)
+
+    async def test_state_reports_each_guilds_running_and_queued_work(self) -> None:
+        pool = YtdlpPool(
+            max_workers=2,
+            executor_factory=_thread_pool_factory(2),
+            interactive_reserve=0,
+            guild_share=1,
+        )
+        gate, order = threading.Event(), []
+        try:
+            jobs = [
+                asyncio.create_task(
+                    pool.run(
+                        _record_after,
+                        gate,
+                        order,
+                        label,
+                        priority=ExtractPriority.BULK,
+                        guild_id=guild_id,
+                    )
+                )
+                for guild_id, label in [(1, "a1"), (1, "a2"), (1, "a3"), (2, "b1")]
+            ]
+            await _until(lambda: pool._running == 2)
+
+            state = pool.state
+
+            assert state.running == 2
+            assert state.queued == 2
+            assert state.guild_share == 1
+            assert state.guilds == (
+                GuildLoad(guild_id=1, running=1, queued=2),
+                GuildLoad(guild_id=2, running=1, queued=0),
+            )
+        finally:
+            gate.set()
+            await asyncio.gather(*jobs)
+            pool.shutdown(wait=False)
+
+        assert pool.state.guilds == ()  # nothing left behind once drained
+
+    @pytest.mark.parametrize(
+        ("max_workers", "reserve", "share", "expected"),
+        [
+            (4, 1, None, 2),  # half of the 3 background slots, rounded up
+            (1, 0, None, 1),
+            (4, 1, 10, 3),  # never above the background capacity
+            (4, 1, 1, 1),
+        ],
+    )
+    def test_the_share_defaults_to_half_the_background_capacity(
+        self, max_workers: int, reserve: int, share: Optional[int], expected: int
+    ) -> None:
+        pool = YtdlpPool(
+            max_workers=max_workers, interactive_reserve=reserve, guild_share=share
+        )
+        assert pool.state.guild_share == expected
+
+
+class TestAutoscaling:
+    """Capacity moves between min_workers and max_workers: up when work queues for a
+    worker (at once for INTERACTIVE, after scale_up_wait otherwise), down when an
+    idle_secs window never needed it. Executors with surplus or overgrown workers
+    are recycled — retired gracefully, never broken."""
+
+    def test_a_fresh_pool_sits_at_its_floor(self) -> None:
+        pool = YtdlpPool(max_workers=4, min_workers=1)
+
+        assert pool.state.capacity == 1
+        assert pool.state.min_workers == 1
+
+    async def test_an_interactive_job_that_would_queue_grows_the_pool_at_once(
+        self,
+    ) -> None:
+        pool = YtdlpPool(
+            max_workers=2,
+            min_workers=1,
+            scale_up_wait=60,
+            executor_factory=_thread_pool_factory(2),
+        )
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(pool.run(_record_after, gate, order, "held"))
+            await _until(lambda: pool._running == 1)
+
+            assert await pool.run(_double, 21) == 42
+            assert pool.state.capacity == 2
+        finally:
+            gate.set()
+            await holder
+            pool.shutdown(wait=False)
+
+    async def test_background_work_grows_the_pool_only_after_queueing(self) -> None:
+        """A burst that a busy worker would absorb must not spawn one; work still
+        queued after scale_up_wait does."""
+        pool = YtdlpPool(
+            max_workers=2,
+            min_workers=1,
+            interactive_reserve=0,
+            guild_share=2,
+            scale_up_wait=0.2,
+            executor_factory=_thread_pool_factory(2),
+        )
+        gate, order = threading.Event(), []
+        try:
+            jobs = [
+                asyncio.create_task(
+                    pool.run(
+                        _record_after,
+                        gate,
+                        order,
+                        label,
+                        priority=ExtractPriority.BULK,
+                    )
+                )
+                for label in ("a", "b")
+            ]
+            await asyncio.sleep(0.05)
+            assert (pool.state.capacity, pool._running) == (1, 1)
+
+            await _until(lambda: pool._running == 2)
+
+            assert pool.state.capacity == 2
+        finally:
+            gate.set()
+            await asyncio.gather(*jobs)
+            pool.shutdown(wait=False)
+
+    async def test_an_idle_pool_shrinks_back_to_its_floor(self) -> None:
+        pool = YtdlpPool(
+            max_workers=2,
+            min_workers=1,
+            idle_secs=0.05,
+            executor_factory=_thread_pool_factory(2),
+        )
+        gate, order = threading.Event(), []
+        try:
+            holder = asyncio.create_task(pool.run(_record_after, gate, order, "held"))
+            await _until(lambda: pool._running == 1)
+            await pool.run(_double, 1)  # grows to 2
+            gate.set()
+            await holder
+
+            await _until(lambda: pool.state.capacity == 1)
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_reaping_recycles_an_executor_holding_surplus_workers(self) -> None:
+        """The stdlib never lets an idle worker go, so shrinking capacity alone
+        would free no memory: the executor is retired and its replacement warmed to
+        the new capacity."""
+        built: list[MagicMock] = []
+
+        def factory() -> Executor:
+            executor = MagicMock(spec=ProcessPoolExecutor)
+            executor._processes = {101: object(), 102: object()}
+            built.append(executor)
+            return executor
+
+        pool = YtdlpPool(
+            max_workers=2, min_workers=1, idle_secs=60, executor_factory=factory
+        )
+        pool._acquire()
+        pool._capacity = 2  # grown earlier; nothing ran since
+
+        pool._reap()
+
+        try:
+            assert pool.state.capacity == 1
+            built[0].shutdown.assert_called_once_with(wait=False)
+            assert pool.state.recycled == 1
+            assert pool.state.generation == 2
+            assert built[1].submit.call_count == 1  # warmed to the new capacity
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_worker_over_the_rss_watermark_recycles_the_pool(self) -> None:
+        executor = MagicMock(spec=ProcessPoolExecutor)
+        executor._processes = {101: object()}
+        pool = YtdlpPool(worker_rss_mb=100, executor_factory=lambda: executor)
+        first = pool._acquire()
+        try:
+            with patch("src.ytdlp_pool._worker_rss_bytes", return_value=99 << 20):
+                pool._check_memory(first)
+            assert pool.state.recycled == 0
+
+            with patch("src.ytdlp_pool._worker_rss_bytes", return_value=101 << 20):
+                pool._check_memory(first)
+            assert pool.state.recycled == 1
+            first.shutdown.assert_called_once_with(wait=False)
+        finally:
+            pool.shutdown(wait=False)
+
+    async def test_a_recycle_lets_in_flight_work_finish(self) -> None:
+        """The point of recycling gracefully: a job already in the retired executor
+        completes normally — it never sees BrokenProcessPool, so heal-once is left
+        for workers that actually died."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate, order = threading.Event(), []
+        try:
+            job = asyncio.create_task(pool.run(_record_after, gate, order, "job"))
+            await _until(lambda: pool._running == 1)
+            old = pool._acquire()
+
+            pool._recycle(old, "test")
+            gate.set()
+
+            assert await job == "job"
+            assert pool._acquire() is not old
+            assert pool.state.recycled == 1
+        finally:
+            pool.shutdown(wait=False)
+
+    def test_worker_rss_is_read_from_proc(self) -> None:
+        rss = _worker_rss_bytes(os.getpid())
+        if not os.path.exists("/proc/self/status"):
+            assert rss is None
+            return
+        assert rss is not None and rss > 0
+        assert _worker_rss_bytes(2**22 + 12345) is None  # no such process
+
+
+class TestCancellation:
+    """Cancelling the task awaiting run() is the abort handle: it returns at once and
+    the job is stopped where it is. The board/signal half is unit-tested here against
+    a plain list; TestRealWorkerProcess runs it across a real boundary."""
+
+    async def test_cancelling_a_running_job_returns_at_once_but_holds_its_slot(
+        self,
+    ) -> None:
+        """A thread cannot be interrupted, so the seam shows the bookkeeping alone:
+        the caller is free immediately, while the slot stays taken until the job
+        really lets go — an abort must never let more jobs run than there are
+        workers."""
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate = threading.Event()
+        try:
+            job = asyncio.create_task(pool.run(_record_after, gate, [], "a"))
+            await _until(lambda: pool.state.running == 1)
+
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+            assert pool.state.running == 1
+
+            gate.set()
+            await _until(lambda: pool.state.running == 0)
+            assert await pool.run(_double, 21) == 42
+        finally:
+            gate.set()
+            pool.shutdown(wait=False)
+
+    def test_abort_signals_the_worker_that_claimed_the_job(self) -> None:
+        pool = YtdlpPool(executor_factory=_thread_pool_factory())
+        pool._abort_board = [0] * (3 * ytdlp_pool_module._ABORT_SLOTS)
+        slot = _slot(7)
+        pool._abort_board[slot : slot + 2] = [7, 4242]
+        with patch("src.ytdlp_pool.os.kill") as kill:
+            pool._abort(7)
+
+        assert pool._abort_board[slot + 2] == 7
+        kill.assert_called_once_with(4242, _ABORT_SIGNAL)
+
+    def test_abort_of_an_unclaimed_job_only_marks_the_board(self) -> None:
+        """Still in the executor's call queue — past future.cancel()'s reach, not
+        yet in a worker. The mark is what stops it (see the next test)."""
+        pool = YtdlpPool(executor_factory=_thread_pool_factory())
+        pool._abort_board = [0] * (3 * ytdlp_pool_module._ABORT_SLOTS)
+        with patch("src.ytdlp_pool.os.kill") as kill:
+            pool._abort(7)
+
+        assert pool._abort_board[_slot(7) + 2] == 7
+        kill.assert_not_called()
+
+    def test_abort_without_a_board_is_a_no_op(self) -> None:
+        pool = YtdlpPool(executor_factory=_thread_pool_factory())
+        with patch("src.ytdlp_pool.os.kill") as kill:
+            pool._abort(7)
+        kill.assert_not_called()
+
+    def test_a_job_aborted_before_it_starts_never_runs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        board = [0] * (3 * ytdlp_pool_module._ABORT_SLOTS)
+        board[_slot(7) + 2] = 7
+        monkeypatch.setattr(ytdlp_pool_module, "_abort_board", board)
+        fn = MagicMock()
+
+        with pytest.raises(JobAborted):
+            _call_with_context({}, 7, fn)
+
+        fn.assert_not_called()
+        assert ytdlp_pool_module._current_job == 0
+
+    def test_a_job_claims_its_slot_and_clears_it_from_current_on_exit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        board = [0] * (3 * ytdlp_pool_module._ABORT_SLOTS)
+        monkeypatch.setattr(ytdlp_pool_module, "_abort_board", board)
+
+        assert _call_with_context({}, 7, _double, 21) == 42
+
+        assert board[_slot(7) : _slot(7) + 2] == [7, os.getpid()]
+        assert ytdlp_pool_module._current_job == 0
+
+    def test_the_signal_interrupts_only_the_job_it_was_meant_for(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A job that finished just before the signal landed leaves its successor
+        running: that one must not be the casualty."""
+        board = [0] * (3 * ytdlp_pool_module._ABORT_SLOTS)
+        board[_slot(7) + 2] = 7
+        monkeypatch.setattr(ytdlp_pool_module, "_abort_board", board)
+
+        monkeypatch.setattr(ytdlp_pool_module, "_current_job", 8)
+        _on_abort_signal(0, None)  # job 8 was not aborted
+        monkeypatch.setattr(ytdlp_pool_module, "_current_job", 0)
+        _on_abort_signal(0, None)  # between jobs
+
+        monkeypatch.setattr(ytdlp_pool_module, "_current_job", 7)
+        with pytest.raises(JobAborted):
+            _on_abort_signal(0, None)
+
+    def test_job_aborted_escapes_the_picklable_error_net(self) -> None:
+        """yt-dlp and _picklable_call both catch Exception; an abort they caught
+        would keep extracting for nobody."""
+        assert not issubclass(JobAborted, Exception)
+        with pytest.raises(JobAborted):
+            _picklable_call(MagicMock(side_effect=JobAborted("stop")))
+
+
+class TestJobStats:
+    """What run() records per job: -debug's counts and percentiles on state.stats,
+    and the OTLP instruments, patched here with mocks to read what reached them."""
+
+    async def test_state_counts_jobs_by_outcome(self) -> None:
+        pool = YtdlpPool(max_workers=1, executor_factory=_thread_pool_factory(1))
+        gate = threading.Event()
+        try:
+            assert pool.state.stats == PoolStats()
+            await pool.run(_double, 1)
+            await pool.run(_double, 2)
+            with pytest.raises(ValueError):
+                await pool.run(MagicMock(side_effect=ValueError("boom")))
+            job = asyncio.create_task(pool.run(_record_after, gate, [], "a"))
+            await _until(lambda: pool.state.running == 1)
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+            stats = pool.state.stats
+            assert (stats.completed, stats.failed, stats.aborted) == (2, 1, 1)
+            assert stats.jobs == 4
+            # Three runs reached the window; the abort is counted but not timed.
+            assert len(pool._runs) == 3
+            assert len(pool._waits) == 4
+            assert stats.run_p50 is not None and stats.wait_p95 is not None
+        finally:
+            gate.set()
+            pool.shutdown(wait=False)
+
+    async def test_the_instruments_see_the_priority_profile_and_outcome(
+        self,
+    ) -> None:
+        pool = YtdlpPool(executor_factory=_thread_pool_factory())
+        with (
+            patch.object(ytdlp_pool_module, "_QUEUE_WAIT") as wait,
+            patch.object(ytdlp_pool_module, "_RUN_TIME") as run_time,
+            patch.object(ytdlp_pool_module, "_IN_FLIGHT") as in_flight,
+        ):
+            try:
+                await pool.run(
+                    _double, 1, priority=ExtractPriority.BULK, label="playlist"
+                )
+            finally:
+                pool.shutdown(wait=False)
+
+        attributes = {"priority": "bulk", "profile": "playlist"}
+        (seconds, recorded), _ = wait.record.call_args
+        assert seconds >= 0 and recorded == attributes
+        (_, recorded), _ = run_time.record.call_args
+        assert recorded == {**attributes, "outcome": "ok"}
+        assert [c.args[0] for c in in_flight.add.call_args_list] == [1, -1]
+
+    async def test_a_heal_is_counted_as_an_event(self) -> None:
+        pool = YtdlpPool(executor_factory=_thread_pool_factory())
+        fn = MagicMock(side_effect=[BrokenProcessPool("worker died"), {"ok": 1}])
+        with patch.object(ytdlp_pool_module, "_EVENTS") as events:
+            try:
+                await pool.run(fn, "u")
+            finally:
+                pool.shutdown(wait=False)
+
+        events.add.assert_called_once_with(1, {"event": "heal"})
+
+
 class TestReplace:
     def test_replace_ignores_a_stale_executor(self) -> None:
         """Two concurrent extractions can both hit BrokenProcessPool. Only the first
@@ -640,6 +1443,29 @@ class TestWorkerInit:
 
         assert "yt-dlp worker logging setup failed" in capsys.readouterr().err
 
+    def test_worker_init_installs_the_abort_handler_with_a_board(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        board = [0] * 3
+        monkeypatch.setattr(ytdlp_pool_module, "_abort_board", None)
+        with (
+            patch("src.ytdlp_pool.configure_worker_logging"),
+            patch("src.ytdlp_pool.signal.signal") as install,
+        ):
+            _worker_init(None, board)
+
+        install.assert_called_once_with(_ABORT_SIGNAL, _on_abort_signal)
+        assert ytdlp_pool_module._abort_board is board
+
+    def test_worker_init_without_a_board_leaves_signals_alone(self) -> None:
+        with (
+            patch("src.ytdlp_pool.configure_worker_logging"),
+            patch("src.ytdlp_pool.signal.signal") as install,
+        ):
+            _worker_init(None)
+
+        install.assert_not_called()
+
     def test_warmup_noop_returns_nothing(self) -> None:
         assert _warmup_noop() is None
 
@@ -653,9 +1479,50 @@ class TestRealWorkerProcess:
     a callable crossing a real boundary with a late submit refused; an
     ExtractionError surviving pickling with its fields and cause, which the seam can
     never exercise since it never pickles an exception; a worker log record reaching
-    a parent handler with worker_id and trace_id. Argument picklability stays with
+    a parent handler with worker_id and trace_id; a worker forked from the warm
+    forkserver template; a cancelled job interrupted in its worker without breaking
+    the pool. Argument picklability stays with
     TestProcessBoundaryContract."""
 
+    async def test_a_worker_is_forked_from_the_warm_template(self) -> None:
+        pool = YtdlpPool(max_workers=1)
+        try:
+            registry_imported, heap_frozen = await pool.run(
+                _worker_was_forked_warm, None
+            )
+        finally:
+            await pool.aclose()
+
+        if (
+            "forkserver"
+            not in ytdlp_pool_module.multiprocessing.get_all_start_methods()
+        ):
+            pytest.skip("spawn platform: workers start cold by design")
+        assert registry_imported and heap_frozen
+
+    async def test_a_cancelled_job_is_interrupted_and_its_worker_reused(self) -> None:
+        """The abort end to end: the only worker is stuck in a 30 s job, the caller
+        cancels, and the next job runs on that same worker within seconds — signalled,
+        not killed, so no BrokenProcessPool and no rebuild."""
+        pool = YtdlpPool(max_workers=1)
+        try:
+            worker_pid, _ = await pool.run(_double_in_worker, 1)
+            stuck = asyncio.create_task(pool.run(_sleep_in_worker, 30))
+            await _until(lambda: pool.state.running == 1)
+            await asyncio.sleep(0.2)  # let the worker claim the job
+
+            stuck.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await stuck
+            async with asyncio.timeout(10):
+                pid, result = await pool.run(_double_in_worker, 21)
+
+            assert result == 42
+            assert pid == worker_pid
+            assert pool.state.generation == 1
+        finally:
+            await pool.aclose()
+
     async def test_a_real_worker_process_runs_the_submitted_callable(self) -> None:
         pool = YtdlpPool(max_workers=1)
         try:
@@ -777,6 +1644,60 @@ class TestRealWorkerProcess:
         assert format(trace_id, "032x") in body, f"trace_id missing from: {body}"
 
 
+class TestForkserverPreload:
+    def test_the_forkserver_preloads_the_warm_template(self) -> None:
+        context = MagicMock(name="forkserver-context")
+        with (
+            patch(
+                "src.ytdlp_pool.multiprocessing.get_all_start_methods",
+                return_value=["fork", "spawn", "forkserver"],
+            ),
+            patch(
+                "src.ytdlp_pool.multiprocessing.get_context", return_value=context
+            ) as get_context,
+        ):
+            assert _mp_context() is context
+
+        get_context.assert_called_once_with("forkserver")
+        context.set_forkserver_preload.assert_called_once_with(
+            ["__main__", "src.ytdlp_preload"]
+        )
+
+    def test_spawn_where_there_is_no_forkserver(self) -> None:
+        with (
+            patch(
+                "src.ytdlp_pool.multiprocessing.get_all_start_methods",
+                return_value=["spawn"],
+            ),
+            patch("src.ytdlp_pool.multiprocessing.get_context") as get_context,
+        ):
+            _mp_context()
+
+        get_context.assert_called_once_with("spawn")
+        get_context.return_value.set_forkserver_preload.assert_not_called()
+
+    def test_the_template_imports_yt_dlp_loads_plugins_and_freezes(self) -> None:
+        """In a subprocess: importing the template here would freeze the test
+        process's own heap."""
+        probe = (
+            "import gc, sys, src.ytdlp_preload, yt_dlp.plugins as plugins;"
+            "print('src.youtube' in sys.modules,"
+            " 'yt_dlp.extractor.extractors' in sys.modules,"
+            " plugins.all_plugins_loaded.value, gc.get_freeze_count() > 0)"
+        )
+        done = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert done.returncode == 0, done.stderr
+        assert done.stdout.split() == ["True"] * 4
+        assert "preload failed" not in done.stderr
+
+
 class TestDefaults:
     def test_worker_count_defaults_from_the_environment(self) -> None:
         """YTDLP_POOL_WORKERS is read once at import; the constructor default carries
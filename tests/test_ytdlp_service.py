@@ -0,0 +1,323 @@
+"""Tests for src/ytdlp_service.py — the extraction pool as a shared local service.
+
+Both ends run in this process, over a real Unix socket: YtdlpService serves a
+thread-pool-backed YtdlpPool (the local stand-in for the daemon), or a fake whose
+run() records what reached it, and RemoteYtdlpPool submits to it exactly as
+src.youtube would. The jobs below are added to the service's _JOBS for the run (the
+`service_jobs` fixture); TestJobAllowlist covers the list itself. Only main() and its
+signal handling go unexercised."""
+
+import asyncio
+import shutil
+import socket
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+import src.ytdlp_service as ytdlp_service
+from src.ytdlp_pool import (
+    ExtractPriority,
+    PoolClosedError,
+    RemoteCallError,
+    YtdlpPool,
+    trace_carrier,
+)
+from src.ytdlp_service import (
+    RemoteYtdlpPool,
+    YtdlpService,
+    _job_name,
+    _remote_context,
+    _resolve_job,
+    _socket_path,
+    make_pool,
+)
+
+
+def _double(value: int) -> int:
+    return value * 2
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+class _Unpicklable(Exception):
+    def __reduce__(self) -> Any:
+        raise TypeError("not across a socket")
+
+
+def _fail_unpicklably() -> None:
+    raise _Unpicklable("boom")
+
+
+# Read at import, before service_jobs extends it for each test.
+_SHIPPED_JOBS = ytdlp_service._JOBS
+
+
+def _not_a_job() -> None:
+    raise AssertionError("the service ran a job it does not list")
+
+
+@pytest.fixture(autouse=True)
+def service_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    jobs = {_job_name(fn) for fn in (_double, _fail, _fail_unpicklably)}
+    monkeypatch.setattr(ytdlp_service, "_JOBS", ytdlp_service._JOBS | jobs)
+
+
+class _RecordingPool:
+    """Stands in for the service's YtdlpPool where what matters is what reached it.
+    run() parks on `release` so a test can act while the job is in flight."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def run(self, fn: Any, *args: Any, **scheduling: Any) -> Any:
+        self.calls.append({"args": args, "carrier": trace_carrier(), **scheduling})
+        self.started.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return fn(*args)
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    # Not tmp_path: a Unix socket path is capped at ~108 bytes, and pytest's
+    # per-test directories carry the test's name.
+    directory = tempfile.mkdtemp(prefix="ytdlp-")
+    yield str(Path(directory) / "s")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+async def _serve(pool: Any, address: str) -> YtdlpService:
+    service = YtdlpService(pool, address)
+    await service.start()
+    return service
+
+
+@pytest.fixture
+async def thread_service(socket_path: str) -> AsyncIterator[RemoteYtdlpPool]:
+    pool = YtdlpPool(
+        max_workers=2, executor_factory=lambda: ThreadPoolExecutor(max_workers=2)
+    )
+    service = await _serve(pool, socket_path)
+    yield RemoteYtdlpPool(socket_path)
+    await service.aclose()
+
+
+class TestRoundTrip:
+    async def test_a_job_runs_on_the_service_and_returns_its_result(
+        self, thread_service: RemoteYtdlpPool
+    ) -> None:
+        assert await thread_service.run(_double, 21) == 42
+
+    async def test_an_exception_is_re_raised_in_the_caller(
+        self, thread_service: RemoteYtdlpPool
+    ) -> None:
+        with pytest.raises(ValueError, match="Private video"):
+            await thread_service.run(_fail, "Private video")
+
+    async def test_an_unpicklable_exception_arrives_as_a_remote_call_error(
+        self, socket_path: str
+    ) -> None:
+        """Raised by the service's own pool.run, past the worker's pickling net:
+        it must still reach the caller as an error, not as a dropped connection."""
+        pool = _RecordingPool()
+        pool.release.set()
+        service = await _serve(pool, socket_path)
+        try:
+            with pytest.raises(RemoteCallError) as raised:
+                await RemoteYtdlpPool(socket_path).run(_fail_unpicklably)
+        finally:
+            await service.aclose()
+
+        assert raised.value.original_type == "_Unpicklable"
+
+    async def test_scheduling_arguments_reach_the_service_pool(
+        self, socket_path: str
+    ) -> None:
+        pool = _RecordingPool()
+        pool.release.set()
+        service = await _serve(pool, socket_path)
+        try:
+            await RemoteYtdlpPool(socket_path).run(
+                _double, 1, priority=ExtractPriority.BULK, guild_id=7, label="playlist"
+            )
+        finally:
+            await service.aclose()
+
+        (call,) = pool.calls
+        assert call["args"] == (1,)
+        assert call["priority"] is ExtractPriority.BULK
+        assert call["guild_id"] == 7
+        assert call["label"] == "playlist"
+
+    async def test_the_callers_trace_reaches_the_service_side_job(
+        self, socket_path: str
+    ) -> None:
+        """The service runs under the caller's trace, so its worker's log lines
+        carry the caller's trace_id exactly as an in-process worker's do."""
+        pool = _RecordingPool()
+        pool.release.set()
+        service = await _serve(pool, socket_path)
+        tracer = TracerProvider().get_tracer(__name__)
+        try:
+            with tracer.start_as_current_span("command.play") as span:
+                await RemoteYtdlpPool(socket_path).run(_double, 1)
+        finally:
+            await service.aclose()
+
+        trace_id = format(span.get_span_context().trace_id, "032x")
+        assert pool.calls[0]["carrier"]["trace_id"] == trace_id
+
+    def test_no_carrier_is_a_root(self) -> None:
+        assert _remote_context({}) is None
+
+    async def test_an_unsampled_callers_trace_stays_unsampled(
+        self, socket_path: str
+    ) -> None:
+        """The service must not record and export a trace the bot chose not to
+        sample: the caller's flags cross with its ids."""
+        pool = _RecordingPool()
+        pool.release.set()
+        service = await _serve(pool, socket_path)
+        tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer(__name__)
+        try:
+            with tracer.start_as_current_span("command.play"):
+                await RemoteYtdlpPool(socket_path).run(_double, 1)
+        finally:
+            await service.aclose()
+
+        carrier = pool.calls[0]["carrier"]
+        assert "trace_flags" in carrier
+        parent = _remote_context(carrier)
+        assert parent is not None
+        assert not trace.get_current_span(parent).get_span_context().trace_flags.sampled
+
+    def test_a_sampled_callers_trace_stays_sampled(self) -> None:
+        carrier = {"trace_id": "ab" * 16, "span_id": "cd" * 8, "trace_flags": "01"}
+        parent = _remote_context(carrier)
+        assert parent is not None
+        assert trace.get_current_span(parent).get_span_context().trace_flags.sampled
+
+
+class TestCancellation:
+    async def test_a_cancelled_caller_aborts_the_job_on_the_service(
+        self, socket_path: str
+    ) -> None:
+        pool = _RecordingPool()
+        service = await _serve(pool, socket_path)
+        remote = RemoteYtdlpPool(socket_path)
+        try:
+            job = asyncio.create_task(remote.run(_double, 1))
+            await pool.started.wait()
+            assert remote.state.running == 1
+
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+            for _ in range(100):
+                if pool.cancelled:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await service.aclose()
+
+        assert pool.cancelled
+        assert remote.state.running == 0
+
+
+class TestJobAllowlist:
+    async def test_an_unlisted_job_is_refused_before_the_pool(
+        self, socket_path: str
+    ) -> None:
+        pool = _RecordingPool()
+        pool.release.set()
+        service = await _serve(pool, socket_path)
+        try:
+            with pytest.raises(PermissionError, match="not a yt-dlp service job"):
+                await RemoteYtdlpPool(socket_path).run(_not_a_job)
+        finally:
+            await service.aclose()
+
+        assert pool.calls == []
+
+    def test_the_listed_jobs_are_the_extractions(self) -> None:
+        """The real list, not the fixture's: every name resolves, and a rename in
+        src.youtube fails here rather than refusing every job in production."""
+        from src.youtube import _ytdlp_extract, _ytdlp_extract_batch
+
+        assert {_resolve_job(name) for name in _SHIPPED_JOBS} == {
+            _ytdlp_extract,
+            _ytdlp_extract_batch,
+        }
+
+
+class TestAddress:
+    def test_a_unix_socket_path(self) -> None:
+        assert _socket_path("/run/ytdlp/ytdlp.sock") == "/run/ytdlp/ytdlp.sock"
+
+    @pytest.mark.parametrize(
+        "address", ["127.0.0.1:7420", "localhost:7420", "[::1]:7420", "ytdlp.sock"]
+    )
+    def test_anything_else_is_refused(self, address: str) -> None:
+        """A connection can run code as the service, so who may connect is left to
+        the socket file's permissions — a TCP port, even on loopback, has none."""
+        with pytest.raises(ValueError):
+            _socket_path(address)
+
+    async def test_a_stale_socket_file_is_replaced(self, socket_path: str) -> None:
+        """What a killed service leaves behind: bound, never unlinked."""
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(socket_path)
+        stale.close()
+
+        service = await _serve(_RecordingPool(), socket_path)
+        await service.aclose()
+
+
+class TestRemotePool:
+    async def test_a_closed_pool_refuses_work(self, socket_path: str) -> None:
+        remote = RemoteYtdlpPool(socket_path)
+        await remote.aclose()
+
+        with pytest.raises(PoolClosedError):
+            await remote.run(_double, 1)
+        assert remote.state.closed
+
+    async def test_an_unreachable_service_fails_the_job(self, socket_path: str) -> None:
+        with pytest.raises(OSError):
+            await RemoteYtdlpPool(socket_path).run(_double, 1)
+
+    def test_state_names_the_service(self, socket_path: str) -> None:
+        state = RemoteYtdlpPool(socket_path).state
+        assert state.service == socket_path
+        assert state.running == 0
+
+
+class TestMakePool:
+    def test_in_process_by_default(self) -> None:
+        with patch.object(ytdlp_service, "_SERVICE_ADDRESS", ""):
+            assert isinstance(make_pool(), YtdlpPool)
+
+    def test_remote_when_an_address_is_set(self) -> None:
+        with patch.object(ytdlp_service, "_SERVICE_ADDRESS", "/run/ytdlp/ytdlp.sock"):
+            pool = make_pool()
+        assert isinstance(pool, RemoteYtdlpPool)
+        assert pool.state.service == "/run/ytdlp/ytdlp.sock"